@@ -1,7 +1,14 @@
 from engine import App
-from env import APP_DIR
+from env import APP_DIR, SCRIPTS_DIR, scripts
 
-app = App("Inteligência Comercial", APP_DIR)
+app = App(
+  "Inteligência Comercial", 
+  APP_DIR, 
+  lazy=True, 
+  static_params_dependencies=[SCRIPTS_DIR],
+  hot_reload=True,
+  modules=[scripts],
+)
 
 if __name__ == "__main__":
   app.run()
\ No newline at end of file
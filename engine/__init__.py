@@ -1,11 +1,23 @@
+from engine.profiler import profiler, StartupProfiler
+from engine.log import get_logger, configure as configure_logging, ring_buffer, LogEntry, RingBuffer, SamplingFilter, StructuredFormatter
+from engine.batch import UpdateScheduler, schedule_update, batch
 from engine.router import *
 from engine.modules import Module, Modules
+from engine.jobs import Job, JobStatus, JobRunner
 from engine.route import *
 from engine.renderer import Renderer
+from engine.executor import BackgroundExecutor, CancellationToken, executor
+from engine.session import Session, SessionRegistry
+from engine.memo import MemoCache, static_params_cache
+from engine.page_cache import PageCache, PageCacheEntry
+from engine.reconcile import reconcile
+from engine.metrics import RenderEvent, RenderHooks, Metrics, metrics
 from engine.di import ServiceContainer, container
 from engine.component import *
 from engine.ui import *
 from engine.dataframe import *
+from engine.ingest import *
+from engine.export import *
 from engine.env import get_downloads_path, open_downloads, open_file_explorer
 from engine.interface import GenerateStaticParams
 from engine.scaffold import *
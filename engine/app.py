@@ -3,27 +3,196 @@ from engine.router.router import Router
 from engine.route.route import Route
 from engine.router.router_searchbar import RouterSearchbar
 from engine.route.route_generator import RouteGenerator
+from engine.route.route_manifest import RouteManifest
+from engine.modules import Modules
+from engine.watcher import FileWatcher
 from engine.renderer import Renderer
 from engine.cli import initialize_with_cli
+from engine.memo import static_params_cache
+from engine.profiler import profiler
+from engine.metrics import RenderEvent, metrics
+from typing import Callable
+import threading
+from engine.log import get_logger
+
+logger = get_logger(__name__)
 
 class App:
-  def __init__(self, name: str, app_path: Path) -> None:
+  def __init__(
+    self, 
+    name: str, 
+    app_path: Path, 
+    lazy: bool = False, 
+    warm_up: bool = True,
+    cache_dir: Path | None = None,
+    route_manifest: bool = True,
+    static_params_dependencies: list[Path] = [],
+    static_params_ttl: float | None = None,
+    host: str = "localhost",
+    port: int = 8080,
+    hot_reload: bool = False,
+    modules: list[Modules] = [],
+    metrics_export: Path | None = None,
+    page_cache_size: int = 16,
+  ) -> None:
+    """
+    Args:
+        name: Nome da aplicação
+        app_path: Diretório raiz das rotas (src/app)
+        lazy: Se True, page/layout/not_found só são importados no primeiro uso
+        warm_up: No modo lazy, pré-carrega as rotas restantes em background
+        cache_dir: Diretório de cache da engine (padrão: <app_path>/../.cache)
+        route_manifest: Se True, usa o manifesto de rotas para pular a varredura
+                        de diretórios inalterados
+        static_params_dependencies: Caminhos cujo mtime invalida os parâmetros
+                                    estáticos em cache (ex.: diretório de scripts)
+        static_params_ttl: Validade, em segundos, dos resultados memoizados de
+                           generate_static_params/generate_metadata; quando
+                           informada, as rotas expiradas (incluindo as que
+                           definem `revalidate` no page.py) são reavaliadas
+                           em background nesse intervalo
+        host: Endereço do servidor web (use "0.0.0.0" para servir a rede)
+        port: Porta do servidor web
+        hot_reload: Se True, observa app_path e os diretórios de modules e
+                    reimporta apenas os arquivos alterados, sem reiniciar
+        modules: Registros de scripts (Modules) atualizados pelo hot-reload
+        metrics_export: Arquivo onde as métricas de renderização são gravadas
+                        ao encerrar (.prom no formato Prometheus, demais em JSON)
+        page_cache_size: Páginas montadas mantidas por sessão para navegação
+                         instantânea entre páginas visitadas (0 desativa);
+                         páginas com `cache = False` no page.py não são guardadas
+    """
     self.name:str=name
     self.app_path:Path=app_path
+    self.lazy:bool=lazy
+    self.warm_up:bool=warm_up
+    self.cache_dir:Path=cache_dir or app_path.parent / ".cache"
+    self.route_manifest:bool=route_manifest
+    self.static_params_dependencies:list[Path]=static_params_dependencies
+    self.static_params_ttl:float|None=static_params_ttl
+    self.host:str=host
+    self.port:int=port
+    self.hot_reload:bool=hot_reload
+    self.modules:list[Modules]=modules
+    self.metrics_export:Path|None=metrics_export
+    self.page_cache_size:int=page_cache_size
     
-  def initialize_application(self):
+  def initialize_application(
+    self,
+    when_started: Callable[["App"], None] | None = None,
+    when_stopped: Callable[["App"], None] | None = None,
+    before_render: Callable[[RenderEvent], None] | None = None,
+    after_render: Callable[[RenderEvent], None] | None = None,
+  ):
+    with profiler.span("initialize_application", "app"):
+      self.initialize_routes()
+    
+    if before_render:
+      self.renderer.hooks.before_render.append(before_render)
+    if after_render:
+      self.renderer.hooks.after_render.append(after_render)
+    
+    if when_started:
+      when_started(self)
+    try:
+      # cada conexão recebe seu próprio Renderer/Router (ver engine.session)
+      self.renderer.run(self.router, host=self.host, port=self.port)
+    finally:
+      self.revalidate_stop.set()
+      if self.metrics_export:
+        try:
+          metrics.export(self.metrics_export)
+        except Exception:
+          logger.exception("Falha ao exportar métricas")
+      if when_stopped:
+        when_stopped(self)
+  
+  def initialize_routes(self):
+    """Cria renderer, tabela de rotas, router e os serviços de background."""
+    profiler.output_dir = self.cache_dir
+    static_params_cache.ttl = self.static_params_ttl
     searchbar = RouterSearchbar()
     
-    self.renderer:Renderer=Renderer(searchbar=searchbar)
+    self.renderer:Renderer=Renderer(searchbar=searchbar, page_cache_size=self.page_cache_size)
     
-    self.app_route:Route=Route(self.app_path, "/")
+    self.app_route:Route=Route(self.app_path, "/", lazy=self.lazy)
     
-    self.router_generator:RouteGenerator=RouteGenerator(self.app_route)
+    manifest = RouteManifest(
+      self.cache_dir / "routes.json", 
+      self.app_path, 
+      dependencies=self.static_params_dependencies,
+    ) if self.route_manifest else None
+    
+    self.router_generator:RouteGenerator=RouteGenerator(self.app_route, manifest=manifest)
     self.router:Router=Router(self.router_generator, self.renderer)
     
-    self.renderer.run(self.router)
+    if self.lazy and self.warm_up:
+      self.router_generator.warm_up(background=True)
+    
+    if self.hot_reload:
+      self.watcher:FileWatcher=FileWatcher(
+        [self.app_path, *(modules.dir for modules in self.modules)], 
+        on_change=self.reload,
+      )
+      self.watcher.start()
+    
+    self.revalidate_stop:threading.Event=threading.Event()
+    if self.static_params_ttl:
+      threading.Thread(target=self.revalidate_loop, name="static-params-revalidate", daemon=True).start()
+    
+  def reload(self, changed: list[Path]):
+    """
+    Aplica mudanças de arquivos sem reiniciar a aplicação:
+    - scripts alterados são reimportados em seus Modules;
+    - arquivos de src/app reconstroem apenas as rotas afetadas;
+    - parâmetros estáticos e o searchbar de cada sessão são atualizados.
+    """
+    app_path = self.app_path.absolute()
+    app_files = [path for path in changed if path.absolute().is_relative_to(app_path)]
+    
+    modules_changed = False
+    for modules in self.modules:
+      if any(path.absolute().is_relative_to(modules.dir.absolute()) for path in changed):
+        added, updated, removed = modules.refresh()
+        logger.info("hot-reload %s: +%d ~%d -%d", modules.dir.name, len(added), len(updated), len(removed))
+        modules_changed = modules_changed or bool(added or updated or removed)
+    
+    if app_files:
+      logger.info("hot-reload rotas: %s", [str(path) for path in app_files])
+      self.router_generator.refresh(app_files)
+    if modules_changed:
+      self.router_generator.refresh_static_params()
+    
+    if app_files or modules_changed:
+      # páginas guardadas foram montadas com o código anterior
+      self.invalidate_pages()
+      self.refresh_searchbars()
+  
+  def invalidate_pages(self, route: str | None = None):
+    """Descarta as páginas guardadas de uma rota (ou todas) em todas as sessões."""
+    for session in self.renderer.sessions:
+      session.renderer.page_cache.invalidate(route=route)
+  
+  def refresh_searchbars(self):
+    for session in self.renderer.sessions:
+      session.renderer.refresh_searchbar(session.router)
+  
+  def revalidate_loop(self):
+    """Reavalia periodicamente os parâmetros estáticos expirados."""
+    while not self.revalidate_stop.wait(self.static_params_ttl):
+      try:
+        if self.router_generator.revalidate_static_params():
+          self.refresh_searchbars()
+      except Exception:
+        logger.exception("Falha ao revalidar parâmetros estáticos")
     
-  def run(self):
+  def run(
+    self,
+    when_started: Callable[["App"], None] | None = None,
+    when_stopped: Callable[["App"], None] | None = None,
+    before_render: Callable[[RenderEvent], None] | None = None,
+    after_render: Callable[[RenderEvent], None] | None = None,
+  ):
     """
     Run the app with the given parameters.
     Args:
@@ -31,8 +200,14 @@ class App:
         when_stopped (callable, optional): Function to call when the app stops.
         before_render (callable, optional): Function to call before rendering.
         after_render (callable, optional): Function to call after rendering.
+    before_render/after_render receive the navigation's engine.metrics.RenderEvent.
     """
-    initialize_with_cli(self.initialize_application)
+    initialize_with_cli(lambda: self.initialize_application(
+      when_started=when_started,
+      when_stopped=when_stopped,
+      before_render=before_render,
+      after_render=after_render,
+    ))
     
     
 __all__ = ["App"]
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Módulo batch: agrupamento de atualizações de controles em um único envio.
+Cada control.update() é uma ida ao cliente pelo websocket; handlers que
+alteram mensagem, barra de progresso e containers em sequência pagavam
+várias idas por evento.
+
+- schedule_update(*controls): marca os controles para atualização; os
+  pedidos de um mesmo intervalo (tick) viram um único ctx.update(...).
+- batch(ctx): dentro do bloco os pedidos são acumulados e enviados juntos
+  na saída, sem esperar o tick.
+
+    with batch(ctx):
+        message.value = "Lendo..."
+        progress.visible = True
+        schedule_update(message, progress)
+    # um único envio aqui
+
+Controles cujo ancestral também foi marcado não são enviados de novo;
+controles que saíram da página são ignorados.
+"""
+from contextlib import contextmanager
+from weakref import WeakKeyDictionary
+import threading
+import flet as ft
+
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+# intervalo de agrupamento das atualizações fora de um batch (segundos)
+FRAME_INTERVAL = 1 / 30
+
+
+class UpdateScheduler:
+    """
+    Fila de controles a atualizar de uma página.
+
+    Args:
+        page: Página (ctx) dona dos controles
+        interval: Tempo máximo que uma atualização espera pelo próximo envio
+    """
+    def __init__(self, page: ft.Page, interval: float = FRAME_INTERVAL) -> None:
+        self.page: ft.Page = page
+        self.interval: float = interval
+        self._pending: dict[int, ft.Control] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._local = threading.local()
+        self.flushes: int = 0
+        self.requests: int = 0
+
+    @property
+    def batching(self) -> bool:
+        """Indica se a thread atual está dentro de um bloco batch()."""
+        return getattr(self._local, "depth", 0) > 0
+
+    def schedule(self, *controls: ft.Control) -> None:
+        with self._lock:
+            for control in controls:
+                self._pending[id(control)] = control
+            self.requests += len(controls)
+            if self.batching or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _covered(self, control: ft.Control, pending: dict[int, ft.Control]) -> bool:
+        parent = control.parent
+        while parent is not None:
+            if id(parent) in pending:
+                return True
+            parent = parent.parent
+        return False
+
+    def flush(self) -> int:
+        """Envia os controles pendentes em um único update. Retorna quantos foram enviados."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        if id(self.page) in pending:
+            controls = [self.page]
+        else:
+            mounted = {key: control for key, control in pending.items() if control.page is not None}
+            controls = [control for control in mounted.values() if not self._covered(control, mounted)]
+        if not controls:
+            return 0
+        try:
+            self.page.update(*controls)
+        except Exception:
+            logger.exception("Falha ao enviar %d atualização(ões) agrupada(s)", len(controls))
+            return 0
+        self.flushes += 1
+        return len(controls)
+
+    @contextmanager
+    def batch(self):
+        """Acumula as atualizações da thread atual e envia tudo na saída do bloco."""
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            yield self
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                self.flush()
+
+
+_schedulers: "WeakKeyDictionary[ft.Page, UpdateScheduler]" = WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def scheduler_for(page: ft.Page) -> UpdateScheduler:
+    """UpdateScheduler da página (um por sessão)."""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(page)
+        if scheduler is None:
+            scheduler = _schedulers[page] = UpdateScheduler(page)
+        return scheduler
+
+
+def schedule_update(*controls: ft.Control) -> None:
+    """
+    Pede a atualização dos controles no próximo envio agrupado da página.
+    Controles ainda não adicionados a uma página são ignorados.
+    """
+    by_page: dict[int, tuple[ft.Page, list[ft.Control]]] = {}
+    for control in controls:
+        page = control if isinstance(control, ft.Page) else control.page
+        if page is None:
+            continue
+        by_page.setdefault(id(page), (page, []))[1].append(control)
+    for page, page_controls in by_page.values():
+        scheduler_for(page).schedule(*page_controls)
+
+
+@contextmanager
+def batch(page: ft.Page):
+    """Bloco cujas atualizações agendadas são enviadas juntas na saída."""
+    with scheduler_for(page).batch() as scheduler:
+        yield scheduler
+
+
+__all__ = ["UpdateScheduler", "scheduler_for", "schedule_update", "batch", "FRAME_INTERVAL"]
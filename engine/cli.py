@@ -2,6 +2,7 @@ import sys
 import argparse
 from pathlib import Path
 from engine.scaffold import Scaffold
+from engine.profiler import profiler, FLAG as PROFILE_STARTUP_FLAG
 
 class CommandArg:
     def __init__(self, name: str, help: str):
@@ -69,6 +70,15 @@ def run_cli():
         parser.print_help()
 
 def initialize_with_cli(app: callable):
+    """
+    Executa o comando `new` (scaffolding) ou inicia a aplicação.
+    Com --profile-startup a inicialização é medida até o primeiro frame
+    (ver engine.profiler); o profiler já é ativado na importação de engine
+    para incluir os imports de env.py e dos scripts.
+    """
+    if PROFILE_STARTUP_FLAG in sys.argv:
+        sys.argv.remove(PROFILE_STARTUP_FLAG)
+        profiler.enable()
     if len(sys.argv) > 1 and sys.argv[1] == "new":
         # Remove o primeiro argumento para passar os demais para o CLI
         sys.argv.pop(1)
@@ -2,19 +2,26 @@
 Módulo component: define classe base Component para composição de controles UI.
 Component encapsula controles originais em um Column e fornece método de refresh.
 """
+from typing import Callable
 # importa flet para tipagem de controles e atualização de UI
 import flet as ft
-# importa sleep para simular atraso de carregamento
-from time import sleep
+# atualizações agrupadas em um único envio por tick
+from engine.batch import schedule_update
 
 class Component:
     """
     Classe base para componentes compostos de múltiplos controles.
     Armazena controles originais e fornece wrapper em ft.Column.
+
+    Args:
+        *control: Controles iniciais do componente
+        reload: Função que recarrega os dados e devolve os novos controles;
+            sem ela, refresh() repõe os controles originais
     """
-    def __init__(self, *control: list[ft.Control]):
+    def __init__(self, *control: list[ft.Control], reload: Callable[[], list[ft.Control]] | None = None):
         # armazena controles originais para possível recarregamento
         self.origin = [*control]
+        self.reload = reload
         # cria coluna que agrupa os controles
         self.wrapper = ft.Column(control)
 
@@ -27,27 +34,14 @@ class Component:
 
     def refresh(self, ctx: ft.Page):
         """
-        Recarrega os controles simulando delay.
-        1. Limpa controles atuais.
-        2. Atualiza UI.
-        3. Aguarda 0.2s.
-        4. Repõe controles originais.
-        5. Atualiza UI novamente.
+        Recarrega os controles.
+        1. Obtém os controles novos de reload() (ou os originais).
+        2. Substitui os controles do wrapper.
+        3. Agenda uma única atualização do wrapper (sem ctx.update() da página inteira).
         """
-
-        # remove todos os controles do wrapper
-        self.wrapper.controls.clear()
-        # notifica Flet para atualizar a UI
-        ctx.update()
-
-        # pausa para simular operação de IO ou processamento
-        sleep(0.2)
-
-        # limpa novamente (caso necessário) e restaura controles originais
-        self.wrapper.controls.clear()
-        self.wrapper.controls.extend(self.origin)
-        # notifica Flet para renderizar a lista restaurada
-        ctx.update()
+        controls = self.reload() if self.reload is not None else self.origin
+        self.wrapper.controls = [*controls]
+        schedule_update(self.wrapper)
 
 
-__all__ = ["Component"]
\ No newline at end of file
+__all__ = ["Component"]
@@ -1,32 +1,172 @@
+import time
+from typing import Callable
 import polars as pl
 
-def join(source_df: pl.DataFrame, target_df: pl.DataFrame, keys: list[str], how: str = "inner") -> pl.DataFrame:
+Frame = pl.DataFrame | pl.LazyFrame
+
+
+class JoinStats:
+  """
+  Estatísticas de um join.
+  source_rows/target_rows: linhas de cada lado
+  invalid_keys: linhas da origem cuja chave ficou nula após a normalização
+  matched_rows: linhas da origem com ao menos um correspondente no destino
+  result_rows: linhas do resultado
+  elapsed: tempo total em segundos
+  """
+  def __init__(self, source_rows: int, target_rows: int, invalid_keys: int, matched_rows: int, result_rows: int, elapsed: float) -> None:
+    self.source_rows: int = source_rows
+    self.target_rows: int = target_rows
+    self.invalid_keys: int = invalid_keys
+    self.matched_rows: int = matched_rows
+    self.result_rows: int = result_rows
+    self.elapsed: float = elapsed
+
+  @property
+  def unmatched_rows(self) -> int:
+    return self.source_rows - self.matched_rows
+
+  @property
+  def match_rate(self) -> float:
+    return self.matched_rows / self.source_rows if self.source_rows else 0.0
+
+  def describe(self) -> str:
+    return (
+      f"{self.matched_rows} de {self.source_rows} linhas encontradas ({self.match_rate:.1%}), "
+      f"{self.invalid_keys} chaves inválidas, {self.result_rows} linhas no resultado em {self.elapsed:.2f}s"
+    )
+
+  def __repr__(self) -> str:
+    return f"JoinStats({self.describe()})"
+
+
+def to_number(column: pl.Expr, source_dtype: pl.DataType, dtype: pl.DataType = pl.UInt64) -> pl.Expr:
+  """
+  Converte a coluna (do tipo source_dtype) para o tipo inteiro dtype.
+  Textos perdem a pontuação ("12.345.678/0001-90") e o sufixo ".0" de floats
+  salvos como texto ("12345678000195.0"); valores impossíveis de converter
+  viram nulos.
+  """
+  if source_dtype.is_integer():
+    return column.cast(dtype, strict=False)
+  if source_dtype.is_float():
+    # planilhas costumam trazer CNPJs numéricos como float
+    return column.cast(pl.Int64, strict=False).cast(dtype, strict=False)
+  digits = column.cast(pl.String).str.strip_chars().str.replace(r"\.0+$", "").str.replace_all(r"\D", "")
+  return pl.when(digits.str.len_bytes() > 0).then(digits).cast(dtype, strict=False)
+
+
+def normalize_key(
+  frame: Frame,
+  key: str,
+  dtype: pl.DataType = pl.UInt64,
+  validate: Callable[[pl.Expr], pl.Expr] | None = None,
+) -> pl.Expr:
+  """
+  Retorna a expressão que converte a coluna key para o tipo de chave do join.
+  Para chaves inteiras (padrão), a coluna passa por to_number; com validate,
+  chaves reprovadas (ex.: dígitos verificadores de CNPJ/CPF) viram nulas.
+  Com dtype=pl.String a coluna é apenas convertida para texto.
+
+  Args:
+    frame (pl.DataFrame | pl.LazyFrame): Frame que contém a coluna (usado só para ler o schema).
+    key (str): Nome da coluna.
+    dtype (pl.DataType): Tipo final da chave (padrão: pl.UInt64).
+    validate (Callable | None): Recebe a chave convertida e devolve a expressão booleana de validade.
+  """
+  column = pl.col(key)
+  if dtype == pl.String:
+    return column.cast(pl.String)
+
+  number = to_number(column, frame.lazy().collect_schema()[key], dtype)
+  if validate is not None:
+    number = pl.when(validate(number)).then(number)
+  return number.alias(key)
+
+
+def join_lazy(
+  source_df: Frame,
+  target_df: Frame,
+  keys: list[str],
+  how: str = "inner",
+  key_dtype: pl.DataType | None = pl.String,
+  normalizer: Callable[[pl.LazyFrame, str, pl.DataType], pl.Expr] = normalize_key,
+) -> pl.LazyFrame:
+  """
+  Monta o plano lazy do join, com as chaves normalizadas uma única vez em cada lado.
+
+  Args:
+    source_df (pl.DataFrame | pl.LazyFrame): Frame de origem.
+    target_df (pl.DataFrame | pl.LazyFrame): Frame de destino.
+    keys (list[str]): Lista de colunas usadas como chave para o join.
+    how (str): Tipo de join (padrão: "inner").
+    key_dtype (pl.DataType | None): Tipo comum das chaves (padrão: pl.String); None mantém as colunas como estão.
+    normalizer (Callable): Função (frame, chave, tipo) -> expressão de normalização.
+
+  Returns:
+      pl.LazyFrame: Plano do join, ainda não executado.
   """
-  Realiza o join entre dois DataFrames do Polars com base nas chaves fornecidas.
+  source, target = _normalized(source_df, target_df, keys, key_dtype, normalizer)
+  return source.join(target, on=keys, how=how)
+
+
+def _normalized(source_df: Frame, target_df: Frame, keys: list[str], key_dtype: pl.DataType | None, normalizer) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+  source, target = source_df.lazy(), target_df.lazy()
+  if key_dtype is not None:
+    source = source.with_columns([normalizer(source, key, key_dtype) for key in keys])
+    target = target.with_columns([normalizer(target, key, key_dtype) for key in keys])
+  return source, target
+
+
+def join(
+  source_df: Frame,
+  target_df: Frame,
+  keys: list[str],
+  how: str = "inner",
+  key_dtype: pl.DataType | None = pl.String,
+  normalizer: Callable[[pl.LazyFrame, str, pl.DataType], pl.Expr] = normalize_key,
+  streaming: bool = True,
+  on_stats: Callable[[JoinStats], None] | None = None,
+) -> pl.DataFrame:
+  """
+  Realiza o join entre dois DataFrames/LazyFrames do Polars com base nas chaves fornecidas.
+  O plano é executado pelo engine de streaming do Polars, que processa os
+  frames em lotes em vez de carregá-los inteiros na memória.
 
   Args:
-    source_df (pl.DataFrame): DataFrame de origem.
-    target_df (pl.DataFrame): DataFrame de destino.
+    source_df (pl.DataFrame | pl.LazyFrame): Frame de origem.
+    target_df (pl.DataFrame | pl.LazyFrame): Frame de destino.
     keys (list[str]): Lista de colunas usadas como chave para o join.
-    how (str): Tipo de join a ser realizado. Pode ser "inner", "left", "outer", etc. (padrão: "inner").
+    how (str): Tipo de join a ser realizado. Pode ser "inner", "left", "full", etc. (padrão: "inner").
+    key_dtype (pl.DataType | None): Tipo comum das chaves (padrão: pl.String; pl.UInt64 para chaves numéricas, ver normalize_key).
+    normalizer (Callable): Função (frame, chave, tipo) -> expressão de normalização.
+    streaming (bool): Executa com o engine de streaming (padrão: True).
+    on_stats (Callable | None): Recebe as JoinStats; as contagens são calculadas
+      no mesmo collect do join, reaproveitando as leituras.
 
   Returns:
       pl.DataFrame: DataFrame resultante do join.
   """
-  try:
-      # Padroniza os tipos de dados das chaves de join
-    for key in keys:
-      if key in source_df.columns:
-        source_df = source_df.cast({key: pl.String})
-      if key in target_df.columns:
-        target_df = target_df.cast({key: pl.String})
-
-    # Realiza o join com base nas chaves e no tipo especificado
-    result_df = source_df.join(target_df, on=keys, how=how)
-    return result_df
-  except Exception as e:
-    print(f"Erro ao realizar o join: {e}")
-    return source_df  # Retorna um DataFrame vazio em caso de erro
-  
-
-__all__ = ["join"]
\ No newline at end of file
+  started = time.perf_counter()
+  engine = "streaming" if streaming else "auto"
+  source, target = _normalized(source_df, target_df, keys, key_dtype, normalizer)
+  joined = source.join(target, on=keys, how=how)
+  if on_stats is None:
+    return joined.collect(engine=engine)
+
+  result, counts = pl.collect_all([
+    joined,
+    pl.concat([
+      source.select(pl.len().alias("count")),
+      target.select(pl.len().alias("count")),
+      source.filter(pl.any_horizontal(pl.col(keys).is_null())).select(pl.len().alias("count")),
+      source.join(target.select(keys).unique(), on=keys, how="semi").select(pl.len().alias("count")),
+    ]),
+  ], engine=engine)
+
+  source_rows, target_rows, invalid_keys, matched_rows = counts["count"].to_list()
+  on_stats(JoinStats(source_rows, target_rows, invalid_keys, matched_rows, result.height, time.perf_counter() - started))
+  return result
+
+
+__all__ = ["join", "join_lazy", "normalize_key", "to_number", "JoinStats"]
@@ -0,0 +1,102 @@
+"""
+Módulo executor: execução de trabalho bloqueante fora da thread da UI.
+- CancellationToken: sinaliza que o resultado de uma tarefa não interessa mais
+  (ex.: o usuário navegou para outra página).
+- BackgroundExecutor: pool de threads que executa funções e entrega o resultado
+  a callbacks, descartando-o se o token foi cancelado.
+
+Threads (e não processos) são usadas porque páginas criam controles Flet e
+acessam o ctx, que não podem ser serializados para outro processo; o Polars
+libera o GIL nas operações pesadas, então leituras e joins rodam em paralelo.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+import threading
+
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class CancellationToken:
+    """Flag de cancelamento compartilhada entre quem agenda e quem executa."""
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class BackgroundExecutor:
+    """
+    Pool de threads para renderização de páginas e carregamento de dados.
+
+    Uso básico:
+
+        executor.submit(
+            load_base, max_cnpj,
+            on_done=lambda df: ...,
+            on_error=lambda e: ...,
+            token=props.token,
+        )
+    """
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="engine-worker")
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        token: CancellationToken | None = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Agenda fn(*args, **kwargs) no pool.
+        Os callbacks rodam na thread de trabalho e não são chamados se o
+        token tiver sido cancelado. Falhas dentro dos callbacks, e de fn
+        quando não há on_error, são registradas no log (ninguém lê o Future
+        retornado).
+        """
+        def callback(handler: Callable[[Any], None], value: Any) -> None:
+            try:
+                handler(value)
+            except Exception:
+                logger.exception("Falha no callback %s de %s", getattr(handler, "__name__", handler), getattr(fn, "__name__", fn))
+
+        def run():
+            if token and token.cancelled:
+                return None
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if token and token.cancelled:
+                    return None
+                if on_error:
+                    callback(on_error, e)
+                    return None
+                # sem on_error ninguém veria a falha: o Future retornado não é lido
+                logger.exception("Falha em %s", getattr(fn, "__name__", fn))
+                raise
+            if token and token.cancelled:
+                return None
+            if on_done:
+                callback(on_done, result)
+            return result
+
+        return self._pool.submit(run)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Instância global do executor
+executor = BackgroundExecutor()
+
+
+__all__ = ["CancellationToken", "BackgroundExecutor", "executor"]
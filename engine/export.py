@@ -0,0 +1,188 @@
+"""
+Módulo export: gravação de DataFrames/LazyFrames em XLSX, CSV ou Parquet.
+- XLSX: escrito em lotes pelo xlsxwriter em modo constant_memory (cada linha
+  vai para o disco assim que é escrita); resultados maiores que o limite de
+  linhas do Excel continuam em novas abas.
+- CSV/Parquet: gravados pelo engine de streaming do Polars (sink_*).
+Os arquivos são escritos em um temporário e movidos para o destino no fim,
+de modo que um export interrompido não deixa arquivo pela metade.
+"""
+from pathlib import Path
+from typing import Callable
+import os
+
+import polars as pl
+
+from engine.executor import CancellationToken
+
+# limite de linhas de uma aba do Excel (incluindo o cabeçalho)
+EXCEL_MAX_ROWS = 1_048_576
+
+
+class ExportFormat:
+    """Formatos de saída suportados (também usados como extensão do arquivo)."""
+    XLSX = "xlsx"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+    ALL = [XLSX, CSV, PARQUET]
+
+
+class ExportCancelled(Exception):
+    """O export foi interrompido pelo CancellationToken."""
+
+
+class ExportProgress:
+    """
+    Progresso de um export.
+    rows: linhas gravadas até agora
+    total_rows: total de linhas a gravar, quando conhecido
+    sheets: abas criadas (XLSX)
+    """
+    def __init__(self, path: Path, total_rows: int | None = None) -> None:
+        self.path: Path = path
+        self.rows: int = 0
+        self.total_rows: int | None = total_rows
+        self.sheets: int = 0
+        self.done: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        """Fração concluída entre 0 e 1, ou None se não puder ser estimada."""
+        if self.done:
+            return 1.0
+        if self.total_rows:
+            return min(self.rows / self.total_rows, 1.0)
+        return None
+
+    def describe(self) -> str:
+        if self.done and not self.rows:
+            return f"{self.path.name}: gravado"
+        text = f"{self.path.name}: {self.rows:,}".replace(",", ".")
+        if self.total_rows is not None and not self.done:
+            text += f" de {self.total_rows:,}".replace(",", ".")
+        text += " linhas"
+        if self.sheets > 1:
+            text += f" em {self.sheets} abas"
+        return text
+
+
+def _check(token: CancellationToken | None) -> None:
+    if token and token.cancelled:
+        raise ExportCancelled()
+
+
+def _known_height(frame: pl.DataFrame | pl.LazyFrame) -> int | None:
+    """Total de linhas sem executar o plano (só conhecido para DataFrames)."""
+    return frame.height if isinstance(frame, pl.DataFrame) else None
+
+
+def write_xlsx(
+    frame: pl.DataFrame | pl.LazyFrame,
+    path: Path,
+    on_progress: Callable[[ExportProgress], None] | None = None,
+    token: CancellationToken | None = None,
+    batch_size: int = 50_000,
+    sheet_name: str = "dados",
+) -> Path:
+    """
+    Grava frame em XLSX com memória constante.
+    Cada aba recebe o cabeçalho e até EXCEL_MAX_ROWS - 1 linhas; as
+    seguintes se chamam "<sheet_name> (2)", "<sheet_name> (3)", ...
+    """
+    import xlsxwriter
+
+    lazy = frame.lazy()
+    columns = lazy.collect_schema().names()
+    progress = ExportProgress(path, _known_height(frame))
+    rows_per_sheet = EXCEL_MAX_ROWS - 1
+
+    tmp = path.with_name(f".{path.name}.tmp")
+    workbook = xlsxwriter.Workbook(tmp, {"constant_memory": True})
+    try:
+        worksheet, row = None, rows_per_sheet
+        batches = [frame] if isinstance(frame, pl.DataFrame) else lazy.collect_batches(chunk_size=batch_size, engine="streaming")
+        for batch in batches:
+            for offset in range(0, batch.height, batch_size):
+                _check(token)
+                for values in batch.slice(offset, batch_size).iter_rows():
+                    if row == rows_per_sheet:
+                        progress.sheets += 1
+                        name = sheet_name if progress.sheets == 1 else f"{sheet_name} ({progress.sheets})"
+                        worksheet = workbook.add_worksheet(name)
+                        worksheet.write_row(0, 0, columns)
+                        row = 0
+                    row += 1
+                    worksheet.write_row(row, 0, values)
+                progress.rows += min(batch_size, batch.height - offset)
+                if on_progress:
+                    on_progress(progress)
+        if worksheet is None:
+            workbook.add_worksheet(sheet_name).write_row(0, 0, columns)
+            progress.sheets = 1
+        workbook.close()
+    except BaseException:
+        # fecha para liberar os arquivos temporários do constant_memory
+        try:
+            workbook.close()
+        except Exception:
+            pass
+        tmp.unlink(missing_ok=True)
+        raise
+
+    os.replace(tmp, path)
+    progress.done = True
+    if on_progress:
+        on_progress(progress)
+    return path
+
+
+def export_frame(
+    frame: pl.DataFrame | pl.LazyFrame,
+    path: Path,
+    format: str | None = None,
+    on_progress: Callable[[ExportProgress], None] | None = None,
+    token: CancellationToken | None = None,
+    batch_size: int = 50_000,
+) -> Path:
+    """
+    Grava frame em path no formato indicado (ou deduzido da extensão).
+    Lança ValueError para formatos não suportados e ExportCancelled se o
+    token for cancelado durante a gravação.
+
+    Returns:
+        Path: Arquivo gravado.
+    """
+    format = (format or path.suffix.lstrip(".")).lower()
+    if format not in ExportFormat.ALL:
+        raise ValueError(f"Formato de exportação não suportado: {format}")
+    if path.suffix.lower() != f".{format}":
+        path = path.with_suffix(f".{format}") if path.suffix.lstrip(".").lower() in ExportFormat.ALL else path.with_name(f"{path.name}.{format}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if format == ExportFormat.XLSX:
+        return write_xlsx(frame, path, on_progress=on_progress, token=token, batch_size=batch_size)
+
+    _check(token)
+    progress = ExportProgress(path, _known_height(frame))
+    if on_progress:
+        on_progress(progress)
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        if format == ExportFormat.CSV:
+            frame.lazy().sink_csv(tmp, engine="streaming")
+        else:
+            frame.lazy().sink_parquet(tmp, engine="streaming")
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
+
+    progress.rows = progress.total_rows or 0
+    progress.done = True
+    if on_progress:
+        on_progress(progress)
+    return path
+
+
+__all__ = ["ExportFormat", "ExportProgress", "ExportCancelled", "EXCEL_MAX_ROWS", "write_xlsx", "export_frame"]
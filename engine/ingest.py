@@ -0,0 +1,214 @@
+"""
+Módulo ingest: leitura incremental de arquivos CSV/Excel como LazyFrame.
+Arquivos enviados pelos usuários chegam a milhões de linhas; em vez de
+carregar tudo com read_csv/read_excel, este módulo:
+- CSV: lê o arquivo em lotes pelo engine de streaming do Polars;
+- Excel: lê a planilha em lotes de linhas.
+Nos dois casos cada lote é gravado em Arrow IPC num diretório temporário e o
+resultado é um scan sobre esses arquivos, então o arquivo original é lido uma
+única vez. O progresso (linhas lidas) é entregue a um callback para a UI.
+"""
+from pathlib import Path
+from typing import Callable, Iterable
+import polars as pl
+
+from engine.executor import CancellationToken
+
+CSV_EXTENSIONS = (".csv",)
+EXCEL_EXTENSIONS = (".xlsx", ".xls")
+
+
+class IngestCancelled(Exception):
+    """A leitura foi interrompida pelo CancellationToken."""
+
+
+class IngestProgress:
+    """
+    Progresso de uma leitura.
+    rows: linhas lidas até agora
+    total_bytes: tamanho do arquivo
+    total_rows: total de linhas estimado, quando conhecido
+    """
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self.rows: int = 0
+        self.total_bytes: int = path.stat().st_size
+        self.total_rows: int | None = None
+        self.done: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        """Fração concluída entre 0 e 1, ou None se não puder ser estimada."""
+        if self.done:
+            return 1.0
+        if self.total_rows:
+            return min(self.rows / self.total_rows, 1.0)
+        return None
+
+    def describe(self) -> str:
+        text = f"{self.path.name}: {self.rows:,}".replace(",", ".")
+        if self.total_rows and not self.done:
+            text += f" de ~{max(self.total_rows, self.rows):,}".replace(",", ".")
+        return text + f" linhas ({self.total_bytes / 2**20:.1f} MB)"
+
+
+def _check(token: CancellationToken | None) -> None:
+    if token and token.cancelled:
+        raise IngestCancelled()
+
+
+def _estimate_rows(path: Path, sample_size: int = 2**20) -> int:
+    """
+    Estima as linhas de dados de um CSV pelas quebras de linha do primeiro
+    bloco de sample_size bytes (exato quando o arquivo cabe no bloco).
+    """
+    total_bytes = path.stat().st_size
+    with open(path, "rb") as file:
+        sample = file.read(sample_size)
+    if not sample:
+        return 0
+    newlines = sample.count(b"\n")
+    if len(sample) < total_bytes:
+        newlines = round(newlines * total_bytes / len(sample))
+    # desconta a linha de cabeçalho
+    return max(newlines - 1, 0)
+
+
+def _spill(
+    batches: Iterable[pl.DataFrame],
+    path: Path,
+    spill_dir: Path,
+    progress: IngestProgress,
+    on_progress: Callable[[IngestProgress], None] | None,
+    token: CancellationToken | None,
+) -> pl.LazyFrame:
+    """
+    Grava cada lote em spill_dir como Arrow IPC, informando o progresso, e
+    retorna um LazyFrame sobre os lotes.
+    Os tipos de cada lote são unificados no scan (ex.: uma coluna inteira em
+    um lote e texto em outro vira texto).
+    """
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    parts: list[Path] = []
+
+    for batch in batches:
+        _check(token)
+        part = spill_dir / f"{path.stem}.{len(parts):05d}.arrow"
+        batch.write_ipc(part, compression="uncompressed")
+        parts.append(part)
+        progress.rows += batch.height
+        if on_progress:
+            on_progress(progress)
+
+    progress.done = True
+    if on_progress:
+        on_progress(progress)
+    if not parts:
+        return pl.LazyFrame()
+    return pl.concat([pl.scan_ipc(part) for part in parts], how="vertical_relaxed")
+
+
+def scan_csv(
+    path: Path,
+    spill_dir: Path,
+    on_progress: Callable[[IngestProgress], None] | None = None,
+    token: CancellationToken | None = None,
+    batch_size: int = 50_000,
+) -> pl.LazyFrame:
+    """
+    Lê um CSV em lotes de batch_size linhas pelo engine de streaming,
+    gravando cada lote em spill_dir como Arrow IPC, e retorna um LazyFrame
+    sobre os lotes. O progresso é o da leitura real: linhas já convertidas,
+    sobre o total estimado por _estimate_rows.
+    """
+    progress = IngestProgress(path)
+    progress.total_rows = _estimate_rows(path)
+
+    frame = pl.scan_csv(path, truncate_ragged_lines=True, infer_schema_length=1000)
+    # valida o cabeçalho antes de iniciar a leitura
+    frame.collect_schema()
+    return _spill(frame.collect_batches(chunk_size=batch_size, lazy=True), path, spill_dir, progress, on_progress, token)
+
+
+def _excel_batches(path: Path, batch_size: int, progress: IngestProgress):
+    """
+    Gera DataFrames de até batch_size linhas da primeira planilha.
+    Arquivos .xlsx são lidos em streaming pelo openpyxl (modo read_only),
+    quando disponível; os demais formatos (e .xlsx sem openpyxl) são lidos de
+    uma vez pelo calamine e fatiados, só mantendo o formato de saída.
+    """
+    if path.suffix.lower() == ".xlsx":
+        try:
+            import openpyxl
+        except ImportError:
+            openpyxl = None
+
+        if openpyxl is not None:
+            workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+            try:
+                sheet = workbook.worksheets[0]
+                if sheet.max_row:
+                    progress.total_rows = max(sheet.max_row - 1, 0)
+                rows = sheet.iter_rows(values_only=True)
+                header = next(rows, None)
+                if header is None:
+                    return
+                columns = [
+                    str(name) if name is not None else f"__UNNAMED__{i}"
+                    for i, name in enumerate(header)
+                ]
+                batch: list[tuple] = []
+                for row in rows:
+                    batch.append(row[:len(columns)])
+                    if len(batch) == batch_size:
+                        yield pl.DataFrame(batch, schema=columns, orient="row", infer_schema_length=None, strict=False)
+                        batch = []
+                if batch:
+                    yield pl.DataFrame(batch, schema=columns, orient="row", infer_schema_length=None, strict=False)
+            finally:
+                workbook.close()
+            return
+
+    frame = pl.read_excel(path)
+    progress.total_rows = frame.height
+    for offset in range(0, frame.height, batch_size):
+        yield frame.slice(offset, batch_size)
+
+
+def scan_excel(
+    path: Path,
+    spill_dir: Path,
+    on_progress: Callable[[IngestProgress], None] | None = None,
+    token: CancellationToken | None = None,
+    batch_size: int = 50_000,
+) -> pl.LazyFrame:
+    """
+    Lê a primeira planilha em lotes, gravando cada lote em spill_dir como
+    Arrow IPC, e retorna um LazyFrame sobre os lotes.
+    Os tipos de cada lote são inferidos separadamente e unificados no scan.
+    """
+    progress = IngestProgress(path)
+    return _spill(_excel_batches(path, batch_size, progress), path, spill_dir, progress, on_progress, token)
+
+
+def scan_file(
+    path: Path,
+    spill_dir: Path,
+    on_progress: Callable[[IngestProgress], None] | None = None,
+    token: CancellationToken | None = None,
+    batch_size: int = 50_000,
+) -> pl.LazyFrame:
+    """
+    Abre um arquivo CSV ou Excel como LazyFrame, escolhendo a leitura pela extensão.
+    Lança ValueError para extensões não suportadas e IngestCancelled se o
+    token for cancelado durante a leitura.
+    """
+    suffix = path.suffix.lower()
+    if suffix in CSV_EXTENSIONS:
+        return scan_csv(path, spill_dir, on_progress=on_progress, token=token, batch_size=batch_size)
+    if suffix in EXCEL_EXTENSIONS:
+        return scan_excel(path, spill_dir, on_progress=on_progress, token=token, batch_size=batch_size)
+    raise ValueError(f"Formato de arquivo não suportado: {path.name}")
+
+
+__all__ = ["IngestProgress", "IngestCancelled", "scan_csv", "scan_excel", "scan_file"]
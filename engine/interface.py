@@ -41,6 +41,9 @@ class IRoute(ABC):
   @abstractmethod
   def generate_static_params(self) -> list[tuple[str, dict]]:...
   
+  @abstractmethod
+  def generate_metadata(self, props) -> dict:...
+  
 """
   [IRouteGenerator]
 """  
@@ -85,9 +88,34 @@ class IRenderer(ABC):
     ...
   
   @abstractmethod
-  def render_route(self, router: "IRouter", route: "IRoute") -> None:
+  def mount(self, controls: list[ft.Control]) -> None:
+    """
+    Substitui o conteúdo da página pelos controles, mantendo o layout padrão.
+    """
+    ...
+  
+  @abstractmethod
+  def render_route(self, router: "IRouter", route: "IRoute", params: dict | None = None, started_at: float | None = None) -> None:
+    """
+    Monta a rota no contexto; params são os segmentos dinâmicos já extraídos.
+    started_at (time.perf_counter) marca o início da navegação para as métricas.
+    """
     ...
     
+  @abstractmethod
+  def for_session(self, ctx: ft.Page) -> "IRenderer":
+    """
+    Cria um renderer exclusivo para a sessão (conexão) do ctx.
+    """
+    ...
+  
+  @abstractmethod
+  def dispose(self) -> None:
+    """
+    Libera o estado da sessão (ex.: cancela builds pendentes).
+    """
+    ...
+  
   @abstractmethod
   def ensure_ctx(self) -> bool:
     """
@@ -108,6 +136,13 @@ class IRouter:
     self.url: str = "/"
 
 
+  @abstractmethod
+  def for_session(self, renderer: IRenderer) -> "IRouter":
+    """
+    Cria um router exclusivo para a sessão, compartilhando a tabela de rotas.
+    """
+    ...
+  
   @abstractmethod
   def navigate(self, ctx: ft.Page, _path: str) -> None:
     """
@@ -124,6 +159,28 @@ class IRouter:
     """
     ...
   
+  @abstractmethod
+  def invalidate(self, path: str | None = None) -> int:
+    """
+    Descarta a página do caminho (ou todas) do cache de páginas da sessão.
+    """
+    ...
+    
+  @abstractmethod
+  def match(self, path: str) -> tuple[IRoute, dict] | None:
+    """
+    Retorna a rota correspondente ao caminho e os parâmetros dinâmicos
+    extraídos, ou None se nenhuma rota casar.
+    """
+    ...
+  
+  @abstractmethod
+  def paths(self) -> list[str]:
+    """
+    Retorna os caminhos navegáveis (sem segmentos dinâmicos).
+    """
+    ...
+  
   @abstractmethod
   def get_route(self, path: str) -> IRoute:
     """
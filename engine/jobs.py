@@ -0,0 +1,257 @@
+"""
+Módulo jobs: execução de scripts em segundo plano.
+Fornece classes para enfileirar e executar a função principal dos módulos
+de um Modules em um pool de processos:
+- Job: estado de uma execução (status, horários, stdout/stderr, erro).
+- JobRunner: fila com limite de concorrência, ids de job e notificação de mudanças.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from pathlib import Path
+from typing import Callable
+import contextlib
+import io
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+import weakref
+
+from engine.modules import Module, Modules
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobStatus:
+    """Estados possíveis de um Job."""
+    QUEUED = "na fila"
+    RUNNING = "executando"
+    DONE = "concluído"
+    FAILED = "falhou"
+    CANCELLED = "cancelado"
+
+
+class Job:
+    """
+    Representa uma execução de script.
+    id: identificador sequencial do job
+    name: nome do módulo em Modules
+    path: arquivo .py executado
+    """
+    def __init__(self, id: int, name: str, path: Path) -> None:
+        self.id: int = id
+        self.name: str = name
+        self.path: Path = path
+        self.status: str = JobStatus.QUEUED
+        self.submitted_at: float = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.stdout: str = ""
+        self.stderr: str = ""
+        self.result: str | None = None
+        self.error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Duração em segundos (parcial enquanto o job executa)."""
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+def run_script(path: str, main: str) -> dict:
+    """
+    Executa a função principal de um script no processo de trabalho,
+    capturando stdout/stderr. Precisa ser de nível de módulo para ser
+    serializável pelo ProcessPoolExecutor.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    result, error = None, None
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            module = Module(Path(path), main, [])
+            if module.main is None:
+                raise AttributeError(f"Função '{main}' não encontrada em {path}")
+            result = module.main()
+        except Exception:
+            error = traceback.format_exc()
+    return {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "result": None if result is None else repr(result),
+        "error": error,
+    }
+
+
+class JobRunner:
+    """
+    Executa scripts de um Modules em paralelo, em processos separados.
+
+    Uso básico:
+
+        jobs = JobRunner(scripts, max_workers=4)
+        job = jobs.submit("carteiras")
+        jobs.subscribe(lambda job: print(job.id, job.status))
+
+    Args:
+        modules: Modules com os scripts disponíveis
+        max_workers: Limite de scripts executando ao mesmo tempo (padrão: núcleos da CPU)
+        history: Quantidade de jobs finalizados mantidos para consulta
+    """
+    def __init__(self, modules: Modules, max_workers: int | None = None, history: int = 200) -> None:
+        self.modules: Modules = modules
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.history: int = history
+        self.jobs: dict[int, Job] = {}
+        self._queue: deque[Job] = deque()
+        self._running: int = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[], Callable[[Job], None] | None]] = []
+        # pool criado no primeiro submit para não custar na inicialização
+        self._pool: ProcessPoolExecutor | None = None
+
+    def submit(self, name: str) -> Job:
+        """
+        Enfileira a execução do script name e retorna o Job criado.
+        Lança KeyError se o script não existir.
+        """
+        module = self.modules[name]
+        if module is None:
+            raise KeyError(f"Script '{name}' não encontrado")
+
+        job = Job(next(self._ids), name, module.path)
+        with self._lock:
+            self.jobs[job.id] = job
+            self._queue.append(job)
+            self._trim_history()
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancela um job que ainda está na fila."""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                return False
+            self._queue.remove(job)
+            job.status = JobStatus.CANCELLED
+            job.finished_at = time.time()
+        self._notify(job)
+        return True
+
+    def subscribe(self, listener: Callable[[Job], None]) -> None:
+        """
+        Registra um callback chamado a cada mudança de job.
+        Métodos são guardados por referência fraca: o componente que escuta
+        pode ser coletado sem precisar cancelar a inscrição.
+        """
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else (lambda: listener)
+        with self._lock:
+            self._listeners.append(ref)
+
+    def list_jobs(self) -> list[Job]:
+        """Jobs mais recentes primeiro."""
+        return sorted(self.jobs.values(), key=lambda job: job.id, reverse=True)
+
+    def shutdown(self, wait: bool = False) -> None:
+        if self._pool:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    def _dispatch(self) -> None:
+        """Inicia jobs da fila enquanto houver vaga no limite de concorrência."""
+        started: list[tuple[Job, Future, ProcessPoolExecutor]] = []
+        failed: list[Job] = []
+        with self._lock:
+            while self._queue and self._running < self.max_workers:
+                job = self._queue.popleft()
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                self._running += 1
+                if self._pool is None:
+                    # spawn: o processo da aplicação tem threads (Flet, executor,
+                    # watcher) e fork() com threads pode travar o filho
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+                try:
+                    started.append((job, self._pool.submit(run_script, str(job.path), self.modules.main), self._pool))
+                except Exception as e:
+                    # pool quebrado (ex.: BrokenProcessPool após um processo morrer):
+                    # o job falha, a vaga é liberada e o próximo dispatch cria outro pool
+                    logger.exception("Falha ao iniciar o job %s", job.id)
+                    job.error = f"{type(e).__name__}: {e}"
+                    job.status = JobStatus.FAILED
+                    job.finished_at = time.time()
+                    self._running -= 1
+                    self._discard_pool(self._pool)
+                    failed.append(job)
+        for job in failed:
+            self._notify(job)
+        for job, future, pool in started:
+            self._notify(job)
+            # fora do lock: o callback roda na hora se o future já terminou
+            future.add_done_callback(lambda f, j=job, p=pool: self._finish(j, f, p))
+
+    def _discard_pool(self, pool: ProcessPoolExecutor | None) -> None:
+        """
+        Descarta um pool quebrado (chamado com o lock adquirido). O próprio
+        executor já encerrou os processos; shutdown() aqui travaria, pois o
+        callback roda na thread de gerenciamento do pool.
+        """
+        if pool is not None and pool is self._pool:
+            self._pool = None
+
+    def _finish(self, job: Job, future: Future, pool: ProcessPoolExecutor | None = None) -> None:
+        try:
+            outcome = future.result()
+            job.stdout = outcome["stdout"]
+            job.stderr = outcome["stderr"]
+            job.result = outcome["result"]
+            job.error = outcome["error"]
+        except Exception as e:
+            # processo de trabalho morreu ou o resultado não pôde ser lido
+            job.error = f"{type(e).__name__}: {e}"
+            broken = isinstance(e, BrokenProcessPool)
+        else:
+            broken = False
+        job.status = JobStatus.FAILED if job.error else JobStatus.DONE
+        job.finished_at = time.time()
+
+        with self._lock:
+            self._running -= 1
+            if broken:
+                self._discard_pool(pool)
+        self._notify(job)
+        self._dispatch()
+
+    def _trim_history(self) -> None:
+        finished = [job for job in self.jobs.values() if job.finished]
+        for job in sorted(finished, key=lambda j: j.id)[:max(0, len(finished) - self.history)]:
+            del self.jobs[job.id]
+
+    def _notify(self, job: Job) -> None:
+        with self._lock:
+            # descarta ouvintes já coletados
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+            listeners = list(self._listeners)
+        for ref in listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            try:
+                listener(job)
+            except Exception:
+                logger.exception("Falha ao notificar mudança do job %s", job.id)
+
+
+__all__ = ["Job", "JobStatus", "JobRunner"]
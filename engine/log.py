@@ -0,0 +1,209 @@
+"""
+Módulo log: logging estruturado e com níveis da engine, sobre o logging
+da biblioteca padrão.
+- get_logger: logger filho de "engine" (ex.: get_logger(__name__)).
+- StructuredFormatter: linha "hora nível [logger] mensagem chave=valor" ou JSON.
+- SamplingFilter: deixa passar 1 a cada N registros DEBUG/INFO de uma mesma
+  mensagem (ex.: uma linha por rota com milhares de rotas expandidas).
+- RingBuffer: handler que guarda os últimos registros em memória para o
+  visualizador de logs da UI.
+- configure: instala os handlers; o nível vem de ENGINE_LOG_LEVEL (padrão INFO)
+  e o formato JSON de ENGINE_LOG_FORMAT=json.
+
+As mensagens usam formatação preguiçosa (logger.debug("rota %s", nome)): com o
+nível desativado o custo é só a checagem do nível. Campos estruturados vão em
+extra={"fields": {...}}.
+"""
+from collections import deque
+from typing import Callable
+import json
+import logging
+import os
+import sys
+import threading
+
+ROOT = "engine"
+
+
+class LogEntry:
+    """Registro guardado no RingBuffer, já formatado (independe do LogRecord)."""
+    def __init__(self, record: logging.LogRecord) -> None:
+        self.created: float = record.created
+        self.level: str = record.levelname
+        self.levelno: int = record.levelno
+        self.logger: str = record.name
+        self.message: str = record.getMessage()
+        self.fields: dict = dict(getattr(record, "fields", None) or {})
+        self.error: str | None = None
+        if record.exc_info and record.exc_info[1] is not None:
+            self.error = f"{type(record.exc_info[1]).__name__}: {record.exc_info[1]}"
+
+    def to_dict(self) -> dict:
+        return {
+            "created": self.created,
+            "level": self.level,
+            "logger": self.logger,
+            "message": self.message,
+            "fields": self.fields,
+            "error": self.error,
+        }
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formata o registro com os campos de extra={"fields": {...}}.
+    as_json=True produz um objeto JSON por linha (para agregadores de log).
+    """
+    def __init__(self, as_json: bool = False) -> None:
+        super().__init__(datefmt="%H:%M:%S")
+        self.as_json: bool = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = LogEntry(record)
+        if self.as_json:
+            payload = entry.to_dict()
+            if record.exc_info:
+                payload["traceback"] = self.formatException(record.exc_info)
+            return json.dumps(payload, default=str, ensure_ascii=False)
+
+        line = f"{self.formatTime(record, self.datefmt)} {entry.level:<7} [{entry.logger}] {entry.message}"
+        if entry.fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in entry.fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Amostragem por mensagem: registros até max_level (padrão INFO) com o mesmo
+    template passam 1 a cada `every`; avisos e erros passam sempre.
+    O template é a mensagem antes da formatação, então "rota %s" conta como
+    uma única mensagem para todas as rotas.
+    """
+    def __init__(self, every: int = 100, max_level: int = logging.INFO) -> None:
+        super().__init__()
+        self.every: int = max(1, every)
+        self.max_level: int = max_level
+        self.counts: dict[tuple[str, str], int] = {}
+        self.dropped: int = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.every == 1:
+            return True
+        key = (record.name, str(record.msg))
+        with self._lock:
+            count = self.counts.get(key, 0)
+            self.counts[key] = count + 1
+            if count % self.every:
+                self.dropped += 1
+                return False
+        return True
+
+
+class RingBuffer(logging.Handler):
+    """
+    Handler que mantém os últimos `capacity` registros em memória e avisa
+    os ouvintes (ex.: visualizador de logs) a cada novo registro.
+    """
+    def __init__(self, capacity: int = 1000, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.entries: deque[LogEntry] = deque(maxlen=capacity)
+        self._listeners: list[Callable[[LogEntry], None]] = []
+        self._entries_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = LogEntry(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._entries_lock:
+            self.entries.append(entry)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(entry)
+            except Exception:
+                # um ouvinte com erro não pode gerar novos logs (recursão)
+                pass
+
+    def records(self, level: int = logging.NOTSET, logger: str | None = None) -> list[LogEntry]:
+        """Registros guardados a partir de level, opcionalmente de um logger (e filhos)."""
+        with self._entries_lock:
+            entries = list(self.entries)
+        return [
+            entry for entry in entries
+            if entry.levelno >= level
+            and (logger is None or entry.logger == logger or entry.logger.startswith(logger + "."))
+        ]
+
+    def subscribe(self, listener: Callable[[LogEntry], None]) -> Callable[[], None]:
+        """Registra um ouvinte; devolve a função que cancela a inscrição."""
+        with self._entries_lock:
+            self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            with self._entries_lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return unsubscribe
+
+    def clear(self) -> None:
+        with self._entries_lock:
+            self.entries.clear()
+
+
+def get_logger(name: str = ROOT) -> logging.Logger:
+    """Logger sob a hierarquia "engine" (módulos de src também são aceitos)."""
+    if name != ROOT and not name.startswith(ROOT + "."):
+        name = f"{ROOT}.{name}"
+    return logging.getLogger(name)
+
+
+# Registros recentes de todo o processo, exibidos na UI
+ring_buffer = RingBuffer()
+# Amostragem das mensagens por rota (varredura e expansão de parâmetros)
+route_sampling = SamplingFilter(every=int(os.environ.get("ENGINE_LOG_SAMPLE_EVERY", "100")))
+
+
+def configure(level: int | str | None = None, as_json: bool | None = None, stream=None) -> logging.Logger:
+    """
+    Instala o handler de console e o ring buffer no logger "engine".
+    Pode ser chamada de novo para trocar nível ou formato.
+    """
+    root = logging.getLogger(ROOT)
+    level = level if level is not None else os.environ.get("ENGINE_LOG_LEVEL", "INFO")
+    as_json = as_json if as_json is not None else os.environ.get("ENGINE_LOG_FORMAT", "").lower() == "json"
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    root.propagate = False
+
+    for handler in [handler for handler in root.handlers if getattr(handler, "_engine_console", False)]:
+        root.removeHandler(handler)
+    console = logging.StreamHandler(stream or sys.stderr)
+    console.setFormatter(StructuredFormatter(as_json=as_json))
+    console._engine_console = True
+    root.addHandler(console)
+    if ring_buffer not in root.handlers:
+        root.addHandler(ring_buffer)
+    return root
+
+
+for _name in ("engine.route.route", "engine.route.route_generator"):
+    if route_sampling not in logging.getLogger(_name).filters:
+        logging.getLogger(_name).addFilter(route_sampling)
+
+configure()
+
+
+__all__ = [
+    "LogEntry",
+    "StructuredFormatter",
+    "SamplingFilter",
+    "RingBuffer",
+    "get_logger",
+    "configure",
+    "ring_buffer",
+    "route_sampling",
+]
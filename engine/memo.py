@@ -0,0 +1,143 @@
+"""
+Módulo memo: cache de resultados com validade (TTL) e invalidação explícita.
+Usado para generate_static_params/generate_metadata das páginas, que podem
+consultar fontes lentas (banco, rede, listagem de scripts) e não devem rodar
+de novo para cada rota expandida, sessão ou navegação.
+
+Cada entrada tem uma chave e um conjunto de tags; invalidate(tag=...) remove
+todas as entradas de uma tag (ex.: o page.py alterado no hot-reload ou
+"generate_static_params" quando a lista de scripts muda).
+"""
+from typing import Any, Callable, Hashable, Iterable
+import threading
+import time
+
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class MemoEntry:
+    """Valor memoizado, instante de expiração (None = não expira) e tags."""
+    def __init__(self, value: Any, expires_at: float | None, tags: frozenset[str]) -> None:
+        self.value: Any = value
+        self.expires_at: float | None = expires_at
+        self.tags: frozenset[str] = tags
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+class MemoCache:
+    """
+    Cache thread-safe de resultados de funções.
+
+    Uso básico:
+
+        params = static_params_cache.get_or_compute(
+            ("generate_static_params", page_path), func, ttl=60, tags=[str(page_path)],
+        )
+        static_params_cache.invalidate(tag=str(page_path))
+
+    Args:
+        ttl: Validade padrão das entradas em segundos (None = até ser invalidada)
+    """
+    def __init__(self, ttl: float | None = None) -> None:
+        self.ttl: float | None = ttl
+        self._entries: dict[Hashable, MemoEntry] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._listeners: list[Callable[[list[Hashable]], None]] = []
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, key: Hashable) -> MemoEntry | None:
+        """Entrada válida da chave, ou None se ausente ou expirada."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expired:
+            return None
+        return entry
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        Retorna o valor memoizado da chave ou executa compute() e guarda o
+        resultado. Chamadas simultâneas para a mesma chave executam compute
+        uma única vez. Exceções não são memoizadas.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry.value
+
+        with self._key_lock(key):
+            entry = self.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry.value
+
+            self.misses += 1
+            value = compute()
+            ttl = self.ttl if ttl is None else ttl
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            with self._lock:
+                self._entries[key] = MemoEntry(value, expires_at, frozenset(tags))
+            return value
+
+    def is_expired(self, key: Hashable) -> bool:
+        """Indica se a chave tem uma entrada cuja validade já passou."""
+        entry = self._entries.get(key)
+        return entry is not None and entry.expired
+
+    def invalidate(self, key: Hashable | None = None, tag: str | None = None) -> int:
+        """
+        Remove a entrada da chave, as entradas de uma tag ou, sem argumentos,
+        todas as entradas. Retorna quantas foram removidas e avisa os ouvintes.
+        """
+        with self._lock:
+            if key is None and tag is None:
+                removed = list(self._entries)
+            elif key is not None:
+                removed = [key] if key in self._entries else []
+            else:
+                removed = [k for k, entry in self._entries.items() if tag in entry.tags]
+            for k in removed:
+                del self._entries[k]
+            listeners = list(self._listeners)
+
+        if removed:
+            for listener in listeners:
+                try:
+                    listener(removed)
+                except Exception:
+                    logger.exception("Falha ao notificar invalidação do cache")
+        return len(removed)
+
+    def on_invalidate(self, listener: Callable[[list[Hashable]], None]) -> None:
+        """Registra um callback chamado com as chaves removidas a cada invalidação."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def stats(self) -> dict[str, int]:
+        """Entradas, acertos e execuções desde o início do processo."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache compartilhado de generate_static_params/generate_metadata das rotas
+static_params_cache = MemoCache()
+
+
+__all__ = ["MemoEntry", "MemoCache", "static_params_cache"]
@@ -0,0 +1,234 @@
+"""
+Módulo metrics: métricas de renderização e ganchos de ciclo de vida.
+- RenderEvent: uma navegação (caminho, rota, tempos de cada etapa, controles).
+- RenderHooks: callbacks before_render/after_render chamados a cada navegação.
+- MetricSeries: janela das últimas amostras de uma métrica, com percentis.
+- Metrics: séries por nome, navegações recentes e exportação (JSON/Prometheus).
+
+Etapas medidas em cada navegação (em segundos):
+- navigation: do Router.navigate até o fim do ctx.update da página;
+- page: execução da função page;
+- layout: montagem da pilha de layouts;
+- update: ctx.update que envia a página ao cliente.
+"""
+from collections import deque
+from pathlib import Path
+from typing import Callable
+import json
+import math
+import threading
+import time
+
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class RenderEvent:
+    """
+    Dados de uma navegação, preenchidos ao longo do render.
+    path: url navegada
+    route: nome da rota casada
+    session_id: sessão que navegou
+    timings: segundos por etapa (navigation, page, layout, update)
+    controls: quantidade de controles da página montada
+    error: mensagem quando o build caiu na página de erro
+    cached: página servida pelo PageCache da sessão (sem build)
+    """
+    def __init__(self, path: str, route: str, session_id: str | None = None, started_at: float | None = None) -> None:
+        self.path: str = path
+        self.route: str = route
+        self.session_id: str | None = session_id
+        self.started_at: float = started_at if started_at is not None else time.perf_counter()
+        self.timestamp: float = time.time()
+        self.timings: dict[str, float] = {}
+        self.controls: int = 0
+        self.error: str | None = None
+        self.cancelled: bool = False
+        self.cached: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "route": self.route,
+            "session_id": self.session_id,
+            "timestamp": self.timestamp,
+            "timings": self.timings,
+            "controls": self.controls,
+            "error": self.error,
+            "cached": self.cached,
+        }
+
+
+def count_controls(controls: list) -> int:
+    """Conta os controles de uma árvore Flet (controls/content/actions aninhados)."""
+    count, pending = 0, list(controls)
+    while pending:
+        control = pending.pop()
+        if control is None:
+            continue
+        count += 1
+        for attr in ("controls", "actions"):
+            children = getattr(control, attr, None)
+            if isinstance(children, list):
+                pending.extend(children)
+        content = getattr(control, "content", None)
+        if content is not None and hasattr(content, "_get_control_name"):
+            pending.append(content)
+    return count
+
+
+class RenderHooks:
+    """
+    Ganchos de renderização, compartilhados por todas as sessões.
+    before_render(event): na thread da UI, antes do skeleton ser exibido
+    after_render(event): na thread de trabalho, após o ctx.update da página
+    Exceções dos ganchos são reportadas e não interrompem o render.
+    """
+    def __init__(self) -> None:
+        self.before_render: list[Callable[[RenderEvent], None]] = []
+        self.after_render: list[Callable[[RenderEvent], None]] = []
+
+    def call(self, hooks: list[Callable[[RenderEvent], None]], event: RenderEvent) -> None:
+        for hook in list(hooks):
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Falha no gancho de render %s", getattr(hook, "__name__", hook))
+
+
+class MetricSeries:
+    """
+    Últimas amostras de uma métrica (janela deslizante) e totais acumulados.
+    Os percentis são calculados sobre a janela.
+    """
+    def __init__(self, window: int = 1000) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p: float) -> float:
+        """Percentil p (0-100) pelo método do posto mais próximo."""
+        values = sorted(self.samples)
+        if not values:
+            return 0.0
+        index = max(0, min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1))
+        return values[index]
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    """
+    Registro de métricas do processo.
+
+    Uso básico:
+
+        metrics.record("navigation", 0.120)
+        metrics.summary()["navigation"]["p95"]
+        metrics.export(Path("metrics.json"))
+
+    Args:
+        window: Amostras mantidas por métrica para os percentis
+        history: Navegações recentes mantidas para a página de diagnóstico
+    """
+    def __init__(self, window: int = 1000, history: int = 100) -> None:
+        self.window: int = window
+        self.series: dict[str, MetricSeries] = {}
+        self.counters: dict[str, int] = {}
+        self.recent: deque[RenderEvent] = deque(maxlen=history)
+        self.started_at: float = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            series = self.series.get(name)
+            if series is None:
+                series = self.series[name] = MetricSeries(self.window)
+            series.add(seconds)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record_render(self, event: RenderEvent) -> None:
+        """Registra os tempos e contagens de uma navegação concluída."""
+        for name, seconds in event.timings.items():
+            self.record(name, seconds)
+        self.record("controls", event.controls)
+        self.increment("renders")
+        if event.error:
+            self.increment("render_errors")
+        if event.cached:
+            self.increment("page_cache_hits")
+        with self._lock:
+            self.recent.append(event)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {name: series.summary() for name, series in self.series.items()}
+
+    def snapshot(self) -> dict:
+        """Resumo, contadores e navegações recentes em formato serializável."""
+        with self._lock:
+            recent = [event.to_dict() for event in self.recent]
+            counters = dict(self.counters)
+        return {
+            "started_at": self.started_at,
+            "uptime": time.time() - self.started_at,
+            "summary": self.summary(),
+            "counters": counters,
+            "recent": recent,
+        }
+
+    def to_prometheus(self, prefix: str = "engine") -> str:
+        """Métricas no formato de exposição de texto do Prometheus."""
+        lines = []
+        for name, summary in self.summary().items():
+            metric = f"{prefix}_{name}" if name == "controls" else f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for quantile in ("p50", "p95", "p99"):
+                lines.append(f'{metric}{{quantile="0.{quantile[1:]}"}} {summary[quantile]}')
+            lines.append(f"{metric}_sum {summary['mean'] * summary['count']}")
+            lines.append(f"{metric}_count {summary['count']}")
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Path) -> Path:
+        """Grava as métricas em path: .prom no formato Prometheus, demais em JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".prom":
+            path.write_text(self.to_prometheus(), encoding="utf-8")
+        else:
+            path.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self.series.clear()
+            self.counters.clear()
+            self.recent.clear()
+
+
+# Instância global das métricas de renderização
+metrics = Metrics()
+
+
+__all__ = ["RenderEvent", "RenderHooks", "MetricSeries", "Metrics", "metrics", "count_controls"]
@@ -2,13 +2,66 @@
 Módulo utils.modules
 Fornece classes para carregar módulos Python de forma dinâmica:
 - Module: representa e carrega um único arquivo .py, expõe função principal e auxiliares.
+- LazyModule: variante de Module que só executa o arquivo no primeiro acesso.
 - Modules: escaneia um diretório, carrega todos os .py e expõe um dicionário de Module.
+- ModuleCache: cache de módulos executados, chaveado pelo caminho resolvido e mtime.
 """
 
 from pathlib import Path    # Path: manipula caminhos de arquivo e diretório
 import importlib.util       # importlib.util: cria specs para imports dinâmicos
 import sys                  # sys: registra módulos carregados em cache
+import threading            # threading: protege o carregamento tardio entre threads
 from typing import Callable # Callable: tipagem para funções carregadas
+from engine.profiler import profiler  # profiler: mede importações no --profile-startup
+from engine.log import get_logger     # get_logger: logs estruturados da engine
+
+logger = get_logger(__name__)
+
+class ModuleCache:
+    """
+    Cache de módulos já executados, chaveado pelo caminho resolvido do arquivo.
+    Uma entrada só é reaproveitada enquanto o mtime do arquivo for o mesmo,
+    garantindo que arquivos idênticos sejam importados exatamente uma vez.
+    """
+    def __init__(self):
+        # caminho resolvido -> (mtime_ns, módulo)
+        self._modules: dict[str, tuple[int, object]] = {}
+        # um lock por arquivo evita execuções duplicadas em paralelo
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def lock(self, key: str) -> threading.Lock:
+        """Retorna o lock associado ao arquivo."""
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, key: str, mtime: int) -> object | None:
+        """Retorna o módulo em cache se o mtime ainda corresponde."""
+        cached = self._modules.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        return None
+
+    def put(self, key: str, mtime: int, module: object) -> None:
+        self._modules[key] = (mtime, module)
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Descarta o módulo do arquivo informado ou todo o cache."""
+        if path is None:
+            self._modules.clear()
+        else:
+            self._modules.pop(str(path.resolve()), None)
+
+    def __contains__(self, path: Path) -> bool:
+        return str(path.resolve()) in self._modules
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
+# Cache global compartilhado por todos os Module
+module_cache = ModuleCache()
+
 
 class Module:
     """
@@ -18,59 +71,118 @@ class Module:
     funcs: lista de nomes de funções auxiliares a expor
     """
     def __init__(self, path: Path, main: str, funcs: list[str]):
-        # Carrega o arquivo e obtém o objeto módulo
-        self.module = self.load(path)
+        self.path = path
         # Junta nome da função principal com auxiliares
         self.funcs_names = [main, *funcs]
+        # Carrega o arquivo e vincula as funções expostas
+        self._bind(self.load(path))
+
+    def _bind(self, module: object) -> None:
+        """
+        Vincula o objeto módulo carregado à função principal e às auxiliares.
+        """
+        main = self.funcs_names[0]
         # Função principal dummy até ser substituída
-        self.main = None
+        main_func = None
         # Dicionário para mapear funções auxiliares existentes
         res: dict[str, Callable] = {}
 
-        if self.module is None:
+        if module is None:
             # Se não carregou, levanta ImportError
-            raise ImportError(f"Não foi possível carregar o módulo {path}")
+            raise ImportError(f"Não foi possível carregar o módulo {self.path}")
 
         # Para cada nome esperado, vincula se existir no módulo
         for func_name in self.funcs_names:
-            if hasattr(self.module, func_name):
-                func = getattr(self.module, func_name)  # busca o atributo
+            if hasattr(module, func_name):
+                func = getattr(module, func_name)  # busca o atributo
                 if callable(func):
                     if func_name == main:
                         # substitui função dummy pela função real principal
-                        self.main = func
+                        main_func = func
                     else:
                         # adiciona a função auxiliar ao dicionário
                         res[func_name] = func
             else:
                 # se não existir, cria stub inofensivo
                 res[func_name] = None
-        # expõe dicionário de funções auxiliares
+        # expõe função principal e dicionário de funções auxiliares
+        # (module por último: marca o carregamento como concluído)
+        self.main = main_func
         self.funcs = res
+        self.module = module
 
     def load(self, path: Path) -> object:
         """
         Carrega arquivo .py como um módulo Python dinâmico.
         Retorna o módulo carregado ou lança erro.
         """
-        if not path.exists():
-            # arquivo deve existir
+        try:
+            # arquivo deve existir; o mtime identifica a versão em cache
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo {path} não encontrado.")
-        # define o nome do módulo com base no nome do arquivo
-        module_name = path.stem
-        # cria um spec a partir do arquivo físico
-        spec = importlib.util.spec_from_file_location(module_name, str(path))
-        if spec is None:
-            # falha no spec
-            raise ImportError(f"Não foi possível criar o spec para {path}")
-        # cria o módulo vazio a partir do spec
-        module = importlib.util.module_from_spec(spec)
-        # executa o módulo (popula atributos)
-        spec.loader.exec_module(module)
-        # registra no cache de importação para permitir reload ou introspecção
-        sys.modules[module_name] = module
-        # retorna o objeto módulo
-        return module
+        key = str(path.resolve())
+
+        with module_cache.lock(key):
+            # reaproveita o módulo se o mesmo arquivo já foi executado
+            module = module_cache.get(key, mtime)
+            if module is not None:
+                return module
+            # define o nome do módulo com base no nome do arquivo
+            module_name = path.stem
+            # cria um spec a partir do arquivo físico
+            spec = importlib.util.spec_from_file_location(module_name, str(path))
+            if spec is None:
+                # falha no spec
+                raise ImportError(f"Não foi possível criar o spec para {path}")
+            # cria o módulo vazio a partir do spec
+            module = importlib.util.module_from_spec(spec)
+            # executa o módulo (popula atributos)
+            with profiler.span(str(path), "import"):
+                spec.loader.exec_module(module)
+            # registra no cache de importação para permitir reload ou introspecção
+            sys.modules[module_name] = module
+            module_cache.put(key, mtime, module)
+            # retorna o objeto módulo
+            return module
+
+class LazyModule(Module):
+    """
+    Module com carregamento sob demanda.
+    Apenas registra o caminho do arquivo; o módulo é executado no primeiro
+    acesso a module, main ou funcs (ou ao chamar ensure_loaded).
+    """
+    # atributos que disparam o carregamento quando ainda não existem
+    _lazy_attrs = ("module", "main", "funcs")
+
+    def __init__(self, path: Path, main: str, funcs: list[str]):
+        self.path = path
+        self.funcs_names = [main, *funcs]
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indica se o arquivo já foi executado."""
+        return "module" in self.__dict__
+
+    def ensure_loaded(self) -> "LazyModule":
+        """
+        Carrega o módulo caso ainda não tenha sido carregado.
+        Seguro para chamadas concorrentes (ex.: warm-up em background).
+        """
+        if not self.is_loaded:
+            with self._lock:
+                if not self.is_loaded:
+                    self._bind(self.load(self.path))
+        return self
+
+    def __getattr__(self, name: str):
+        # só é chamado quando o atributo não existe: carrega e tenta de novo
+        if name in LazyModule._lazy_attrs:
+            self.ensure_loaded()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
 
 class Modules:
     """
@@ -104,6 +216,40 @@ class Modules:
             if module.main is not None
         }
 
+    def refresh(self) -> tuple[list[str], list[str], list[str]]:
+        """
+        Reescaneia o diretório de forma incremental:
+        - arquivos novos são carregados;
+        - arquivos alterados são reexecutados (o ModuleCache detecta pelo mtime);
+        - arquivos inalterados reaproveitam o módulo em cache;
+        - arquivos removidos saem do dicionário.
+        Um arquivo com erro mantém a versão anterior carregada.
+        Retorna as listas (adicionados, alterados, removidos).
+        """
+        modules: dict[str, Module] = {}
+        for file in self.dir.iterdir():
+            if not (file.is_file() and file.suffix == ".py"):
+                continue
+            try:
+                module = Module(file, self.main, self.funcs)
+            except Exception:
+                logger.exception("Falha ao recarregar %s", file)
+                if file.stem in self.modules:
+                    modules[file.stem] = self.modules[file.stem]
+                continue
+            if module.main is not None:
+                modules[file.stem] = module
+
+        added = [name for name in modules if name not in self.modules]
+        removed = [name for name in self.modules if name not in modules]
+        changed = [
+            name for name, module in modules.items()
+            if name in self.modules and module.module is not self.modules[name].module
+        ]
+        # troca atômica: leitores veem o dicionário antigo ou o novo
+        self.modules = modules
+        return added, changed, removed
+
     def keys(self) -> list[str]:
         """Retorna lista de nomes de módulos carregados."""
         return list(self.modules.keys())
@@ -0,0 +1,119 @@
+"""
+Módulo page_cache: cache de páginas renderizadas por sessão.
+Guarda a árvore de controles montada por RouteBuilder.build (página + pilha
+de layouts) por rota e parâmetros; voltar a uma página visitada reaproveita
+os mesmos controles, sem executar page/layouts de novo.
+
+Cada sessão tem seu próprio PageCache (controles Flet pertencem a uma única
+página). As páginas controlam o cache pelo atributo `cache` do page.py:
+- cache = False: a página nunca é guardada (dados ao vivo);
+- cache = 30: a página é guardada por 30 segundos;
+- ausente ou True: a página é guardada até ser invalidada ou sair do LRU.
+"""
+from collections import OrderedDict
+from typing import Hashable
+import threading
+import time
+import flet as ft
+
+
+class PageCacheEntry:
+    """Controles de uma página montada, título aplicado e validade (None = não expira)."""
+    def __init__(self, route: str, controls: list[ft.Control], title: str | None, expires_at: float | None) -> None:
+        self.route: str = route
+        self.controls: list[ft.Control] = controls
+        self.title: str | None = title
+        self.expires_at: float | None = expires_at
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+class PageCache:
+    """
+    LRU de páginas renderizadas de uma sessão.
+
+    Uso básico:
+
+        key = PageCache.key(route.name, params)
+        entry = cache.get(key)
+        if entry is None:
+            cache.put(key, route.name, controls, ttl=route.page_cache_ttl())
+        cache.invalidate(route="/[scripts]")
+
+    Args:
+        max_entries: Páginas mantidas; a menos usada recentemente sai primeiro
+    """
+    def __init__(self, max_entries: int = 16) -> None:
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[Hashable, PageCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def key(route: str, params: dict | None = None) -> tuple:
+        """Chave da página: nome da rota e parâmetros dinâmicos (em ordem estável)."""
+        return (route, tuple(sorted((k, repr(v)) for k, v in (params or {}).items())))
+
+    def get(self, key: Hashable) -> PageCacheEntry | None:
+        """Entrada válida da chave (marcada como usada), ou None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expired:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        route: str,
+        controls: list[ft.Control],
+        title: str | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = PageCacheEntry(route, [*controls], title, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None, route: str | None = None) -> int:
+        """
+        Remove a página da chave, todas as páginas de uma rota (qualquer
+        parâmetro) ou, sem argumentos, todo o cache. Retorna quantas saíram.
+        """
+        with self._lock:
+            if key is None and route is None:
+                removed = list(self._entries)
+            elif key is not None:
+                removed = [key] if key in self._entries else []
+            else:
+                removed = [k for k, entry in self._entries.items() if entry.route == route]
+            for k in removed:
+                del self._entries[k]
+        return len(removed)
+
+    def stats(self) -> dict[str, int]:
+        """Páginas guardadas, acertos, perdas e remoções por limite de tamanho."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not entry.expired
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["PageCacheEntry", "PageCache"]
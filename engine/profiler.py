@@ -0,0 +1,261 @@
+"""
+Módulo profiler: medição do tempo de inicialização (--profile-startup).
+Registra intervalos (spans) aninhados entre a importação da engine e o
+primeiro frame renderizado:
+- import: cada módulo Python importado (via sys.meta_path) e cada arquivo
+  carregado por Module (scripts, page.py, layout.py...);
+- route: varredura de diretórios e construção de cada Route;
+- static_params: generate_static_params por rota e expansão dos caminhos;
+- render: montagem e build da primeira página.
+
+Ao final são gravados em output_dir:
+- startup-profile.txt: resumo por fase e spans mais lentos;
+- startup-profile.folded: pilhas "a;b;c <µs>" para flamegraph.pl/speedscope;
+- startup-profile.json: Trace Event Format (chrome://tracing, Perfetto).
+
+O profiler é ativado na importação de engine quando --profile-startup está
+em sys.argv; desativado, span() não custa mais que um if.
+"""
+from contextlib import contextmanager
+from pathlib import Path
+import atexit
+import json
+import sys
+import threading
+import time
+
+FLAG = "--profile-startup"
+
+
+class Span:
+    """Intervalo medido: nome, fase (category), início/fim em segundos e filhos."""
+    def __init__(self, name: str, category: str, start: float, parent: "Span | None", thread: str) -> None:
+        self.name: str = name
+        self.category: str = category
+        self.start: float = start
+        self.end: float | None = None
+        self.parent: Span | None = parent
+        self.thread: str = thread
+        self.children: list[Span] = []
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @property
+    def self_time(self) -> float:
+        return max(self.duration - sum(child.duration for child in self.children), 0.0)
+
+    def stack(self) -> list[str]:
+        names = []
+        span = self
+        while span:
+            names.append(span.name.replace(";", ","))
+            span = span.parent
+        return names[::-1]
+
+
+class _ImportTimer:
+    """
+    Finder de sys.meta_path que mede a execução dos módulos importados.
+    Não encontra nada por conta própria: delega aos demais finders e só
+    envolve o exec_module da instância de loader devolvida.
+    """
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self.profiler = profiler
+        self._resolving = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._resolving, "active", False):
+            return None
+        self._resolving.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._resolving.active = False
+
+        loader = spec.loader
+        # loaders de classe (builtins/frozen) são compartilhados: não são medidos
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        exec_module = loader.exec_module
+        if getattr(exec_module, "_profiled", False):
+            return spec
+
+        def timed_exec_module(module, _exec=exec_module, _name=fullname):
+            with self.profiler.span(_name, "import"):
+                _exec(module)
+
+        timed_exec_module._profiled = True
+        try:
+            loader.exec_module = timed_exec_module
+        except (AttributeError, TypeError):
+            pass
+        return spec
+
+
+class StartupProfiler:
+    """
+    Coletor de spans da inicialização.
+
+    Uso básico:
+
+        with profiler.span("route walk", "route"):
+            ...
+        profiler.finish()  # grava os relatórios (uma única vez)
+    """
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.started_at: float = time.perf_counter()
+        self.finished: bool = False
+        self.output_dir: Path = Path(".cache")
+        self.roots: list[Span] = []
+        self.marks: list[tuple[str, float]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._import_timer: _ImportTimer | None = None
+
+    def enable(self) -> None:
+        """Começa a medir a partir de agora, incluindo as importações seguintes."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started_at = time.perf_counter()
+        self._import_timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._import_timer)
+        atexit.register(self.finish)
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+
+    def _stack(self) -> list[Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, category: str = "app"):
+        """Mede o bloco como um span filho do span aberto na mesma thread."""
+        if not self.enabled:
+            yield None
+            return
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = Span(name, category, time.perf_counter(), parent, threading.current_thread().name)
+        if parent:
+            parent.children.append(span)
+        else:
+            with self._lock:
+                self.roots.append(span)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+
+    def mark(self, name: str) -> None:
+        """Registra um instante (ex.: primeiro frame)."""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter()))
+
+    def spans(self) -> list[Span]:
+        """Todos os spans, em profundidade."""
+        result, pending = [], list(reversed(self.roots))
+        while pending:
+            span = pending.pop()
+            result.append(span)
+            pending.extend(reversed(span.children))
+        return result
+
+    def folded(self) -> str:
+        """Pilhas no formato "collapsed" (self time em microssegundos)."""
+        totals: dict[str, int] = {}
+        for span in self.spans():
+            key = ";".join([span.thread, *span.stack()])
+            totals[key] = totals.get(key, 0) + int(span.self_time * 1_000_000)
+        return "\n".join(f"{stack} {micros}" for stack, micros in totals.items() if micros > 0) + "\n"
+
+    def trace(self) -> dict:
+        """Eventos no Trace Event Format (ph "X" = duração, "i" = instante)."""
+        threads = {name: index for index, name in enumerate(sorted({span.thread for span in self.spans()}))}
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start - self.started_at) * 1_000_000,
+                "dur": span.duration * 1_000_000,
+                "pid": 1,
+                "tid": threads[span.thread],
+            }
+            for span in self.spans()
+        ]
+        events.extend(
+            {"name": name, "ph": "i", "s": "g", "ts": (at - self.started_at) * 1_000_000, "pid": 1, "tid": 0}
+            for name, at in self.marks
+        )
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for name, tid in threads.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def report(self, top: int = 25) -> str:
+        """Resumo legível: marcos, tempo por fase (self time) e spans mais lentos."""
+        spans = self.spans()
+        lines = ["Perfil de inicialização", "=" * 60]
+        for name, at in self.marks:
+            lines.append(f"{name:<40} {(at - self.started_at) * 1000:>10.1f} ms")
+
+        lines += ["", "Tempo por fase (self time)", "-" * 60]
+        phases: dict[str, float] = {}
+        for span in spans:
+            phases[span.category] = phases.get(span.category, 0.0) + span.self_time
+        for category, seconds in sorted(phases.items(), key=lambda item: -item[1]):
+            lines.append(f"{category:<40} {seconds * 1000:>10.1f} ms")
+
+        lines += ["", f"{top} spans mais lentos (total / self)", "-" * 60]
+        for span in sorted(spans, key=lambda s: -s.duration)[:top]:
+            lines.append(f"{span.duration * 1000:>9.1f} ms {span.self_time * 1000:>9.1f} ms  [{span.category}] {span.name}")
+        return "\n".join(lines) + "\n"
+
+    def finish(self) -> Path | None:
+        """
+        Encerra a coleta e grava os três relatórios em output_dir.
+        Chamado no primeiro frame renderizado (ou na saída do processo).
+        """
+        with self._lock:
+            if not self.enabled or self.finished:
+                return None
+            self.finished = True
+        self.mark("fim do perfil")
+        self.disable()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / "startup-profile"
+        base.with_suffix(".txt").write_text(self.report(), encoding="utf-8")
+        base.with_suffix(".folded").write_text(self.folded(), encoding="utf-8")
+        base.with_suffix(".json").write_text(json.dumps(self.trace()), encoding="utf-8")
+        from engine.log import get_logger
+        get_logger(__name__).info("profile-startup: relatório gravado em %s", base.with_suffix(".txt"))
+        return base.with_suffix(".txt")
+
+
+# Instância global do profiler
+profiler = StartupProfiler()
+
+if FLAG in sys.argv:
+    profiler.enable()
+
+
+__all__ = ["Span", "StartupProfiler", "profiler"]
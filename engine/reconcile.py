@@ -0,0 +1,201 @@
+"""
+Módulo reconcile: reconciliação da árvore de controles antes do ctx.update().
+
+O Flet compara os filhos de cada controle por identidade: um controle novo
+(mesmo que igual ao anterior) é removido e adicionado inteiro no cliente.
+Como page/layouts criam controles novos a cada build, toda navegação
+enviava a página completa pelo websocket.
+
+reconcile(parent) compara os filhos pendentes de parent com os que o cliente
+já tem e, para cada par equivalente, faz o controle novo "adotar" o id do
+antigo: apenas os atributos alterados e as subárvores diferentes são
+enviados no próximo update. Os controles novos continuam sendo os objetos
+montados, então referências guardadas pelas páginas seguem válidas.
+
+Pares equivalentes:
+- mesmo tipo e mesma `key` (ft.Control(key=...));
+- sem key, mesmo tipo na mesma ordem entre os irmãos sem key.
+
+Controles substituídos saem da página: o antigo de cada par adotado perde
+id e page na hora (o id agora é do novo) e os filhos antigos sem par,
+removidos pelo Flet no update, são soltos por release() depois do envio.
+Assim um update() em um controle de página oculta não altera o que está
+na tela (e `control.page is None` indica que ele saiu da página).
+
+Depende do estado interno do Flet (id, atributos enviados e filhos
+anteriores de cada controle), escrito sobre o Flet 0.25.2 (versão fixada no
+requirements.txt); se ele não estiver disponível, nada é adotado, o update
+segue o comportamento padrão do Flet e um aviso é registrado no log.
+"""
+import flet as ft
+
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+# o aviso de estado interno ausente é registrado uma única vez
+_warned = False
+
+
+def _state(control: ft.Control) -> tuple[dict, list] | None:
+    """Atributos e filhos anteriores (já enviados ao cliente) do controle."""
+    global _warned
+    try:
+        return control._Control__attrs, control._Control__previous_children
+    except AttributeError:
+        if not _warned:
+            _warned = True
+            logger.warning(
+                "Estado interno do Flet indisponível em %s: a reconciliação está desativada "
+                "e cada navegação reenvia a página inteira (escrito para o Flet 0.25.2)",
+                type(control).__name__,
+            )
+        return None
+
+
+def _detach(control: ft.Control) -> None:
+    control._Control__uid = None
+    control.page = None
+
+
+def release(controls: list[ft.Control], index: dict) -> None:
+    """
+    Solta controles que saíram da página (id e page = None), com as
+    subárvores. Controles ainda montados (presentes no índice) são mantidos.
+    Chame depois do update que os removeu.
+    """
+    stack = list(controls)
+    while stack:
+        control = stack.pop()
+        uid = control.uid
+        if uid and index.get(uid) is control:
+            continue
+        if control.page is None and not uid:
+            continue
+        _detach(control)
+        state = _state(control)
+        stack.extend(control._get_children())
+        if state is not None:
+            stack.extend(state[1])
+
+
+def _adoptable(control: ft.Control) -> bool:
+    # controles isolados e com build() próprio controlam a própria subárvore
+    return not control.is_isolated() and type(control).build is ft.Control.build
+
+
+def _key(control: ft.Control):
+    return getattr(control, "key", None)
+
+
+def _pairs(previous: list[ft.Control], current: list[ft.Control]) -> list[tuple[ft.Control, ft.Control]]:
+    """Pares (antigo, novo) equivalentes entre os filhos enviados e os pendentes."""
+    kept = {id(control) for control in previous} & {id(control) for control in current}
+    previous = [control for control in previous if id(control) not in kept]
+    current = [control for control in current if id(control) not in kept]
+
+    pairs = []
+    keyed = {
+        (type(control), _key(control)): control
+        for control in previous
+        if _key(control) is not None
+    }
+    for control in current:
+        if _key(control) is not None:
+            match = keyed.pop((type(control), _key(control)), None)
+            if match is not None:
+                pairs.append((match, control))
+
+    unkeyed_previous = [control for control in previous if _key(control) is None]
+    unkeyed_current = [control for control in current if _key(control) is None]
+    for old, new in zip(unkeyed_previous, unkeyed_current):
+        if type(old) is type(new):
+            pairs.append((old, new))
+    return pairs
+
+
+def _adopt(old: ft.Control, new: ft.Control, index: dict, page: ft.Page, stale: list[ft.Control]) -> int:
+    """
+    Faz new assumir o lugar de old no cliente. Retorna quantos controles da
+    subárvore foram reaproveitados (0 quando o par não pode ser adotado).
+    """
+    old_state, new_state = _state(old), _state(new)
+    uid = old.uid
+    if old_state is None or new_state is None or not uid or not _adoptable(old) or not _adoptable(new):
+        return 0
+    # new já está montado em outro ponto da árvore: o Flet o move
+    if new.uid and index.get(new.uid) is new:
+        return 0
+
+    new.page = page
+    new.parent = old.parent
+    new._before_build_command()
+
+    old_attrs, old_previous = old_state
+    new_attrs, _ = new_state
+    for name, (value, _) in list(new_attrs.items()):
+        if name == "id":
+            continue
+        sent = old_attrs.get(name)
+        new_attrs[name] = (value, sent is None or sent[0] != value)
+    for name, (value, _) in old_attrs.items():
+        if name not in new_attrs and name != "id" and value not in (None, ""):
+            new_attrs[name] = ("", True)
+
+    new._Control__uid = uid
+    index[uid] = new
+    # old deixa de apontar para o id adotado: update() nele não envia nada
+    _detach(old)
+
+    return 1 + reconcile_children(new, old_previous, index, page, stale)
+
+
+def reconcile_children(
+    parent: ft.Control,
+    previous: list[ft.Control],
+    index: dict,
+    page: ft.Page,
+    stale: list[ft.Control],
+) -> int:
+    """
+    Adota os filhos equivalentes de parent e ajusta os filhos anteriores.
+    Os filhos anteriores que não foram adotados nem mantidos vão para stale.
+    """
+    state = _state(parent)
+    if state is None:
+        return 0
+    current = parent._get_children()
+    adopted = 0
+    replaced: dict[int, ft.Control] = {}
+    for old, new in _pairs(previous, current):
+        count = _adopt(old, new, index, page, stale)
+        if count:
+            replaced[id(old)] = new
+            adopted += count
+
+    kept = {id(control) for control in current}
+    stale.extend(control for control in previous if id(control) not in replaced and id(control) not in kept)
+
+    parent_previous = state[1]
+    parent_previous[:] = [replaced.get(id(control), control) for control in previous]
+    return adopted
+
+
+def reconcile(parent: ft.Control, page: ft.Page | None = None, stale: list[ft.Control] | None = None) -> int:
+    """
+    Reconcilia os filhos pendentes de parent (ex.: ctx.views[0], que contém
+    appbar e controls) com os já enviados. Chame imediatamente antes do
+    update. Retorna quantos controles foram reaproveitados.
+
+    stale recebe os controles que o update vai remover; passe-os para
+    release() depois do update.
+    """
+    page = page or parent.page
+    index = getattr(page, "index", None)
+    state = _state(parent)
+    if state is None or index is None or not parent.uid:
+        return 0
+    return reconcile_children(parent, list(state[1]), index, page, stale if stale is not None else [])
+
+
+__all__ = ["reconcile", "release"]
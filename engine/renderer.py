@@ -11,6 +11,13 @@ from engine.router import Router
 from engine.route import Route
 from engine.route import BaseRouteProps, RouteBuilder
 from engine.router import RouterSearchbar
+from engine.executor import CancellationToken
+from engine.session import Session, SessionRegistry
+from engine.page_cache import PageCache
+from engine.reconcile import reconcile, release
+from engine.profiler import profiler
+from engine.metrics import RenderEvent, RenderHooks, metrics, count_controls
+import time
 
 def match_dynamic_segments(path_template: str, resolved_path: str) -> dict:
     keys = path_template.strip("/").split("/")
@@ -22,10 +29,39 @@ def match_dynamic_segments(path_template: str, resolved_path: str) -> dict:
     }
     
 class Renderer(IRenderer): 
-    def __init__(self, searchbar: RouterSearchbar) -> None:
+    """
+    Renderiza rotas em um ft.Page.
+    A instância criada pelo App é o modelo: cada conexão recebe sua própria
+    cópia via for_session (ctx, searchbar e build em andamento exclusivos).
+    """
+    def __init__(self, searchbar: RouterSearchbar, page_cache_size: int = 16) -> None:
         super().__init__()
         self._searchbar = searchbar
         self.ctx: ft.Page = None
+        # token do build em andamento; cancelado a cada nova navegação
+        self._token: CancellationToken | None = None
+        # sessões ativas (apenas no renderer modelo)
+        self.sessions: SessionRegistry = SessionRegistry()
+        # before_render/after_render, compartilhados com os renderers das sessões
+        self.hooks: RenderHooks = RenderHooks()
+        # páginas já montadas da sessão (page_cache_size = 0 desativa)
+        self.page_cache: PageCache = PageCache(max_entries=page_cache_size)
+        
+    def for_session(self, ctx: ft.Page) -> "Renderer":
+        """
+        Cria o renderer de uma sessão: novo searchbar (um controle só pode
+        estar em uma página) e ctx próprio.
+        """
+        renderer = Renderer(searchbar=type(self._searchbar)(), page_cache_size=self.page_cache.max_entries)
+        renderer.sessions = self.sessions
+        renderer.hooks = self.hooks
+        renderer.ctx = ctx
+        return renderer
+    
+    def dispose(self) -> None:
+        """Cancela o build pendente da sessão encerrada."""
+        if self._token:
+            self._token.cancel()
         
     
     def ensure_ctx(self) -> bool:
@@ -35,35 +71,174 @@ class Renderer(IRenderer):
     
     def clear(self) -> None:
         if self.ensure_ctx():
+            # builds pendentes pertencem à página que está sendo removida
+            if self._token:
+                self._token.cancel()
             self.ctx.controls.clear()
     
     def mount_default_layout(self, router: Router) -> None:
+        """
+        Garante o RouterSearchbar como primeiro controle do ctx. O searchbar
+        permanece montado entre navegações; o envio acontece no próximo commit.
+        """
         if self.ensure_ctx():
             searchbar = self._searchbar.mount(self.ctx, router, bar_hint_text=router.url)
-            self.ctx.add(searchbar)  # Adiciona o RouterSearchbar antes de qualquer operação
-            searchbar.update()  # Garante que o controle seja atualizado corretamente
+            if not self.ctx.controls or self.ctx.controls[0] is not searchbar:
+                self.ctx.controls.insert(0, searchbar)
+    
+    def _layout_controls(self) -> list[ft.Control]:
+        """Controles compartilhados entre páginas (o searchbar), já no ctx."""
+        return [control for control in self.ctx.controls[:1] if control is self._searchbar]
+    
+    def _page_controls(self) -> list[ft.Control]:
+        """Controles da página atual (depois dos compartilhados)."""
+        return self.ctx.controls[len(self._layout_controls()):]
+    
+    def commit(self) -> int:
+        """
+        Envia as mudanças pendentes do ctx em um único update. Antes do envio
+        os controles novos equivalentes aos já exibidos (mesma key ou mesmo
+        tipo e posição) assumem o lugar deles (engine.reconcile), então só as
+        subárvores alteradas trafegam. Os controles que saíram da página são
+        soltos depois do envio (page = None). Retorna quantos controles foram
+        reaproveitados.
+        """
+        views = getattr(self.ctx, "views", None)
+        stale: list[ft.Control] = []
+        reused = reconcile(views[0], self.ctx, stale) if views else 0
+        self.ctx.update()
+        index = getattr(self.ctx, "index", None)
+        if stale and index is not None:
+            release(stale, index)
+        if reused:
+            metrics.increment("reused_controls", reused)
+        return reused
+    
+    def mount(self, controls: list[ft.Control]) -> None:
+        """
+        Substitui o conteúdo da página (mantendo o searchbar) e faz o commit.
+        Um build pendente é cancelado.
+        """
+        if self.ensure_ctx():
+            if self._token:
+                self._token.cancel()
+            self.ctx.controls[:] = [*self._layout_controls(), *controls]
+            self.commit()
         
-    def render_route(self, router: Router, route: Route) -> None:
+    def refresh_searchbar(self, router: Router) -> None:
+        """
+        Reconstrói a lista do searchbar (ex.: após hot-reload da tabela de rotas)
+        sem remontar a página.
+        """
+        if self.ctx is None:
+            return
+        self._searchbar.mount(self.ctx, router, bar_hint_text=router.url)
+        if self._searchbar.page:
+            self._searchbar.update()
+        
+    def render_route(self, router: Router, route: Route, params: dict | None = None, started_at: float | None = None) -> None:
+        """
+        Monta a rota de forma assíncrona: o skeleton (barra de progresso) é
+        exibido imediatamente sobre a página atual, que é reconciliada com os
+        controles da nova página quando o build terminar.
+        Um build anterior ainda em andamento é cancelado.
+        Páginas já visitadas com os mesmos parâmetros vêm do PageCache da
+        sessão, sem skeleton nem build.
+        Cada navegação gera um RenderEvent, entregue aos ganchos e às métricas.
+        """
         if self.ensure_ctx():
-            self.ctx.add(*RouteBuilder.build(
-                    route, 
-                    BaseRouteProps(
-                        ctx=self.ctx, 
-                        router=router, 
-                        props=match_dynamic_segments(route.name, router.url)
-                    )
-                )
+            event = RenderEvent(
+                router.url, 
+                route.name, 
+                session_id=getattr(self.ctx, "session_id", None), 
+                started_at=started_at,
+            )
+            self.hooks.call(self.hooks.before_render, event)
+
+            if self._token:
+                self._token.cancel()
+            token = self._token = CancellationToken()
+            
+            if params is None:
+                params = (router.match(router.url) or (route, {}))[1]
+            
+            # route.cacheable só é lido no swap: com páginas lazy, ler o módulo aqui
+            # importaria o page.py na thread da UI; o cache só guarda páginas cacheáveis
+            cache_key = PageCache.key(route.name, params)
+            entry = self.page_cache.get(cache_key) if self.page_cache.max_entries > 0 else None
+            if entry is not None:
+                self._render_cached(entry, event)
+                return
+            
+            props = BaseRouteProps(
+                ctx=self.ctx, 
+                router=router, 
+                props=params,
+                token=token,
             )
+            # o skeleton entra no ctx antes do agendamento para não competir com o swap;
+            # a página anterior continua montada para ser reconciliada com a nova
+            skeleton = RouteBuilder.skeleton(props)
+            page_controls = [control for control in self._page_controls() if getattr(control, "key", None) != RouteBuilder.SKELETON_KEY]
+            self.ctx.controls[:] = [*self._layout_controls(), *skeleton, *page_controls]
+            self.commit()
+            
+            def swap(controls: list[ft.Control]) -> None:
+                # a página mudou enquanto o build rodava: descarta o resultado
+                if token.cancelled:
+                    metrics.increment("cancelled_renders")
+                    return
+                self.ctx.controls[:] = [*self._layout_controls(), *controls]
+                started = time.perf_counter()
+                self.commit()
+                finished = time.perf_counter()
+                if profiler.enabled:
+                    profiler.mark("primeiro frame")
+                    profiler.finish()
+                
+                event.timings["update"] = finished - started
+                event.timings["navigation"] = finished - event.started_at
+                event.controls = count_controls(controls)
+                # o build já carregou o page.py na thread de trabalho
+                if not event.error and self.page_cache.max_entries > 0 and route.cacheable:
+                    self.page_cache.put(cache_key, route.name, controls, title=self.ctx.title, ttl=route.cache_ttl())
+                metrics.record_render(event)
+                self.hooks.call(self.hooks.after_render, event)
+            
+            RouteBuilder.build_async(route, props, on_ready=swap, event=event)
     
-    def _render(self, ctx: ft.Page, router: Router) -> ft.Page:
-        self.ctx = ctx
+    def _render_cached(self, entry, event: RenderEvent) -> None:
+        """Remonta os controles guardados de uma página já visitada."""
+        if entry.title:
+            self.ctx.title = entry.title
+        self.ctx.controls[:] = [*self._layout_controls(), *entry.controls]
+        started = time.perf_counter()
+        self.commit()
+        finished = time.perf_counter()
         
-        self.clear()
-        self.mount_default_layout(router)
-        
-        route = router.get_route(router.url)
-        self.render_route(router, route)
+        event.cached = True
+        event.timings["update"] = finished - started
+        event.timings["navigation"] = finished - event.started_at
+        event.controls = count_controls(entry.controls)
+        metrics.record_render(event)
+        self.hooks.call(self.hooks.after_render, event)
+    
+    def _render(self, ctx: ft.Page, router: Router) -> Session:
+        """
+        Ponto de entrada de cada conexão: cria renderer e router da sessão
+        (compartilhando a tabela de rotas) e monta a rota inicial.
+        """
+        with profiler.span("render session", "render"):
+            renderer = self.for_session(ctx)
+            session = self.sessions.open(ctx, renderer, router.for_session(renderer))
+            
+            renderer.clear()
+            renderer.mount_default_layout(session.router)
+            
+            matched = session.router.match(session.router.url)
+            if matched:
+                renderer.render_route(session.router, *matched)
+        return session
         
-    def run(self, router: Router):
-        ft.app(lambda ctx, rt=router:self._render(ctx, rt), host="localhost", port=8080)
-
+    def run(self, router: Router, host: str = "localhost", port: int = 8080):
+        ft.app(lambda ctx, rt=router:self._render(ctx, rt), host=host, port=port)
@@ -1,8 +1,14 @@
 
+import copy
 from pathlib import Path                
-from engine.modules import Module     
+from engine.modules import Module, LazyModule
 from engine.interface import IRoute
 from engine.route.route_props import BaseRouteProps
+from engine.memo import static_params_cache
+from engine.profiler import profiler
+from engine.log import get_logger
+
+logger = get_logger(__name__)
 
 class RouteLevel:
     def __init__(self, level: int = 0) -> None:
@@ -14,32 +20,142 @@ class RoutePath:
         self.segments: list[str] = path.split("/")
 
 
+def is_dynamic_segment(segment: str) -> bool:
+    """Indica se o segmento de rota é dinâmico (ex.: [script])."""
+    return segment.startswith("[") and segment.endswith("]")
+
+
 class Route(IRoute):
     """
     Implementa IPage para carregar e renderizar:
     - Subdiretórios contendo page.py, layout.py, not_found.py
     - Fallback em caso de erro de renderização
+
+    Com lazy=True os arquivos não são executados na construção: a rota só
+    registra os caminhos e cada módulo é importado no primeiro uso
+    (RouteBuilder.build) ou por preload() durante o warm-up.
+
+    generate_static_params e generate_metadata são memoizados em
+    engine.memo.static_params_cache pelo caminho do page.py: rotas que
+    compartilham a página (visões expandidas, reconstruções) executam a
+    função uma única vez. Um page.py pode definir `revalidate = <segundos>`
+    para dar validade aos resultados.
     """
-    def __init__(self, dir: Path, name:str=None) -> None:
+    def __init__(
+        self, 
+        dir: Path, 
+        name:str=None, 
+        lazy: bool = False,
+        files: set[str] | None = None,
+        static_params: list[BaseRouteProps] | None = None,
+    ) -> None:
+        """
+        Args:
+            dir: Diretório da rota
+            name: Nome (caminho) da rota
+            lazy: Se True, adia a importação dos módulos até o primeiro uso
+            files: Arquivos de rota presentes no diretório (ex.: vindos do
+                   RouteManifest); evita as chamadas exists() quando informado
+            static_params: Parâmetros estáticos já resolvidos (cache); evita
+                           chamar generate_static_params na construção
+        """
+        with profiler.span(f"route {name}", "route"):
+            self._initialize(dir, name, lazy, files, static_params)
+
+    def _initialize(self, dir: Path, name: str, lazy: bool, files: set[str] | None, static_params: list[BaseRouteProps] | None) -> None:
         page_py=dir / "page.py"            # script principal da página
         layout_py=dir / "layout.py"        # define layout custom
         not_found_py=dir / "not_found.py"  # define página de erro
         
-        print(f"---> route: {name}")
-        print(f"[page_py] {page_py.exists()}")
-        print(f"[layout_py] {layout_py.exists()}")
-        print(f"[not_found_py] {not_found_py.exists()}")
-        print(f"--------------------------")
+        has_page = page_py.name in files if files is not None else page_py.exists()
+        has_layout = layout_py.name in files if files is not None else layout_py.exists()
+        has_not_found = not_found_py.name in files if files is not None else not_found_py.exists()
+        
+        # amostrado (engine.log.route_sampling) e ignorado abaixo de DEBUG
+        logger.debug("rota %s: page=%s layout=%s not_found=%s", name, has_page, has_layout, has_not_found)
+
+        self.lazy: bool = lazy
+        module_cls = LazyModule if lazy else Module
 
         super().__init__(
             name=name,
             dir=dir, 
-            page=Module(path=page_py, main="page", funcs=["generate_static_params", "generate_metadata"]) if page_py.exists() else None,
-            layout=Module(path=layout_py, main="layout", funcs=[]) if layout_py.exists() else None,
-            not_found=Module(path=not_found_py, main="not_found", funcs=[]) if not_found_py.exists() else None,
+            page=module_cls(path=page_py, main="page", funcs=["generate_static_params", "generate_metadata"]) if has_page else None,
+            layout=module_cls(path=layout_py, main="layout", funcs=[]) if has_layout else None,
+            not_found=module_cls(path=not_found_py, main="not_found", funcs=[]) if has_not_found else None,
         ) 
-        self.generate_static_params()
+        if static_params is not None:
+            self.static_params = static_params
+        elif self.needs_static_params:
+            self.generate_static_params()
+
+    @property
+    def is_dynamic(self) -> bool:
+        """Indica se o último segmento do diretório da rota é dinâmico."""
+        return is_dynamic_segment(self.dir.name)
+
+    @property
+    def needs_static_params(self) -> bool:
+        """
+        Indica se a rota resolve generate_static_params na inicialização.
+        No modo lazy apenas rotas dinâmicas precisam do page.py tão cedo.
+        """
+        return not self.lazy or self.is_dynamic
 
+    def view(self, name: str) -> "Route":
+        """
+        Cria uma visão leve da rota com outro nome (ex.: caminho expandido).
+        Compartilha diretório, módulos, pai e parâmetros estáticos com a rota
+        modelo, sem reler arquivos nem chamar generate_static_params.
+        """
+        route = copy.copy(self)
+        route.name = name
+        return route
+
+    def preload(self) -> None:
+        """
+        Importa os módulos ainda não carregados da rota (warm-up).
+        Erros são apenas reportados: a rota volta a tentar no build.
+        """
+        for module in (self.page, self.layout, self.not_found):
+            if isinstance(module, LazyModule):
+                try:
+                    module.ensure_loaded()
+                except Exception:
+                    logger.exception("Falha ao pré-carregar %s", module.path)
+
+    @property
+    def memo_tag(self) -> str | None:
+        """Tag das entradas memoizadas desta página (caminho absoluto do page.py)."""
+        return str(self.page.path.absolute()) if self.page else None
+
+    @property
+    def static_params_key(self) -> tuple[str, str] | None:
+        return ("generate_static_params", self.memo_tag) if self.page else None
+
+    def revalidate(self) -> float | None:
+        """Validade dos resultados memoizados definida no page.py (revalidate), se houver."""
+        value = getattr(self.page.module, "revalidate", None) if self.page else None
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+    @property
+    def cacheable(self) -> bool:
+        """Se a página montada pode ser guardada no PageCache (cache = False no page.py desativa)."""
+        return getattr(self.page.module, "cache", True) is not False if self.page else True
+
+    @property
+    def dynamic_params(self) -> bool:
+        """
+        Se caminhos fora de generate_static_params são aceitos nos segmentos
+        dinâmicos (dynamic_params = True no page.py). Por padrão só os
+        caminhos gerados são navegáveis.
+        """
+        return getattr(self.page.module, "dynamic_params", False) is True if self.page else False
+
+    def cache_ttl(self) -> float | None:
+        """Validade da página no PageCache definida no page.py (cache = <segundos>), se houver."""
+        value = getattr(self.page.module, "cache", None) if self.page else None
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
 
     def generate_static_params(self) -> list[BaseRouteProps]:
         """
@@ -51,8 +167,39 @@ class Route(IRoute):
             if not func or not callable(func): 
                 return []
             
-            result = func()
+            def compute():
+                with profiler.span(f"generate_static_params {self.name}", "static_params"):
+                    return func()
+
+            result = static_params_cache.get_or_compute(
+                self.static_params_key,
+                compute,
+                ttl=self.revalidate(),
+                tags=[self.memo_tag, "generate_static_params"],
+            )
             if isinstance(result, list):
                 self.static_params = result
                 return result
-        return []
\ No newline at end of file
+        return []
+
+    def generate_metadata(self, props: BaseRouteProps) -> dict:
+        """
+        Metadados da página (ex.: {"title": ...}) para os parâmetros de props,
+        memoizados por página e parâmetros. Erros são reportados e resultam
+        em metadados vazios.
+        """
+        if not self.page or not callable(self.page.funcs.get("generate_metadata")):
+            return {}
+        func = self.page.funcs["generate_metadata"]
+        key = ("generate_metadata", self.memo_tag, tuple(sorted((k, repr(v)) for k, v in props.props.items())))
+        try:
+            result = static_params_cache.get_or_compute(
+                key,
+                lambda: func(props),
+                ttl=self.revalidate(),
+                tags=[self.memo_tag, "generate_metadata"],
+            )
+        except Exception:
+            logger.exception("Falha em generate_metadata de %s", self.page.path)
+            return {}
+        return result if isinstance(result, dict) else {}
@@ -1,6 +1,12 @@
 import flet as ft 
+from typing import Callable
+from concurrent.futures import Future
 from engine.interface import IRoute
 from engine.route import BaseRouteProps
+from engine.executor import executor
+from engine.profiler import profiler
+from engine.metrics import RenderEvent
+import time
 
 def default_layout(props: BaseRouteProps) -> list[ft.Control]:
     """
@@ -24,6 +30,9 @@ def default_error(props: BaseRouteProps) -> list[ft.Control]:
     ]
 
 class RouteBuilder:
+    # key do skeleton, para o renderer separá-lo dos controles da página
+    SKELETON_KEY = "route-skeleton"
+
     @staticmethod
     def _retrieve_page(route: "IRoute"):
         if route.page is not None and route.page.main is not None:
@@ -59,38 +68,76 @@ class RouteBuilder:
         return result
 
     @staticmethod
-    def build(route: "IRoute", props: BaseRouteProps) -> list[ft.Control]:
+    def build(route: "IRoute", props: BaseRouteProps, event: RenderEvent | None = None) -> list[ft.Control]:
+        """
+        Executa a página e aplica a pilha de layouts de forma síncrona.
+        Em caso de erro devolve a página de erro da rota.
+        O título de generate_metadata, se houver, é atribuído a ctx.title.
+        Com event, registra os tempos da página ("page") e dos layouts ("layout").
+        """
+        with profiler.span(f"build {route.name}", "render"):
+            return RouteBuilder._build(route, props, event)
+
+    @staticmethod
+    def _build(route: "IRoute", props: BaseRouteProps, event: RenderEvent | None = None) -> list[ft.Control]:
         ctx = props.ctx
         router = props.router
-        page_fn = RouteBuilder._retrieve_page(route)
         
         try:
-            first = ctx.controls[0]
-            ctx.controls.clear()
-            
-            loader = ft.Column([
-                ft.ProgressBar(width=ctx.width, height=5),
-                ft.Container(expand=True)
-            ], expand=True)
-            
-            ctx.add(loader)
-            ctx.update()
-            
-            controls = [*page_fn(props)]
-            
-            ctx.remove(loader)
-            ctx.add(first)
+            # dentro do try: com rotas lazy, é aqui que o page.py é importado
+            page_fn = RouteBuilder._retrieve_page(route)
+            started = time.perf_counter()
+            controls = page_fn(props)
+            if event:
+                event.timings["page"] = time.perf_counter() - started
             
             if controls is None:
-                controls = route.not_found.main(BaseRouteProps(ctx, router, props={"error": "Page not found"}))
-            result = RouteBuilder._assemble_layout_stack(route, BaseRouteProps(ctx, router, controls))
+                if event:
+                    event.error = "Page not found"
+                return RouteBuilder.error(route, BaseRouteProps(ctx, router, props={"error": "Page not found"}))
+            started = time.perf_counter()
+            result = RouteBuilder._assemble_layout_stack(route, BaseRouteProps(ctx, router, [*controls], props=props.props))
+            if event:
+                event.timings["layout"] = time.perf_counter() - started
             if not result: 
-                result = route.not_found.main(BaseRouteProps(ctx, router, props={"error": "Page not found"}))
+                if event:
+                    event.error = "Page not found"
+                return RouteBuilder.error(route, BaseRouteProps(ctx, router, props={"error": "Page not found"}))
             
+            # aplicado no próximo ctx.update() (o swap do renderer)
+            title = route.generate_metadata(props).get("title")
+            if title and ctx:
+                ctx.title = str(title)
             return [*result]
         except Exception as e:
-            # return [*parent_layout(BaseRouteProps(ctx, router, [*layout_fn(BaseRouteProps(ctx, router, [*route.not_found.main(BaseRouteProps(ctx,router, props={"error build": str(e)}))]))] ))]
+            if event:
+                event.error = f"{type(e).__name__}: {e}"
             return [*RouteBuilder.error(route, BaseRouteProps(ctx, router, props={"error": "erro no build: " + str(e)}))]
+
+    @staticmethod
+    def skeleton(props: BaseRouteProps) -> list[ft.Control]:
+        """
+        Controles exibidos imediatamente enquanto a página é construída.
+        Ficam acima da página atual, que permanece montada até o swap.
+        """
+        return [
+            ft.ProgressBar(key=RouteBuilder.SKELETON_KEY, width=props.ctx.width, height=5),
+        ]
+
+    @staticmethod
+    def build_async(
+        route: "IRoute", 
+        props: BaseRouteProps, 
+        on_ready: Callable[[list[ft.Control]], None],
+        event: RenderEvent | None = None,
+    ) -> Future:
+        """
+        Agenda o build da rota no executor.
+        on_ready recebe os controles finais (roda na thread de trabalho) e não
+        é chamado se props.token for cancelado antes do fim do build.
+        Exiba RouteBuilder.skeleton(props) antes de agendar.
+        """
+        return executor.submit(RouteBuilder.build, route, props, event, on_done=on_ready, token=props.token)
     
     @staticmethod
     def error(route: "IRoute", props: BaseRouteProps) -> list[ft.Control]:
@@ -1,8 +1,16 @@
 from engine.interface import IRouteGenerator
 from engine.route import Route
+from engine.route.route_manifest import RouteManifest
+from engine.route.route_trie import RouteTrie
 from pathlib import Path
 from engine.route.route_props import BaseRouteProps
 from engine.env import blacklist
+from engine.memo import static_params_cache
+from engine.profiler import profiler
+import threading
+from engine.log import get_logger
+
+logger = get_logger(__name__)
 
 
 def expand_static_params(param_groups: list[BaseRouteProps]) -> list[str]:
@@ -26,12 +34,146 @@ def expand_static_params(param_groups: list[BaseRouteProps]) -> list[str]:
   return segments
 
 class RouteGenerator(IRouteGenerator):
-  def __init__(self, root: Route):
+  """
+  Gera a tabela de rotas a partir da estrutura de diretórios.
+  
+  Args:
+      root: Rota raiz (define diretório, tipo de rota e modo lazy)
+      manifest: Manifesto opcional para pular diretórios inalterados
+      pre_expand: Se True, cria uma rota concreta por parâmetro estático
+                  (comportamento antigo); por padrão rotas dinâmicas são
+                  casadas na navegação pela RouteTrie
+  """
+  def __init__(self, root: Route, manifest: RouteManifest = None, pre_expand: bool = False):
     super().__init__(root)
     self.routes = {}
-    self.initialize_route_structure(self.root.dir)
+    self.pre_expand: bool = pre_expand
+    # caminhos concretos gerados pelos parâmetros estáticos -> rota modelo
+    self.static_paths: dict[str, Route] = {}
+    # manifesto opcional: evita percorrer diretórios que não mudaram
+    self.manifest: RouteManifest | None = manifest.load() if manifest else None
+    # índice de busca dos caminhos (engine.router.search_index), criado pelo Router
+    self.search_index = None
+    self.build()
+
+  def build(self):
+    """(Re)constrói toda a tabela de rotas a partir do diretório raiz."""
+    # mantém o mesmo dicionário: routers das sessões guardam a referência
+    self.routes.clear()
+    self.static_paths = {}
+    with profiler.span("route walk", "route"):
+      self.initialize_route_structure(self.root.dir)
+      if self.manifest:
+        self.manifest.save()
+      self.establish_route_hierarchy()
+    with profiler.span("static params", "static_params"):
+      self.process_all_static_params()
+    with profiler.span("route trie", "route"):
+      self.trie: RouteTrie = RouteTrie.from_routes(self.routes)
+
+  def refresh(self, changed: list[Path]):
+    """
+    Atualiza a tabela de rotas após mudanças em arquivos do diretório raiz.
+    Apenas as subárvores dos diretórios afetados são reconstruídas; a
+    RouteTrie é substituída de uma vez no final.
+    No modo pre_expand a tabela inteira é reconstruída.
+    
+    Args:
+        changed: Arquivos criados, alterados ou removidos
+    """
+    # resultados memoizados das páginas alteradas
+    for path in changed:
+      static_params_cache.invalidate(tag=str(path.absolute()))
+
+    if self.pre_expand:
+      self.build()
+      return
+
+    dirs = {self.affected_directory(path.parent) for path in changed}
+    # descarta diretórios contidos em outro diretório afetado
+    dirs = {d for d in dirs if not any(other in d.parents for other in dirs)}
+
+    for directory in dirs:
+      self.rebuild_subtree(directory)
+
+    if self.manifest:
+      self.manifest.save()
     self.establish_route_hierarchy()
+    self.refresh_static_paths()
+
+  def affected_directory(self, directory: Path) -> Path:
+    """
+    Sobe a partir do diretório alterado até o primeiro cujo pai já é uma
+    rota conhecida (diretórios novos aninhados são criados juntos).
+    """
+    root = self.root.dir.absolute()
+    directory = directory.absolute()
+    while directory != root and self.normalize_name(directory.parent) not in self.routes:
+      directory = directory.parent
+    return directory
+
+  def rebuild_subtree(self, directory: Path):
+    """Remove as rotas do diretório (e subdiretórios) e as recria se ele ainda existir."""
+    for name, route in list(self.routes.items()):
+      route_dir = route.dir.absolute()
+      if route_dir == directory or directory in route_dir.parents:
+        self.routes.pop(name, None)
+
+    if self.is_valid_directory(directory):
+      self.initialize_route_structure(directory, self.routes.get(self.normalize_name(directory.parent)))
+
+  def refresh_static_params(self):
+    """
+    Reexecuta generate_static_params das rotas (ex.: quando a lista de
+    scripts muda) e atualiza os caminhos estáticos e a RouteTrie.
+    Os resultados memoizados são descartados antes.
+    """
+    static_params_cache.invalidate(tag="generate_static_params")
+    if self.pre_expand:
+      self.build()
+      return
+
+    for route in list(self.routes.values()):
+      if route.needs_static_params:
+        route.generate_static_params()
+        if self.manifest:
+          self.manifest.set_static_params(route.dir, route.static_params)
+    if self.manifest:
+      self.manifest.save()
+    self.refresh_static_paths()
+
+  def revalidate_static_params(self) -> bool:
+    """
+    Reexecuta generate_static_params apenas das rotas sem resultado
+    memoizado válido (expirado por revalidate/TTL ou vindo do manifesto).
+    Retorna True se algum caminho mudou.
+    """
+    changed = False
+    for route in list(self.routes.values()):
+      key = route.static_params_key
+      if not route.needs_static_params or key is None or static_params_cache.get(key) is not None:
+        continue
+      previous = [props.props for props in route.static_params]
+      route.generate_static_params()
+      if [props.props for props in route.static_params] != previous:
+        changed = True
+        if self.manifest:
+          self.manifest.set_static_params(route.dir, route.static_params)
+
+    if changed:
+      if self.pre_expand:
+        self.build()
+        return True
+      if self.manifest:
+        self.manifest.save()
+      self.refresh_static_paths()
+    return changed
+
+  def refresh_static_paths(self):
+    """Recalcula os caminhos estáticos e substitui a RouteTrie."""
+    self.static_paths = {}
     self.process_all_static_params()
+    self.trie = RouteTrie.from_routes(self.routes)
 
   def process_all_static_params(self):
     routes_copy = list(self.routes.values())
@@ -41,11 +183,23 @@ class RouteGenerator(IRouteGenerator):
 
   def resolve_static_params(self, route: Route):
     param_groups = self.collect_static_param_groups(route)
-    print(f"[resolve_static_params] {route.name} -> {param_groups}")
+    logger.debug("resolve_static_params %s: %d grupo(s)", route.name, len(param_groups))
     if param_groups:
       paths = expand_static_params(param_groups)
-      print(f"[resolve_static_params] {route.name} -> {paths}")
-      self.replace_route_with_expanded_paths(route, paths)
+      logger.debug("resolve_static_params %s -> %s", route.name, paths)
+      if self.pre_expand:
+        self.replace_route_with_expanded_paths(route, paths)
+      else:
+        self.register_static_paths(route, paths)
+
+  def register_static_paths(self, route: Route, paths: list[str]):
+    """
+    Registra os caminhos concretos de uma rota dinâmica sem criar novas rotas.
+    Usados apenas para listagem (ex.: RouterSearchbar); a navegação é
+    resolvida pela RouteTrie.
+    """
+    for path in paths:
+      self.static_paths[self.build_final_path(route.name, path)] = route
 
   def collect_static_param_groups(self, route: Route) -> list[list]:
     """Coleta grupos de parâmetros estáticos da hierarquia de rotas"""
@@ -88,11 +242,7 @@ class RouteGenerator(IRouteGenerator):
     # Adiciona uma rota para cada caminho expandido
     for path in paths:
         final_path = self.build_final_path(route.name, path)
-        new_route = Route(route.dir, name=final_path)
-        new_route.page = route.page
-        new_route.layout = route.layout
-        new_route.not_found = route.not_found
-        new_route.parent = route.parent
+        new_route = route.view(final_path)
         
         # Encontra o BaseRouteProps correspondente a este path
         matching_props = next(
@@ -103,7 +253,7 @@ class RouteGenerator(IRouteGenerator):
         # Guarda os parâmetros originais para quando a rota for construída
         new_route.original_props = matching_props
         self.routes[final_path] = new_route
-        print(f"[resolve_static_params] {route.name} -> {final_path}")
+        logger.debug("resolve_static_params %s -> %s", route.name, final_path)
 
   def build_final_path(self, base_name: str, path: str) -> str:
     base_parts = base_name.strip("/").split("/")
@@ -122,11 +272,15 @@ class RouteGenerator(IRouteGenerator):
     return "/" + "/".join(final_parts)
 
   def initialize_route_structure(self, path: Path, parent: Route = None):
+    if self.manifest:
+      self.initialize_route_structure_from_manifest(path, parent)
+      return
+
     if not self.is_valid_directory(path):
       return
 
     name = self.normalize_name(path)
-    self.routes[name] = type(self.root)(path, name=name)
+    self.routes[name] = type(self.root)(path, name=name, lazy=self.root.lazy)
     if parent:
       self.routes[name].parent = parent
 
@@ -134,6 +288,59 @@ class RouteGenerator(IRouteGenerator):
       if self.is_valid_directory(sub_route):
         self.initialize_route_structure(sub_route, self.routes[name])
 
+  def initialize_route_structure_from_manifest(self, path: Path, parent: Route = None):
+    """
+    Variante de initialize_route_structure guiada pelo manifesto:
+    diretórios inalterados reaproveitam arquivos, subdiretórios e parâmetros
+    estáticos em cache; apenas os alterados são percorridos novamente.
+    """
+    entry = self.manifest.lookup(path)
+    if entry is None:
+      if not self.is_valid_directory(path):
+        return
+      entry = self.manifest.scan(path, blacklist)
+
+    name = self.normalize_name(path)
+    route = type(self.root)(
+      path, 
+      name=name, 
+      lazy=self.root.lazy, 
+      files=set(entry["files"]),
+      static_params=self.manifest.get_static_params(path, entry),
+    )
+    if route.needs_static_params:
+      self.manifest.set_static_params(path, route.static_params)
+    
+    self.routes[name] = route
+    if parent:
+      route.parent = parent
+
+    for child in entry["children"]:
+      self.initialize_route_structure_from_manifest(path / child, route)
+
+  def warm_up(self, background: bool = True) -> threading.Thread | None:
+    """
+    Pré-carrega os módulos de todas as rotas (útil no modo lazy).
+    
+    Args:
+        background: Se True, carrega em uma thread daemon e retorna a thread
+        
+    Returns:
+        A thread de warm-up ou None quando executado de forma síncrona
+    """
+    def preload_all():
+      # ordena pela profundidade: rotas mais rasas tendem a ser visitadas antes
+      for route in sorted(list(self.routes.values()), key=lambda r: r.name.count("/")):
+        route.preload()
+
+    if not background:
+      preload_all()
+      return None
+
+    thread = threading.Thread(target=preload_all, name="route-warm-up", daemon=True)
+    thread.start()
+    return thread
+
   def establish_route_hierarchy(self):
     for route in self.routes.values():
       route.parent = self.routes.get(self.normalize_name(route.dir.parent), None)
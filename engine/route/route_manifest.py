@@ -0,0 +1,187 @@
+"""
+Módulo route_manifest: manifesto persistido da estrutura de rotas.
+Guarda, para cada diretório de src/app, o mtime do diretório, os arquivos
+de rota presentes (page.py, layout.py, not_found.py), os subdiretórios válidos
+e os parâmetros estáticos já resolvidos. Na inicialização seguinte apenas os
+diretórios cujo mtime mudou são percorridos novamente.
+"""
+import json
+import os
+from pathlib import Path
+from engine.route.route_props import BaseRouteProps
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+ROUTE_FILES = ("page.py", "layout.py", "not_found.py")
+
+
+def file_signature(path: Path) -> list[int] | None:
+  """Retorna [mtime_ns, tamanho] do arquivo ou None se ele não existir."""
+  try:
+    stat = path.stat()
+  except OSError:
+    return None
+  return [stat.st_mtime_ns, stat.st_size]
+
+
+class RouteManifest:
+  """
+  Cache em JSON da varredura de diretórios feita pelo RouteGenerator.
+
+  Uso básico:
+
+    manifest = RouteManifest(Path(".cache/routes.json"), APP_DIR)
+    generator = RouteGenerator(root, manifest=manifest)  # carrega e salva
+
+  Args:
+      path: Arquivo JSON do manifesto
+      root_dir: Diretório raiz das rotas
+      dependencies: Caminhos externos dos quais generate_static_params depende
+                    (ex.: diretório de scripts); se o mtime de algum mudar,
+                    os parâmetros estáticos em cache são descartados
+  """
+  VERSION = 1
+
+  def __init__(self, path: Path, root_dir: Path, dependencies: list[Path] = []):
+    self.path: Path = path
+    self.root_dir: Path = root_dir
+    self.dependencies: dict[str, list[int] | None] = {
+      str(dep): file_signature(dep) for dep in dependencies
+    }
+    self.entries: dict[str, dict] = {}
+    self.visited: set[str] = set()
+    self.dirty: bool = False
+    # parâmetros estáticos só são reaproveitados se as dependências não mudaram
+    self.dependencies_changed: bool = False
+
+  def load(self) -> "RouteManifest":
+    """Lê o manifesto do disco; um arquivo ausente ou inválido resulta em cache vazio."""
+    try:
+      with open(self.path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    except (OSError, ValueError):
+      self.entries = {}
+      self.dirty = True
+      return self
+
+    if data.get("version") != self.VERSION or data.get("root") != str(self.root_dir.absolute()):
+      self.entries = {}
+      self.dirty = True
+      return self
+
+    self.entries = data.get("entries", {})
+    self.dependencies_changed = data.get("dependencies") != self.dependencies
+    self.dirty = self.dependencies_changed
+    return self
+
+  def key(self, path: Path) -> str:
+    """Chave do diretório relativa à raiz das rotas."""
+    return path.absolute().relative_to(self.root_dir.absolute()).as_posix()
+
+  def lookup(self, path: Path) -> dict | None:
+    """
+    Retorna a entrada do diretório se o seu mtime não mudou.
+    Custa uma única chamada stat por diretório.
+    """
+    key = self.key(path)
+    self.visited.add(key)
+    entry = self.entries.get(key)
+    if entry is None:
+      return None
+
+    signature = file_signature(path)
+    if signature is None or entry.get("mtime") != signature[0]:
+      return None
+    return entry
+
+  def scan(self, path: Path, blacklist: list[str]) -> dict:
+    """
+    Percorre o diretório uma única vez (os.scandir) e registra a nova entrada.
+    """
+    files: list[str] = []
+    children: list[str] = []
+    with os.scandir(path) as it:
+      for item in it:
+        if item.is_dir():
+          if item.name not in blacklist:
+            children.append(item.name)
+        elif item.name in ROUTE_FILES:
+          files.append(item.name)
+
+    entry = {
+      "mtime": path.stat().st_mtime_ns,
+      "files": sorted(files),
+      "children": sorted(children),
+      "page": None,
+      "static_params": None,
+    }
+    key = self.key(path)
+    self.visited.add(key)
+    self.entries[key] = entry
+    self.dirty = True
+    return entry
+
+  def get_static_params(self, path: Path, entry: dict) -> list[BaseRouteProps] | None:
+    """
+    Reconstrói os parâmetros estáticos em cache se page.py e as dependências
+    não mudaram desde a última resolução.
+    """
+    if self.dependencies_changed or entry.get("static_params") is None:
+      return None
+    if entry.get("page") != file_signature(path / "page.py"):
+      return None
+    return [
+      BaseRouteProps.create_static(props.get("segment", ""), props)
+      for props in entry["static_params"]
+    ]
+
+  def set_static_params(self, path: Path, static_params: list) -> None:
+    """
+    Registra os parâmetros estáticos resolvidos de uma rota.
+    Apenas parâmetros serializáveis em JSON são guardados.
+    """
+    entry = self.entries.get(self.key(path))
+    if entry is None:
+      return
+
+    try:
+      params = [props.props for props in static_params]
+      json.dumps(params)
+    except (AttributeError, TypeError, ValueError):
+      params = None
+
+    signature = file_signature(path / "page.py")
+    if entry.get("static_params") != params or entry.get("page") != signature:
+      entry["static_params"] = params
+      entry["page"] = signature
+      self.dirty = True
+
+  def save(self) -> None:
+    """
+    Remove entradas de diretórios não visitados e grava o manifesto
+    (escrita atômica via arquivo temporário) se algo mudou.
+    """
+    removed = [key for key in self.entries if key not in self.visited]
+    for key in removed:
+      del self.entries[key]
+    if not (self.dirty or removed):
+      return
+
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+    try:
+      with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({
+          "version": self.VERSION,
+          "root": str(self.root_dir.absolute()),
+          "dependencies": self.dependencies,
+          "entries": self.entries,
+        }, f)
+      os.replace(tmp, self.path)
+      self.dirty = False
+    except OSError as e:
+      logger.error("Não foi possível salvar o manifesto de rotas: %s", e)
+
+
+__all__ = ["RouteManifest"]
@@ -1,5 +1,6 @@
 
 from engine.interface import IRouter
+from engine.executor import CancellationToken
 import flet as ft
 
 class BaseRouteProps:
@@ -11,12 +12,15 @@ class BaseRouteProps:
         ctx: ft.Page = None,
         router: IRouter = None, 
         children: list[ft.Control] = [], 
-        props: dict[str, any] = {}
+        props: dict[str, any] = {},
+        token: CancellationToken = None,
     ) -> None:
         self.ctx: ft.Page = ctx
         self.router: IRouter = router
         self.children: list[ft.Control] = children 
         self.props: dict[str, any] = props
+        # cancelado quando o usuário navega para outra página durante o build
+        self.token: CancellationToken = token
 
     def to_dict(self) -> dict[str, any]:
         """
@@ -0,0 +1,147 @@
+"""
+Módulo route_trie: árvore de segmentos para casar caminhos com rotas.
+Cada nó representa um segmento do caminho e pode ter filhos estáticos,
+um filho dinâmico ([param]) e um catch-all ([...param] ou [[...param]]).
+A busca percorre o caminho uma única vez (O(profundidade)), priorizando
+segmentos estáticos, depois dinâmicos e por fim catch-all.
+"""
+from engine.interface import IRoute
+
+
+def parse_segment(segment: str) -> tuple[str, str]:
+  """
+  Classifica um segmento de rota.
+
+  Returns:
+      Tupla (tipo, nome) onde tipo é "static", "dynamic", "catch_all"
+      ou "optional_catch_all"
+  """
+  if segment.startswith("[[...") and segment.endswith("]]"):
+    return "optional_catch_all", segment[5:-2]
+  if segment.startswith("[...") and segment.endswith("]"):
+    return "catch_all", segment[4:-1]
+  if segment.startswith("[") and segment.endswith("]"):
+    return "dynamic", segment[1:-1]
+  return "static", segment
+
+
+def split_path(path: str) -> list[str]:
+  """Divide o caminho em segmentos, ignorando barras extras."""
+  return [segment for segment in path.strip("/").split("/") if segment]
+
+
+class RouteTrieNode:
+  __slots__ = ("children", "dynamic", "catch_all", "route")
+
+  def __init__(self) -> None:
+    self.children: dict[str, "RouteTrieNode"] = {}
+    # (nome do parâmetro, nó filho)
+    self.dynamic: tuple[str, "RouteTrieNode"] | None = None
+    # (nome do parâmetro, rota, opcional)
+    self.catch_all: tuple[str, IRoute, bool] | None = None
+    self.route: IRoute | None = None
+
+
+class RouteTrie:
+  """
+  Tabela de rotas indexada por segmentos.
+
+  Uso básico:
+
+    trie = RouteTrie()
+    trie.insert("/[scripts]", route)
+    trie.match("/carteiras")  # -> (route, {"scripts": "carteiras"})
+  """
+  def __init__(self) -> None:
+    self.root = RouteTrieNode()
+
+  @staticmethod
+  def from_routes(routes: dict[str, IRoute]) -> "RouteTrie":
+    trie = RouteTrie()
+    for name, route in routes.items():
+      trie.insert(name, route)
+    return trie
+
+  def insert(self, name: str, route: IRoute) -> None:
+    node = self.root
+    for segment in split_path(name):
+      kind, param = parse_segment(segment)
+      match kind:
+        case "static":
+          node = node.children.setdefault(segment, RouteTrieNode())
+        case "dynamic":
+          if node.dynamic is None:
+            node.dynamic = (param, RouteTrieNode())
+          elif node.dynamic[0] != param:
+            raise ValueError(f"Parâmetros conflitantes em {name}: [{node.dynamic[0]}] e [{param}]")
+          node = node.dynamic[1]
+        case "catch_all" | "optional_catch_all":
+          # catch-all precisa ser o último segmento
+          node.catch_all = (param, route, kind == "optional_catch_all")
+          return
+    node.route = route
+
+  def remove(self, name: str) -> None:
+    """Remove a rota associada ao nome (os nós intermediários são mantidos)."""
+    node = self.root
+    for segment in split_path(name):
+      kind, _ = parse_segment(segment)
+      match kind:
+        case "static":
+          node = node.children.get(segment)
+        case "dynamic":
+          node = node.dynamic[1] if node.dynamic else None
+        case _:
+          node.catch_all = None
+          return
+      if node is None:
+        return
+    node.route = None
+
+  def match(self, path: str) -> tuple[IRoute, dict[str, str]] | None:
+    """
+    Procura a rota correspondente ao caminho.
+
+    Returns:
+        Tupla (rota, parâmetros extraídos) ou None se nada casar
+    """
+    params: dict[str, str] = {}
+    route = self._match(self.root, split_path(path), 0, params)
+    if route is None:
+      return None
+    return route, params
+
+  def _match(self, node: RouteTrieNode, segments: list[str], index: int, params: dict[str, str]) -> IRoute | None:
+    if index == len(segments):
+      if node.route is not None:
+        return node.route
+      # catch-all opcional também casa com zero segmentos
+      if node.catch_all and node.catch_all[2]:
+        return node.catch_all[1]
+      return None
+
+    segment = segments[index]
+
+    child = node.children.get(segment)
+    if child is not None:
+      route = self._match(child, segments, index + 1, params)
+      if route is not None:
+        return route
+
+    if node.dynamic is not None:
+      param, child = node.dynamic
+      params[param] = segment
+      route = self._match(child, segments, index + 1, params)
+      if route is not None:
+        return route
+      del params[param]
+
+    if node.catch_all is not None:
+      param, route, _ = node.catch_all
+      params[param] = "/".join(segments[index:])
+      return route
+
+    return None
+
+
+__all__ = ["RouteTrie"]
@@ -1,7 +1,10 @@
 from engine.router.router import Router
 from engine.router.router_searchbar import RouterSearchbar
+from engine.router.search_index import SearchIndex, SearchEntry
 
 __all__ = [
     "Router",
     "RouterSearchbar",
+    "SearchIndex",
+    "SearchEntry",
 ]
\ No newline at end of file
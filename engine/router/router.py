@@ -1,10 +1,14 @@
 from engine.route import Route, BaseRouteProps, RouteBuilder, RouteGenerator
 from engine.interface import IRouter, IRenderer
+from engine.router.search_index import SearchIndex
+from engine.route.route_trie import split_path
 
 import flet as ft
 from pathlib import Path
 
 from engine.env import blacklist
+from engine.metrics import metrics
+import time
 
 def extract_name_from_path(remove: Path, from_path: Path) -> str: 
   return f"{from_path.absolute()}".replace(f"{remove.absolute()}", "/").replace("\\", "/").replace("//", "/")
@@ -15,6 +19,12 @@ class Router(IRouter):
     self.routes = route_generator.routes
     self.url: str = "/"
 
+  def for_session(self, renderer: IRenderer) -> "Router":
+    """
+    Cria o router de uma sessão: url própria, tabela de rotas compartilhada.
+    """
+    return Router(self.route_generator, renderer)
+
   def error(self, route: Route, ctx: ft.Page, error_message: str):
     return [
       *RouteBuilder.error(route, BaseRouteProps(ctx, self, props={"error": f"{error_message}"}))
@@ -28,27 +38,75 @@ class Router(IRouter):
     ctx.add(first)
 
   def navigate(self, _path: str) -> None:
+    # início da navegação para a latência medida pelo renderer
+    started_at = time.perf_counter()
     self.url = _path
-    # self.remount_default_layout(ctx)
-    
-    self.renderer.clear()
+    # o searchbar e a página atual continuam montados; o renderer reconcilia
+    # a página atual com a nova em vez de limpar e reenviar tudo
     self.renderer.mount_default_layout(self)
     
-    if _path in self.routes:
-      route = self.routes[self.url]
-      self.renderer.ctx.add(*RouteBuilder.build(
-        route, 
-        BaseRouteProps(
-            ctx=self.renderer.ctx, 
-            router=self, 
-            props=self.match_dynamic_segments(route.name, self.url)
-          )
-        )
-      )
+    matched = self.match(_path)
+    if matched:
+      route, params = matched
+      self.renderer.render_route(self, route, params, started_at=started_at)
     else:
       # Handle 404 or not found page
-      self.error(self.route_generator.root, self.renderer.ctx, "Página não encontrada")
+      metrics.increment("not_found")
+      self.renderer.mount(self.error(self.route_generator.root, self.renderer.ctx, "Página não encontrada"))
 
+  def invalidate(self, path: str | None = None) -> int:
+    """
+    Descarta páginas guardadas no PageCache da sessão: a do caminho
+    informado (rota e parâmetros) ou, sem caminho, todas.
+    A próxima navegação para elas executa page/layouts de novo.
+    """
+    cache = getattr(self.renderer, "page_cache", None)
+    if cache is None:
+      return 0
+    if path is None:
+      return cache.invalidate()
+    matched = self.match(path)
+    if not matched:
+      return 0
+    route, params = matched
+    return cache.invalidate(key=cache.key(route.name, params))
+
+  def match(self, path: str) -> tuple[Route, dict] | None:
+    """
+    Casa o caminho com a tabela de rotas (RouteTrie), incluindo segmentos
+    dinâmicos ([param]) e catch-all ([...param]).
+    Um caminho dinâmico só casa se estiver entre os gerados por
+    generate_static_params (static_paths), a menos que a rota aceite
+    parâmetros livres (dynamic_params = True no page.py).
+    """
+    matched = self.route_generator.trie.match(path)
+    if matched is None:
+      return None
+    route, params = matched
+    if params and "/" + "/".join(split_path(path)) not in self.route_generator.static_paths and not route.dynamic_params:
+      return None
+    return matched
+  
+  def paths(self) -> list[str]:
+    """
+    Caminhos navegáveis: rotas estáticas mais os caminhos concretos gerados
+    pelos parâmetros estáticos das rotas dinâmicas.
+    """
+    return [
+      *(name for name in self.routes.keys() if "[" not in name),
+      *self.route_generator.static_paths.keys(),
+    ]
+  
+  def search_index(self) -> SearchIndex:
+    """
+    Índice de busca dos caminhos, compartilhado entre as sessões e refeito
+    quando a lista de caminhos muda (hot-reload, revalidação de parâmetros).
+    """
+    paths = self.paths()
+    index = self.route_generator.search_index
+    if index is None or index.paths != paths:
+      index = self.route_generator.search_index = SearchIndex.from_router(self)
+    return index
   
   def match_dynamic_segments(self, path_template: str, resolved_path: str) -> dict:
     keys = path_template.strip("/").split("/")
@@ -60,8 +118,9 @@ class Router(IRouter):
     }
     
   def get_route(self, path: str) -> Route:
-    if path in self.routes:
-      return self.routes[path]
+    matched = self.match(path)
+    if matched:
+      return matched[0]
     
     return None
   
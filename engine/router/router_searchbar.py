@@ -1,13 +1,21 @@
 from engine.interface import IRouter
+from engine.router.search_index import SearchIndex, SearchEntry
+from engine.batch import schedule_update
 import flet as ft
 
 class RouterSearchbar(ft.SearchBar):
-  def __init__(self,  *args, **kwargs):
+  def __init__(self, *args, limit: int = 10, **kwargs):
     super().__init__(*args, **kwargs)
+    # quantidade máxima de resultados exibidos
+    self.limit: int = limit
+    self.search_index: SearchIndex | None = None
+    self.results: list[SearchEntry] = []
+    # ListTiles por caminho: resultados repetidos reaproveitam o mesmo controle
+    self._tiles: dict[str, ft.ListTile] = {}
     self.on_tap = lambda e: self.open_view()
     self.on_submit = lambda e: self._safe_close_view()
     self.on_click = lambda e: self.open_view()
-   
+
 
   def _safe_close_view(self):
     """Fecha a visualização de forma segura, verificando se o controle foi adicionado à página."""
@@ -19,30 +27,55 @@ class RouterSearchbar(ft.SearchBar):
     self.width = ctx.width - 20
     self.bar_hint_text = bar_hint_text
     self.autofocus = True
-    
+
     def go_to(e: ft.ControlEvent, data: str):
       if self.page:  # Verifica se o controle foi adicionado à página
         router.navigate(data)
         self._safe_close_view()
-    
-    def on_click(e: ft.ControlEvent, data):
-      go_to(e, data)
-
-    routes = [
-      route for route in router.routes.keys()
-    ]
-  
-    self.controls = [
-      ft.ListTile(title=ft.Text(route), data=route, on_click=lambda e, data=route:on_click(e, data))
-      for route 
-      in routes
-    ]
-    
+
+    self._go_to = go_to
+
+    # o índice só é refeito quando os caminhos mudam: entre navegações o
+    # searchbar permanece montado e apenas bar_hint_text é enviado
+    index = router.search_index()
+    if index is not self.search_index:
+      self.search_index = index
+      self._tiles = {}
+      self.filter(self.value or "")
+
     def on_submit(e: ft.ControlEvent):
       if self.value and self.page:  # Verifica se o controle foi adicionado à página
-        go_to(e, self.value)
-    
+        # caminho digitado por completo (inclusive dinâmico) ou o melhor resultado
+        if self.value.startswith("/") and router.match(self.value):
+          go_to(e, self.value)
+        elif self.results:
+          go_to(e, self.results[0].path)
+
+    def on_change(e: ft.ControlEvent):
+      # teclas digitadas no mesmo intervalo viram um único envio
+      self.filter(self.value or "")
+      schedule_update(self)
+
     self.on_tap = lambda e, sb=self: sb.open_view()
     self.on_submit = on_submit
-    
-    return self
\ No newline at end of file
+    self.on_change = on_change
+
+    return self
+
+  def tile(self, entry: SearchEntry) -> ft.ListTile:
+    tile = self._tiles.get(entry.path)
+    if tile is None:
+      tile = self._tiles[entry.path] = ft.ListTile(
+        key=entry.path,
+        title=ft.Text(entry.path),
+        subtitle=ft.Text(entry.title) if entry.title else None,
+        data=entry.path,
+        on_click=lambda e, data=entry.path: self._go_to(e, data),
+      )
+    return tile
+
+  def filter(self, query: str) -> list[SearchEntry]:
+    """Exibe apenas os `limit` melhores resultados para o texto digitado."""
+    self.results = self.search_index.search(query, limit=self.limit) if self.search_index else []
+    self.controls = [self.tile(entry) for entry in self.results]
+    return self.results
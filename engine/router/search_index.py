@@ -0,0 +1,155 @@
+"""
+Módulo search_index: índice de busca dos caminhos navegáveis (RouterSearchbar).
+Construído uma vez por tabela de rotas e consultado a cada tecla digitada:
+- árvore de prefixos (PrefixTrie) sobre os termos de cada entrada: caminho,
+  segmentos (ex.: nome do script) e título de generate_metadata;
+- índice de trigramas para tolerar erros de digitação;
+- busca devolve apenas as N melhores entradas (heapq), sem percorrer a lista.
+"""
+from engine.interface import IRouter
+from engine.route.route_props import BaseRouteProps
+import heapq
+import re
+import unicodedata
+
+TOKEN_SEPARATORS = re.compile(r"[\s/\-_.\[\]]+")
+
+
+def normalize(text: str) -> str:
+  """Minúsculas e sem acentos ("Relatório" -> "relatorio")."""
+  decomposed = unicodedata.normalize("NFKD", text.lower())
+  return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> list[str]:
+  return [token for token in TOKEN_SEPARATORS.split(normalize(text)) if token]
+
+
+def trigrams(text: str) -> set[str]:
+  padded = f"  {normalize(text)} "
+  return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchEntry:
+  """Caminho navegável e os textos pelos quais ele pode ser encontrado."""
+  __slots__ = ("path", "title", "text", "tokens", "trigrams")
+
+  def __init__(self, path: str, title: str | None = None) -> None:
+    self.path: str = path
+    self.title: str | None = title
+    self.text: str = normalize(f"{path} {title or ''}")
+    self.tokens: list[str] = tokenize(self.text)
+    self.trigrams: set[str] = trigrams(self.text)
+
+
+class PrefixTrie:
+  """
+  Árvore de prefixos: cada nó guarda os ids das entradas com algum termo
+  começando pelo prefixo do nó.
+  """
+  __slots__ = ("children", "ids")
+
+  def __init__(self) -> None:
+    self.children: dict[str, "PrefixTrie"] = {}
+    self.ids: set[int] = set()
+
+  def insert(self, token: str, id: int) -> None:
+    node = self
+    for char in token:
+      node = node.children.setdefault(char, PrefixTrie())
+      node.ids.add(id)
+
+  def find(self, prefix: str) -> set[int]:
+    node = self
+    for char in prefix:
+      node = node.children.get(char)
+      if node is None:
+        return set()
+    return node.ids
+
+
+class SearchIndex:
+  """
+  Índice de busca dos caminhos.
+
+  Uso básico:
+
+      index = SearchIndex.from_router(router)
+      index.search("carteira", limit=8)  # -> [SearchEntry, ...]
+
+  Pontuação: termos da consulta encontrados por prefixo pesam mais que a
+  semelhança de trigramas; acertos no início do caminho e caminhos curtos
+  desempatam.
+  """
+  def __init__(self, entries: list[SearchEntry]) -> None:
+    self.entries: list[SearchEntry] = entries
+    self.paths: list[str] = [entry.path for entry in entries]
+    self.trie = PrefixTrie()
+    self.trigram_index: dict[str, set[int]] = {}
+    for id, entry in enumerate(entries):
+      for token in entry.tokens:
+        self.trie.insert(token, id)
+      for trigram in entry.trigrams:
+        self.trigram_index.setdefault(trigram, set()).add(id)
+
+  @staticmethod
+  def from_router(router: IRouter) -> "SearchIndex":
+    """
+    Indexa router.paths(). O título vem de generate_metadata apenas para
+    páginas já carregadas, para não importar rotas lazy só para a busca.
+    """
+    entries = []
+    for path in router.paths():
+      title = None
+      matched = router.match(path)
+      if matched:
+        route, params = matched
+        page = route.page
+        if page is not None and getattr(page, "is_loaded", True):
+          title = route.generate_metadata(BaseRouteProps(router=router, props=params)).get("title")
+      entries.append(SearchEntry(path, str(title) if title else None))
+    return SearchIndex(entries)
+
+  def score(self, entry: SearchEntry, tokens: list[str], query_trigrams: set[str], query: str) -> float:
+    matched_tokens = sum(
+      1 for token in tokens
+      if any(candidate.startswith(token) for candidate in entry.tokens)
+    )
+    similarity = len(query_trigrams & entry.trigrams) / len(query_trigrams) if query_trigrams else 0.0
+    score = 2.0 * matched_tokens / len(tokens) + similarity
+    if entry.text.startswith(query) or entry.text.startswith("/" + query):
+      score += 0.5
+    return score - len(entry.path) / 10_000
+
+  def search(self, query: str, limit: int = 10) -> list[SearchEntry]:
+    """As `limit` entradas mais relevantes para a consulta (vazia: as primeiras)."""
+    query = normalize(query).strip()
+    tokens = tokenize(query)
+    if not tokens:
+      return self.entries[:limit]
+
+    candidates: set[int] = set()
+    for token in tokens:
+      candidates |= self.trie.find(token)
+
+    query_trigrams = trigrams(query)
+    counts: dict[int, int] = {}
+    for trigram in query_trigrams:
+      for id in self.trigram_index.get(trigram, ()):
+        counts[id] = counts.get(id, 0) + 1
+    # semelhança mínima para entrar por trigramas (erros de digitação)
+    threshold = max(1, len(query_trigrams) // 3)
+    candidates.update(id for id, count in counts.items() if count >= threshold)
+
+    best = heapq.nlargest(
+      limit,
+      candidates,
+      key=lambda id: self.score(self.entries[id], tokens, query_trigrams, query),
+    )
+    return [self.entries[id] for id in best]
+
+  def __len__(self) -> int:
+    return len(self.entries)
+
+
+__all__ = ["SearchEntry", "SearchIndex", "PrefixTrie", "normalize"]
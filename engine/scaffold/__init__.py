@@ -5,12 +5,15 @@
 
 from pathlib import Path
 from string import Template
+from engine.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class Scaffold:
   def __init__(self, templates_dir: Path = None):
     self.templates_dir =  templates_dir or (Path(__file__).parent / "templates")
-    print(f"Templates dir: {self.templates_dir}")
+    logger.debug("Templates dir: %s", self.templates_dir)
     
   def list_templates(self) -> list[str]:
     """Lista todos os templates disponíveis"""
@@ -0,0 +1,75 @@
+"""
+Módulo session: estado por conexão (ft.Page) para servir vários usuários.
+Cada sessão tem seu próprio Renderer (ctx, searchbar, build em andamento) e
+Router (url atual), enquanto a tabela de rotas (RouteGenerator/RouteTrie) é
+compartilhada e somente leitura entre todas as sessões do processo.
+"""
+import threading
+import time
+import flet as ft
+from engine.interface import IRenderer, IRouter
+
+
+class Session:
+    """
+    Estado leve de uma conexão.
+    id: identificador da sessão Flet
+    ctx: página Flet da conexão
+    renderer/router: instâncias exclusivas da sessão
+    """
+    def __init__(self, id: str, ctx: ft.Page, renderer: IRenderer, router: IRouter) -> None:
+        self.id: str = id
+        self.ctx: ft.Page = ctx
+        self.renderer: IRenderer = renderer
+        self.router: IRouter = router
+        self.started_at: float = time.time()
+
+
+class SessionRegistry:
+    """
+    Registro das sessões ativas do processo.
+    Expõe contagem atual, pico e total de conexões para medir sessões por processo.
+    """
+    def __init__(self) -> None:
+        self._sessions: dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self.peak: int = 0
+        self.total: int = 0
+
+    def open(self, ctx: ft.Page, renderer: IRenderer, router: IRouter) -> Session:
+        """
+        Cria e registra a sessão de um ctx; a sessão é removida quando o
+        Flet encerra a sessão (on_close), não a cada queda de websocket.
+        """
+        session_id = getattr(ctx, "session_id", None) or str(id(ctx))
+        session = Session(session_id, ctx, renderer, router)
+        with self._lock:
+            self._sessions[session_id] = session
+            self.total += 1
+            self.peak = max(self.peak, len(self._sessions))
+
+        ctx.on_close = lambda e, sid=session_id: self.close(sid)
+        return session
+
+    def close(self, session_id: str) -> None:
+        """Remove a sessão do registro (idempotente)."""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session:
+            session.renderer.dispose()
+
+    def get(self, session_id: str) -> Session | None:
+        return self._sessions.get(session_id)
+
+    def stats(self) -> dict[str, int]:
+        """Sessões ativas, pico e total desde o início do processo."""
+        return {"active": len(self), "peak": self.peak, "total": self.total}
+
+    def __iter__(self):
+        return iter(list(self._sessions.values()))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+__all__ = ["Session", "SessionRegistry"]
@@ -1,4 +1,22 @@
+from engine.ui.data_source import *
+from engine.ui.cell_format import *
 from engine.ui.table import *
+from engine.ui.virtual_table import *
 from engine.ui.form_generator import *
 
-__all__ = ["Table", "form_generator"]
\ No newline at end of file
+__all__ = [
+    "Table",
+    "VirtualTable",
+    "form_generator",
+    "DataSource",
+    "CallableSource",
+    "FrameSource",
+    "ModulesSource",
+    "RowPatch",
+    "as_source",
+    "Formatter",
+    "format_columns",
+    "format_exprs",
+    "default_formatter",
+    "display_rows",
+]
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Módulo cell_format: formatação vetorizada das células de tabelas de frames.
+Em vez de chamar str(value) célula a célula em Python, cada coluna vira texto
+de exibição em uma única expressão Polars (por tipo ou por coluna); a tabela
+recebe colunas de strings prontas e só monta os controles.
+
+Formatação padrão por tipo:
+- inteiros: como estão; decimais: `decimals` casas, vírgula decimal;
+- datas: dd/mm/aaaa; datas com hora: dd/mm/aaaa hh:mm:ss;
+- booleanos: Sim/Não;
+- nulos: texto vazio.
+
+Formatadores por coluna (ex.: CNPJ com pontuação) recebem a expressão da
+coluna e devolvem a expressão de texto:
+
+    format_columns(window, {"CNPJ": format_document_column})
+"""
+from typing import Callable
+# importa polars para as expressões de formatação
+import polars as pl
+
+# expressão da coluna -> expressão de texto exibido
+Formatter = Callable[[pl.Expr], pl.Expr]
+
+DATE_FORMAT = "%d/%m/%Y"
+DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
+
+
+def format_integer(column: pl.Expr) -> pl.Expr:
+    return column.cast(pl.String)
+
+
+def format_float(column: pl.Expr, decimals: int = 2) -> pl.Expr:
+    """Decimal com `decimals` casas e vírgula decimal (ex.: 1234.5 -> "1234,50")."""
+    rounded = column.round(decimals)
+    # cast não estrito: fora do Int64 (|x| >= 2^63), inf e NaN viram nulo
+    integer = rounded.abs().floor().cast(pl.Int64, strict=False)
+    fraction = ((rounded.abs() - rounded.abs().floor()) * 10 ** decimals).round(0).cast(pl.Int64, strict=False).cast(pl.String).str.zfill(decimals)
+    sign = pl.when(rounded < 0).then(pl.lit("-")).otherwise(pl.lit(""))
+    parts = [sign, integer.cast(pl.String), pl.lit(","), fraction] if decimals > 0 else [sign, integer.cast(pl.String)]
+    # sem parte inteira representável: mantém a representação do Polars
+    return pl.when(integer.is_not_null()).then(pl.concat_str(parts)).otherwise(column.cast(pl.String))
+
+
+def format_date(column: pl.Expr) -> pl.Expr:
+    return column.dt.strftime(DATE_FORMAT)
+
+
+def format_datetime(column: pl.Expr) -> pl.Expr:
+    return column.dt.strftime(DATETIME_FORMAT)
+
+
+def format_boolean(column: pl.Expr) -> pl.Expr:
+    return pl.when(column).then(pl.lit("Sim")).when(column.not_()).then(pl.lit("Não"))
+
+
+def format_string(column: pl.Expr) -> pl.Expr:
+    return column
+
+
+def format_list(column: pl.Expr) -> pl.Expr:
+    items = column.list.eval(pl.element().cast(pl.String).fill_null("")).list.join(", ")
+    return pl.concat_str([pl.lit("["), items, pl.lit("]")])
+
+
+def format_struct(column: pl.Expr) -> pl.Expr:
+    return column.struct.json_encode()
+
+
+def format_other(column: pl.Expr) -> pl.Expr:
+    # objetos Python não têm representação no Polars: única formatação por célula
+    return column.map_elements(str, return_dtype=pl.String)
+
+
+def default_formatter(dtype: pl.DataType) -> Formatter:
+    """Formatador padrão para o tipo da coluna."""
+    if dtype == pl.String:
+        return format_string
+    if dtype == pl.Boolean:
+        return format_boolean
+    if dtype.is_integer():
+        return format_integer
+    if dtype.is_float():
+        return format_float
+    if isinstance(dtype, pl.Decimal):
+        return lambda column: format_float(column.cast(pl.Float64))
+    if dtype == pl.Date:
+        return format_date
+    if isinstance(dtype, pl.Datetime):
+        return format_datetime
+    if isinstance(dtype, pl.Array):
+        return lambda column: format_list(column.arr.to_list())
+    if isinstance(dtype, pl.List):
+        return format_list
+    if isinstance(dtype, pl.Struct):
+        return format_struct
+    if dtype == pl.Object:
+        return format_other
+    return lambda column: column.cast(pl.String)
+
+
+def format_exprs(schema: pl.Schema, formatters: dict[str, Formatter] | None = None) -> list[pl.Expr]:
+    """Expressões que substituem cada coluna do schema pelo texto exibido."""
+    formatters = formatters or {}
+    return [
+        (formatters.get(name) or default_formatter(dtype))(pl.col(name)).fill_null("").alias(name)
+        for name, dtype in schema.items()
+    ]
+
+
+def format_columns(frame: pl.DataFrame, formatters: dict[str, Formatter] | None = None) -> pl.DataFrame:
+    """Frame com todas as colunas como texto de exibição (pl.String)."""
+    return frame.select(format_exprs(frame.schema, formatters))
+
+
+def display_rows(frame: pl.DataFrame) -> list[tuple[str, ...]]:
+    """
+    Linhas de um frame já formatado, montadas a partir das colunas inteiras
+    (uma conversão por coluna em vez de uma por célula).
+    """
+    return list(zip(*(series.to_list() for series in frame.get_columns())))
+
+
+__all__ = [
+    "Formatter",
+    "default_formatter",
+    "format_exprs",
+    "format_columns",
+    "display_rows",
+    "format_integer",
+    "format_float",
+    "format_date",
+    "format_datetime",
+    "format_boolean",
+]
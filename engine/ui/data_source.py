@@ -0,0 +1,158 @@
+"""
+Módulo data_source: fontes de dados ligadas a uma Table.
+Uma fonte devolve registros (chave, valores); a Table compara os registros
+novos com os exibidos e altera apenas as linhas inseridas, alteradas e
+removidas (ver Table.patch), em vez de recriar todas as células.
+
+Fontes aceitas por as_source():
+- DataSource já construída;
+- pl.DataFrame / pl.LazyFrame (FrameSource);
+- Modules, o registro de scripts (ModulesSource);
+- função sem argumentos que devolve linhas (CallableSource).
+"""
+# importa ABC e abstractmethod para a interface das fontes
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any, Callable
+# importa polars para fontes baseadas em frames
+import polars as pl
+# registro de scripts carregados do diretório
+from engine.modules import Modules
+
+# registro exibido em uma linha: (chave da linha, valores das células)
+Record = tuple[Hashable, tuple]
+
+
+class DataSource(ABC):
+    """
+    Classe base das fontes de dados de Table.
+    Subclasses implementam records().
+    """
+    @abstractmethod
+    def records(self) -> list[Record]:
+        """Registros atuais da fonte, na ordem de exibição."""
+        ...
+
+
+def _values(item: Any) -> tuple:
+    if isinstance(item, Mapping):
+        return tuple(item.values())
+    if isinstance(item, (list, tuple)):
+        return tuple(item)
+    return (item,)
+
+
+class CallableSource(DataSource):
+    """
+    Fonte a partir de uma função que devolve as linhas (dicts, tuplas ou valores).
+
+    Args:
+        fn: Função chamada a cada recarga
+        key: Campo (linhas dict) ou função que identifica a linha; sem ela,
+            a posição da linha é a chave
+    """
+    def __init__(self, fn: Callable[[], Iterable[Any]], key: str | Callable[[Any], Hashable] | None = None) -> None:
+        self.fn = fn
+        self.key = key
+
+    def records(self) -> list[Record]:
+        records = []
+        for position, item in enumerate(self.fn()):
+            if self.key is None:
+                key = position
+            elif callable(self.key):
+                key = self.key(item)
+            else:
+                key = item[self.key]
+            records.append((key, _values(item)))
+        return records
+
+
+class FrameSource(DataSource):
+    """
+    Fonte a partir de um DataFrame/LazyFrame do Polars (ou função que o devolve).
+
+    Args:
+        frame: Frame exibido ou função que devolve o frame atual
+        key: Coluna que identifica a linha; sem ela, a posição da linha é a chave
+        limit: Quantidade máxima de linhas materializadas
+    """
+    def __init__(
+        self,
+        frame: pl.DataFrame | pl.LazyFrame | Callable[[], pl.DataFrame | pl.LazyFrame],
+        key: str | None = None,
+        limit: int | None = None,
+    ) -> None:
+        self.frame = frame
+        self.key = key
+        self.limit = limit
+
+    def collect(self) -> pl.DataFrame:
+        frame = self.frame() if callable(self.frame) else self.frame
+        if self.limit is not None:
+            frame = frame.head(self.limit)
+        return frame.collect() if isinstance(frame, pl.LazyFrame) else frame
+
+    def records(self) -> list[Record]:
+        frame = self.collect()
+        if self.key is None:
+            return list(enumerate(frame.rows()))
+        index = frame.columns.index(self.key)
+        return [(row[index], row) for row in frame.rows()]
+
+
+class ModulesSource(DataSource):
+    """
+    Fonte a partir do registro de scripts: uma linha por módulo carregado,
+    com o nome do módulo como chave. Reflete scripts adicionados e removidos
+    pelo hot reload (Modules.refresh).
+    """
+    def __init__(self, modules: Modules) -> None:
+        self.modules = modules
+
+    def records(self) -> list[Record]:
+        return [(name, (name,)) for name in self.modules.keys()]
+
+
+def as_source(source: Any) -> DataSource:
+    """Converte frame, registro de scripts ou função na DataSource correspondente."""
+    if isinstance(source, DataSource):
+        return source
+    if isinstance(source, (pl.DataFrame, pl.LazyFrame)):
+        return FrameSource(source)
+    if isinstance(source, Modules):
+        return ModulesSource(source)
+    if callable(source):
+        return CallableSource(source)
+    raise TypeError(f"Fonte de dados não suportada: {type(source).__name__}")
+
+
+class RowPatch:
+    """Resumo de uma atualização incremental das linhas de uma Table."""
+    def __init__(self) -> None:
+        self.inserted: int = 0
+        self.changed: int = 0
+        self.removed: int = 0
+        self.unchanged: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "inserted": self.inserted,
+            "changed": self.changed,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+        }
+
+    def __repr__(self) -> str:
+        return f"RowPatch({', '.join(f'{name}={value}' for name, value in self.to_dict().items())})"
+
+
+__all__ = [
+    "DataSource",
+    "CallableSource",
+    "FrameSource",
+    "ModulesSource",
+    "RowPatch",
+    "Record",
+    "as_source",
+]
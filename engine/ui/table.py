@@ -2,23 +2,48 @@
 Módulo table: componente UI reutilizável para exibição de tabelas Flet.
 Define classe Table que estende Component, combinando um botão
 de refresh e um DataTable com colunas e linhas personalizadas.
+Com uma fonte de dados (source), o refresh altera apenas as linhas
+inseridas, alteradas e removidas.
 """
 # importa flet para construção de controles UI
 import flet as ft
+from collections.abc import Hashable
+from typing import Any, Callable
 # importa classe base Component para composição de controles
 from engine import Component
+from engine.batch import schedule_update
+from engine.log import get_logger
+from engine.ui.data_source import DataSource, Record, RowPatch, as_source
+
+logger = get_logger(__name__)
 
 class Table(Component):
     """
     Componente de tabela com botão de recarregar.
     Recebe contexto da página, chave única, colunas e linhas de dados.
+    `reload` recarrega as linhas no botão de refresh; sem ele, as linhas
+    atuais são mantidas.
+
+    Com `source` (DataSource, frame do Polars, Modules ou função; ver
+    data_source.as_source) as linhas vêm da fonte e o refresh aplica apenas
+    a diferença: linhas com a mesma chave e os mesmos valores reaproveitam o
+    DataRow já enviado, linhas alteradas têm só os textos trocados e as
+    demais são inseridas ou removidas. `row_builder(values)` monta linhas
+    personalizadas (linhas alteradas são então recriadas).
+
+    Com `pool_rows`, linhas padrão removidas ficam em um pool e são
+    reaproveitadas (só os textos trocados) pelas próximas inserções.
     """
     def __init__(
         self,
         ctx: ft.Page,
         key: str,
         columns: list[ft.DataColumn | str],
-        rows: list[ft.DataRow]
+        rows: list[ft.DataRow] | None = None,
+        reload: Callable[[], list[ft.DataRow]] | None = None,
+        source: DataSource | Any | None = None,
+        row_builder: Callable[[tuple], ft.DataRow] | None = None,
+        pool_rows: bool = False,
     ) -> None:
         # filtra colunas já definidas como ft.DataColumn
         cols = [col for col in columns if isinstance(col, ft.DataColumn)]
@@ -30,6 +55,29 @@ class Table(Component):
         ])
         # armazena contexto da página para uso em callbacks
         self.ctx = ctx
+        self.key = key
+        self.reload_rows = reload
+        self.data_source: DataSource | None = as_source(source) if source is not None else None
+        self.row_builder = row_builder
+        # linhas exibidas por chave: (valores, DataRow)
+        self.bound_rows: dict[Hashable, tuple[tuple, ft.DataRow]] = {}
+        self.pool_rows = pool_rows
+        self.row_pool: list[ft.DataRow] = []
+        # DataTable exposto para componentes que atualizam as linhas
+        self.table = ft.DataTable(
+            key=key,
+            bgcolor="#2d2d2d",
+            width=ctx.width,
+            border=ft.border.all(2, "#3d3d3d"),
+            border_radius=10,
+            vertical_lines=ft.border.BorderSide(3, "#2d2d2d"),
+            horizontal_lines=ft.border.BorderSide(1, "#5d5d5d"),
+            heading_row_color=ft.Colors.BLACK12,
+            columns=cols,
+            rows=rows or [],
+        )
+        if self.data_source is not None and rows is None:
+            self.patch(self.data_source.records())
 
         # chama construtor da classe base com controles:
         # - ícone de refresh que chama self.refresh()
@@ -40,18 +88,7 @@ class Table(Component):
                 tooltip="Recarregar",
                 on_click=lambda e, c=ctx: self.refresh(c),
             ),
-            ft.DataTable(
-                key=key,
-                bgcolor="#2d2d2d",
-                width=ctx.width,
-                border=ft.border.all(2, "#3d3d3d"),
-                border_radius=10,
-                vertical_lines=ft.border.BorderSide(3, "#2d2d2d"),
-                horizontal_lines=ft.border.BorderSide(1, "#5d5d5d"),
-                heading_row_color=ft.Colors.BLACK12,
-                columns=cols,
-                rows=rows,
-            )
+            self.table,
         )
     
     def renderer(self) -> ft.Control:
@@ -59,4 +96,80 @@ class Table(Component):
         Retorna o wrapper (Column) contendo os controles.
         Recebe ctx apenas para manter assinatura compatível.
         """
-        return super().renderer(self.ctx)
\ No newline at end of file
+        return super().renderer(self.ctx)
+
+    def build_row(self, values: tuple) -> ft.DataRow:
+        """Monta o DataRow de um registro (row_builder ou uma célula de texto por valor)."""
+        if self.row_builder is not None:
+            return self.row_builder(values)
+        while self.row_pool:
+            row = self.row_pool.pop()
+            if len(row.cells) == len(values):
+                for cell, value in zip(row.cells, values):
+                    cell.content.value = str(value)
+                return row
+        return ft.DataRow(cells=[ft.DataCell(ft.Text(str(value))) for value in values])
+
+    def update_row(self, row: ft.DataRow, previous: tuple, values: tuple) -> ft.DataRow:
+        """
+        Aplica valores novos a uma linha exibida. Linhas padrão (só textos)
+        têm apenas os textos alterados trocados; as demais são recriadas.
+        """
+        if self.row_builder is not None or len(previous) != len(values) or len(row.cells) != len(values):
+            return self.build_row(values)
+        for cell, old, new in zip(row.cells, previous, values):
+            if old != new:
+                if not isinstance(cell.content, ft.Text):
+                    return self.build_row(values)
+                cell.content.value = str(new)
+        return row
+
+    def patch(self, records: list[Record]) -> RowPatch:
+        """
+        Substitui as linhas pelos registros, reaproveitando os DataRow das
+        chaves já exibidas. Não envia nada ao cliente: use refresh() ou
+        schedule_update(self.table).
+        """
+        patch = RowPatch()
+        bound: dict[Hashable, tuple[tuple, ft.DataRow]] = {}
+        rows: list[ft.DataRow] = []
+        for key, values in records:
+            # chave repetida: a linha duplicada é sempre montada de novo
+            if key in bound:
+                key = (key, len(rows))
+            current = self.bound_rows.get(key)
+            if current is None:
+                row = self.build_row(values)
+                patch.inserted += 1
+            elif current[0] == values:
+                row = current[1]
+                patch.unchanged += 1
+            else:
+                row = self.update_row(current[1], current[0], values)
+                patch.changed += 1
+            bound[key] = (values, row)
+            rows.append(row)
+        removed = [row for key, (_, row) in self.bound_rows.items() if key not in bound]
+        patch.removed = len(removed)
+        if self.pool_rows and self.row_builder is None:
+            # linhas das chaves removidas (nenhuma delas continua em rows)
+            self.row_pool.extend(removed)
+        self.bound_rows = bound
+        self.table.rows = rows
+        return patch
+
+    def refresh(self, ctx: ft.Page):
+        """
+        Recarrega as linhas (fonte de dados ou reload()) e agenda uma única
+        atualização da tabela.
+        """
+        if self.data_source is not None:
+            try:
+                patch = self.patch(self.data_source.records())
+            except Exception:
+                logger.exception("Falha ao recarregar a tabela %s", self.key)
+                return
+            logger.debug("Tabela recarregada", extra={"fields": {"table": self.key, **patch.to_dict()}})
+        elif self.reload_rows is not None:
+            self.table.rows = self.reload_rows()
+        schedule_update(self.table)
@@ -0,0 +1,177 @@
+"""
+Módulo virtual_table: tabela paginada para DataFrames/LazyFrames do Polars.
+Define classe VirtualTable que estende Table, materializando apenas a janela
+visível de linhas. Filtro, ordenação e contagem são feitos pelo Polars
+(plano lazy), de modo que o custo de exibir 500 mil linhas é o mesmo de
+exibir uma página.
+"""
+# importa flet para construção de controles UI
+import flet as ft
+# importa polars para consultas sobre a fonte de dados
+import polars as pl
+# importa Table como base (botão de recarregar + DataTable)
+from engine.ui.table import Table
+# atualizações agrupadas em um único envio por tick
+from engine.batch import schedule_update
+# formatação vetorizada das células
+from engine.ui.cell_format import Formatter, format_exprs, display_rows
+
+
+class VirtualTable(Table):
+    """
+    Tabela virtualizada com paginação, filtro e ordenação no servidor.
+    Recebe contexto da página, chave única, o frame de origem e o tamanho da página.
+    `formatters` troca a formatação padrão por tipo (cell_format) de colunas
+    específicas; a janela já chega do Polars como texto de exibição.
+    """
+    def __init__(
+        self,
+        ctx: ft.Page,
+        key: str,
+        frame: pl.DataFrame | pl.LazyFrame,
+        page_size: int = 50,
+        formatters: dict[str, Formatter] | None = None,
+    ) -> None:
+        # fonte de dados sempre tratada como plano lazy
+        self.source: pl.LazyFrame = frame.lazy()
+        self.schema: pl.Schema = self.source.collect_schema()
+        self.column_names: list[str] = self.schema.names()
+        self.formatters: dict[str, Formatter] = formatters or {}
+        self.page_size: int = page_size
+        self.offset: int = 0
+        self.filter_text: str = ""
+        self.sort_column: str | None = None
+        self.sort_descending: bool = False
+        # total de linhas após o filtro (recalculado só quando o filtro muda)
+        self.total: int | None = None
+
+        super().__init__(
+            ctx,
+            key,
+            columns=[
+                ft.DataColumn(ft.Text(col), on_sort=self.on_sort)
+                for col in self.column_names
+            ],
+            rows=[],
+            pool_rows=True,
+        )
+
+        # controles de navegação entre páginas
+        self.page_label = ft.Text()
+        self.first_btn = ft.IconButton(ft.icons.FIRST_PAGE, tooltip="Primeira página", on_click=lambda e: self.go_to(0))
+        self.prev_btn = ft.IconButton(ft.icons.CHEVRON_LEFT, tooltip="Página anterior", on_click=lambda e: self.go_to(self.offset - self.page_size))
+        self.next_btn = ft.IconButton(ft.icons.CHEVRON_RIGHT, tooltip="Próxima página", on_click=lambda e: self.go_to(self.offset + self.page_size))
+        self.last_btn = ft.IconButton(ft.icons.LAST_PAGE, tooltip="Última página", on_click=lambda e: self.go_to(self.last_offset()))
+        self.filter_field = ft.TextField(
+            hint_text="Filtrar",
+            dense=True,
+            expand=True,
+            on_submit=lambda e: self.set_filter(e.control.value),
+        )
+        self.toolbar = ft.Row([
+            self.filter_field,
+            self.first_btn,
+            self.prev_btn,
+            self.page_label,
+            self.next_btn,
+            self.last_btn,
+        ])
+        # barra de navegação faz parte dos controles originais do Component
+        self.origin.insert(1, self.toolbar)
+        self.wrapper.controls.insert(1, self.toolbar)
+
+        self.load_window()
+
+    def query(self) -> pl.LazyFrame:
+        """
+        Monta o plano lazy com filtro (texto em qualquer coluna) e ordenação.
+        O filtro busca no texto exibido (format_exprs), o que também cobre
+        colunas sem cast para pl.String (listas, structs).
+        """
+        plan = self.source
+        if self.filter_text:
+            plan = plan.filter(pl.any_horizontal(
+                text.str.contains(self.filter_text, literal=True)
+                for text in format_exprs(self.schema, self.formatters)
+            ))
+        if self.sort_column:
+            plan = plan.sort(self.sort_column, descending=self.sort_descending, nulls_last=True)
+        return plan
+
+    def last_offset(self) -> int:
+        """Offset da última página."""
+        if not self.total:
+            return 0
+        return ((self.total - 1) // self.page_size) * self.page_size
+
+    def load_window(self) -> None:
+        """
+        Materializa a janela [offset, offset + page_size) e atualiza os controles.
+        """
+        plan = self.query()
+        if self.total is None:
+            self.total = plan.select(pl.len()).collect().item()
+        self.offset = max(0, min(self.offset, self.last_offset()))
+
+        # a formatação faz parte do plano e roda só sobre a janela
+        window = plan.slice(self.offset, self.page_size).select(format_exprs(self.schema, self.formatters)).collect()
+        # linhas indexadas pela posição na janela: ao trocar de página, filtrar
+        # ou ordenar, os DataRow exibidos são reaproveitados e só os textos
+        # alterados são enviados
+        self.patch(list(enumerate(display_rows(window))))
+
+        start = self.offset + 1 if self.total else 0
+        end = self.offset + window.height
+        self.page_label.value = f"{start}-{end} de {self.total}"
+        self.first_btn.disabled = self.prev_btn.disabled = self.offset == 0
+        self.next_btn.disabled = self.last_btn.disabled = end >= self.total
+
+        schedule_update(self.wrapper)
+
+    def go_to(self, offset: int) -> None:
+        """Navega para a página que começa em offset."""
+        self.offset = offset
+        self.load_window()
+
+    def set_filter(self, text: str) -> None:
+        """Aplica filtro textual e volta para a primeira página."""
+        self.filter_text = (text or "").strip()
+        self.total = None
+        self.offset = 0
+        self.load_window()
+
+    def on_sort(self, e: ft.DataColumnSortEvent) -> None:
+        """Ordena pela coluna clicada (alternando asc/desc)."""
+        self.sort_column = self.column_names[e.column_index]
+        self.sort_descending = not e.ascending
+        self.table.sort_column_index = e.column_index
+        self.table.sort_ascending = e.ascending
+        self.offset = 0
+        self.load_window()
+
+    def set_frame(self, frame: pl.DataFrame | pl.LazyFrame) -> None:
+        """Troca a fonte de dados mantendo filtro e ordenação quando possível."""
+        self.source = frame.lazy()
+        self.schema = self.source.collect_schema()
+        column_names = self.schema.names()
+        if column_names != self.column_names:
+            self.column_names = column_names
+            self.table.columns = [
+                ft.DataColumn(ft.Text(col), on_sort=self.on_sort)
+                for col in column_names
+            ]
+            self.sort_column = None
+            self.table.sort_column_index = None
+        self.total = None
+        self.load_window()
+
+    def refresh(self, ctx: ft.Page):
+        """
+        Recarrega a janela atual a partir da fonte (em vez de repor
+        os controles originais).
+        """
+        self.total = None
+        self.load_window()
+
+
+__all__ = ["VirtualTable"]
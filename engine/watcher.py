@@ -0,0 +1,94 @@
+"""
+Módulo watcher: observa arquivos .py por polling e notifica mudanças.
+Usado pelo hot-reload do App para reimportar apenas os arquivos alterados.
+O polling (um os.scandir por diretório a cada intervalo) não depende de
+bibliotecas nativas e funciona igual em compartilhamentos de rede.
+"""
+from pathlib import Path
+from typing import Callable
+import os
+import threading
+
+from engine.env import blacklist
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+# diretórios que nunca contêm código observado
+ignored_dirs = {*blacklist, ".cache", ".git"}
+
+
+class FileWatcher:
+    """
+    Observa recursivamente os arquivos .py de um conjunto de diretórios.
+
+    Uso básico:
+
+        watcher = FileWatcher([APP_DIR, SCRIPTS_DIR], on_change=lambda paths: ...)
+        watcher.start()
+
+    Args:
+        roots: Diretórios observados
+        on_change: Callback com a lista de arquivos criados, alterados ou removidos
+        interval: Intervalo entre varreduras, em segundos
+    """
+    def __init__(self, roots: list[Path], on_change: Callable[[list[Path]], None], interval: float = 1.0) -> None:
+        self.roots: list[Path] = roots
+        self.on_change = on_change
+        self.interval: float = interval
+        self._snapshot: dict[Path, int] = self.scan()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def scan(self) -> dict[Path, int]:
+        """Retorna {arquivo: mtime_ns} de todos os .py observados."""
+        snapshot: dict[Path, int] = {}
+        stack = [root for root in self.roots if root.is_dir()]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for item in it:
+                        if item.is_dir():
+                            if item.name not in ignored_dirs:
+                                stack.append(Path(item.path))
+                        elif item.name.endswith(".py"):
+                            snapshot[Path(item.path)] = item.stat().st_mtime_ns
+            except OSError:
+                # diretório removido durante a varredura
+                continue
+        return snapshot
+
+    def poll(self) -> list[Path]:
+        """
+        Compara o estado atual com a última varredura e devolve os arquivos
+        criados, alterados ou removidos desde então.
+        """
+        current = self.scan()
+        changed = [
+            path for path in current.keys() | self._snapshot.keys()
+            if current.get(path) != self._snapshot.get(path)
+        ]
+        self._snapshot = current
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            changed = self.poll()
+            if not changed:
+                continue
+            try:
+                self.on_change(changed)
+            except Exception:
+                logger.exception("Falha ao recarregar %d arquivo(s)", len(changed))
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+__all__ = ["FileWatcher"]
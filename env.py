@@ -1,7 +1,9 @@
-from engine import Modules
+from engine import Modules, JobRunner
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
 APP_DIR = BASE_DIR / "src" / "app"
+SCRIPTS_DIR = BASE_DIR / "scripts"
 
-scripts = Modules(dir=BASE_DIR / "scripts", main="execute")
\ No newline at end of file
+scripts = Modules(dir=SCRIPTS_DIR, main="execute")
+jobs = JobRunner(scripts)
\ No newline at end of file
@@ -0,0 +1,114 @@
+import flet as ft
+from datetime import datetime
+from engine import BaseRouteProps, Table, get_logger, metrics, static_params_cache, get_downloads_path, open_downloads
+
+"""
+  Diagnóstico da renderização:
+    - percentis (p50/p95/p99) de navegação, página, layouts e ctx.update
+    - navegações recentes
+    - sessões ativas e cache de generate_static_params/generate_metadata
+    - exportação das métricas (JSON ou Prometheus) na pasta de downloads
+"""
+
+# dados ao vivo: a página é montada a cada navegação (fora do PageCache)
+cache = False
+
+logger = get_logger(__name__)
+
+def format_metric(name: str, value: float) -> str:
+  if name == "controls":
+    return f"{value:.0f}"
+  return f"{value * 1000:.1f} ms"
+
+class MetricsTable(Table):
+  """
+  Resumo das séries de engine.metrics; o botão de recarregar lê os valores atuais.
+  """
+  def __init__(self, props: BaseRouteProps):
+    super().__init__(
+      key="tabela_metricas",
+      ctx=props.ctx,
+      columns=["Métrica", "Amostras", "Média", "p50", "p95", "p99", "Máx."],
+      rows=self.build_rows(),
+      reload=self.build_rows,
+    )
+
+  def build_rows(self) -> list[ft.DataRow]:
+    return [
+      ft.DataRow(
+        cells=[
+          ft.DataCell(ft.Text(name)),
+          ft.DataCell(ft.Text(str(summary["count"]))),
+          *(
+            ft.DataCell(ft.Text(format_metric(name, summary[field])))
+            for field in ("mean", "p50", "p95", "p99", "max")
+          ),
+        ]
+      )
+      for name, summary in sorted(metrics.summary().items())
+    ]
+
+class RecentRendersTable(Table):
+  """
+  Últimas navegações (mais recentes primeiro).
+  """
+  def __init__(self, props: BaseRouteProps):
+    super().__init__(
+      key="tabela_navegacoes",
+      ctx=props.ctx,
+      columns=["Horário", "Caminho", "Navegação", "Página", "Layouts", "Update", "Controles", "Erro"],
+      rows=self.build_rows(),
+      reload=self.build_rows,
+    )
+
+  def build_rows(self) -> list[ft.DataRow]:
+    return [
+      ft.DataRow(
+        cells=[
+          ft.DataCell(ft.Text(datetime.fromtimestamp(event["timestamp"]).strftime("%H:%M:%S"))),
+          ft.DataCell(ft.Text(event["path"])),
+          *(
+            ft.DataCell(ft.Text(format_metric(name, event["timings"][name]) if name in event["timings"] else "-"))
+            for name in ("navigation", "page", "layout", "update")
+          ),
+          ft.DataCell(ft.Text(str(event["controls"]))),
+          ft.DataCell(ft.Text(event["error"] or "", color=ft.Colors.RED)),
+        ]
+      )
+      for event in reversed(metrics.snapshot()["recent"])
+    ]
+
+def status_text(props: BaseRouteProps) -> str:
+  sessions = props.router.renderer.sessions.stats()
+  cache = static_params_cache.stats()
+  counters = metrics.snapshot()["counters"]
+  return " | ".join([
+    f"sessões: {sessions['active']} ativas, pico {sessions['peak']}, total {sessions['total']}",
+    f"cache de parâmetros: {cache['entries']} entradas, {cache['hits']} acertos, {cache['misses']} execuções",
+    ", ".join(f"{name}: {value}" for name, value in sorted(counters.items())) or "sem contadores",
+  ])
+
+def page(props: BaseRouteProps):
+  """
+  Diagnostics page
+  """
+  def export(suffix: str):
+    target = get_downloads_path() / f"metricas_{datetime.now():%Y%m%d_%H%M%S}.{suffix}"
+    try:
+      metrics.export(target)
+      props.ctx.open(ft.SnackBar(ft.Text(f"Métricas exportadas em {target}")))
+      open_downloads()
+    except Exception as e:
+      logger.exception("Falha ao exportar métricas")
+      props.ctx.open(ft.SnackBar(ft.Text(f"Falha ao exportar métricas: {e}")))
+
+  return [
+    ft.Text("Diagnóstico", size=30),
+    ft.Text(status_text(props)),
+    ft.Row([
+      ft.ElevatedButton("exportar JSON", icon=ft.icons.DOWNLOAD, on_click=lambda _: export("json")),
+      ft.ElevatedButton("exportar Prometheus", icon=ft.icons.DOWNLOAD, on_click=lambda _: export("prom")),
+    ]),
+    MetricsTable(props).renderer(),
+    RecentRendersTable(props).renderer(),
+  ]
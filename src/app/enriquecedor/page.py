@@ -9,28 +9,36 @@ FLUXO:
   - download do arquivo enriquecido
 """
 
-from engine import BaseRouteProps, join, get_downloads_path, open_downloads, Table
+from engine import BaseRouteProps, join, JoinStats, export_frame, ExportFormat, ExportProgress, get_downloads_path, open_downloads, Table, VirtualTable, executor, CancellationToken, schedule_update, batch
 import flet as ft
+from functools import partial
 from pathlib import Path
 import polars as pl 
 
 from src.components.dataframe_table import dataframe_table
 from src.lib.file_picker import FilePicker
-
-templates ={
-  "hsm": ["CNPJ", "E-mail"],
-  "sms": ["CNPJ", "Telefone"],
-  "asc": ["CNPJ", "Telefone"],
-}
+from src.lib.contact_base import contact_base
+from src.lib.cnpj import normalize_document
+from src.lib.enrichment import EnrichmentTemplate, templates
 
 # Helper function to load the base contact data
-def load_base(max_cnpj:int):
+def load_base(cnpjs: pl.Series) -> pl.DataFrame:
+  """
+  Look up the given normalized CNPJs in the contact base index and return the unique,
+  non-null CNPJ, Telefone, and E-mail rows found. Only the matching rows are read.
+  """
+  return (
+    contact_base.index().lookup(cnpjs)
+    .select("CNPJ", "Telefone", "E-mail")
+    .drop_nulls()
+    .unique("Telefone")
+  )
+
+def cnpj_keys(source: pl.LazyFrame) -> pl.Series:
   """
-  Load the base contact data from an Excel file and return a unique, non-null DataFrame
-  containing CNPJ, Telefone, and E-mail columns.
+  Return the distinct valid CNPJs/CPFs of the picked file as UInt64 keys.
   """
-  _base_df = pl.read_excel(Path("./src/data/carteiras.xlsx").absolute())
-  return _base_df["CNPJ", "Telefone", "E-mail"].unique("Telefone").drop_nulls().filter(pl.col("CNPJ").cast(pl.Int64) < int(max_cnpj))
+  return source.select(normalize_document(source, "CNPJ")).unique().collect(engine="streaming").to_series()
 
 # Enrichment page class
 class EnrichFile:
@@ -41,17 +49,37 @@ class EnrichFile:
   def __init__(self, route_props: BaseRouteProps):
     # Initialize route properties and UI components
     self.route_props: BaseRouteProps = route_props
+    # Start converting/opening the contact base while the user picks a file
+    contact_base.warm_up()
     self.route_props.ctx.scroll = True
     # File picker for selecting files
     self.file_picker = FilePicker(self.route_props)
     # Table container for displaying data previews
     self.table_container = ft.Column([Table(self.route_props.ctx, "preview-table", ["CNPJ"], []).renderer()])
+    # Preview table, reused across template changes and reloads
+    self.preview: VirtualTable | None = None
     self.joined_df: pl.DataFrame = pl.DataFrame()
+    # Selected enrichment template
+    self.template: EnrichmentTemplate | None = None
+    # Match statistics of the last join
+    self.join_stats: JoinStats | None = None
+    # Token of the background load in progress (cancelled when a new file is picked)
+    self.load_token: CancellationToken | None = None
 
     # File picker dialog
     self.pick_files_dialog = ft.FilePicker(on_result=self.on_file_picked)
-    # Export table button
+    # Export table button, output format and progress
     self.export_table_btn = ft.Button("exportar tabela", on_click=lambda _: self.export_files())
+    self.export_format = ft.Dropdown(
+      value=ExportFormat.XLSX,
+      width=120,
+      dense=True,
+      options=[ft.dropdown.Option(format) for format in ExportFormat.ALL],
+    )
+    self.export_progress = ft.ProgressBar(value=0, visible=False)
+    self.export_row = ft.Column([ft.Row([self.export_format, self.export_table_btn]), self.export_progress])
+    # Token of the export in progress
+    self.export_token: CancellationToken | None = None
     # Template selection card
     self.template_type = ft.Card(
       content=ft.Container(
@@ -60,7 +88,10 @@ class EnrichFile:
           ft.Text("Escolha o template de enriquecimento"),
           ft.RadioGroup(
             on_change=self.on_template_type_change,
-            content=ft.Column([ft.CupertinoRadio(value=template, label=template) for template in templates.keys()])
+            content=ft.Column([
+              ft.CupertinoRadio(value=template.name, label=f"{template.name} - {template.description}")
+              for template in templates.values()
+            ])
           ),
         ])
       )
@@ -83,6 +114,7 @@ class EnrichFile:
               self.pick_files_dialog,
               self.pick_files_btn,
               self.file_picker.message,
+              self.file_picker.progress,
               self.file_picker.children,
               ft.Container(expand=True)
             ],
@@ -103,77 +135,187 @@ class EnrichFile:
   def on_file_picked(self, e: ft.FilePickerResultEvent):
     """
     Handle the event when a file is picked.
+    The file is read in the background; the template card is shown once it is loaded.
+    """
+    self.file_picker.pick_files_result(e, on_loaded=self.on_file_loaded)
+
+  def on_file_loaded(self, frame: pl.LazyFrame):
+    """
+    Show the template selection and start the contact base join for the loaded file.
     """
-    self.file_picker.pick_files_result(e)
     self.file_picker.children.controls.append(self.template_type)
-    self.file_picker.children.update()
-    self.file_picker.message.value = f"{len(self.file_picker.files[0].stem)}"
-    self.file_picker.message.update()
-    
-    # Load the contact base
-    contact_base = self.load_contact_base(self.file_picker.dataframe["CNPJ"].max())
+    schedule_update(self.file_picker.children)
 
-    # Join the dataframes
-    self.joined_df = join(self.file_picker.dataframe, contact_base, keys=["CNPJ"], how="inner")
+    # Load the contact base and join it in the background
+    self.load_contact_base()
 
-  def load_contact_base(self, max_cnpj: int):
+  def load_contact_base(self):
     """
-    Load the contact base data and update the UI accordingly.
+    Load the contact base and join it with the picked file in a background worker.
+    A progress bar is shown above the picked file while the page stays interactive.
     """
-    body = list(self.content)
-    self.route_props.ctx.remove(*self.content)
-    self.route_props.ctx.add(self.loader)
-    self.route_props.ctx.update()
+    if self.load_token:
+      self.load_token.cancel()
+    token = self.load_token = CancellationToken()
+
+    self.joined_df = pl.DataFrame()
+    self.join_stats = None
+    if self.loader not in self.file_picker.children.controls:
+      self.file_picker.children.controls.insert(0, self.loader)
+    schedule_update(self.file_picker.children)
+
+    source = self.file_picker.lazyframe
+    stats: list[JoinStats] = []
+    executor.submit(
+      lambda: join(source, load_base(cnpj_keys(source)), keys=["CNPJ"], how="inner", key_dtype=pl.UInt64, normalizer=normalize_document, on_stats=stats.append),
+      on_done=lambda joined_df: self.on_contact_base_joined(token, joined_df, stats[0] if stats else None),
+      on_error=lambda e: self.on_contact_base_error(token, e),
+      token=token,
+    )
 
-    contact_base = load_base(max_cnpj)
+  def is_active(self, token: CancellationToken) -> bool:
+    """
+    Check whether a background result still belongs to the current file and page.
+    """
+    if token.cancelled:
+      return False
+    return not (self.route_props.token and self.route_props.token.cancelled)
 
-    self.route_props.ctx.remove(self.loader)
-    self.route_props.ctx.add(*body)
+  def on_contact_base_joined(self, token: CancellationToken, joined_df: pl.DataFrame, stats: JoinStats | None = None):
+    """
+    Store the enriched data and show the match statistics once the background join finishes.
+    """
+    if not self.is_active(token):
+      return
+    self.joined_df = joined_df
+    self.join_stats = stats
+    # statistics, loader and preview are sent to the client in a single update
+    with batch(self.route_props.ctx):
+      if stats:
+        self.file_picker.message.value = stats.describe()
+        schedule_update(self.file_picker.message)
+      self.hide_loader()
+      self.show_preview()
 
-    return contact_base
+  def on_contact_base_error(self, token: CancellationToken, e: Exception):
+    """
+    Report a failure while loading the contact base.
+    """
+    if not self.is_active(token):
+      return
+    self.file_picker.message.value = f"Erro ao carregar a base de contatos: {e}"
+    schedule_update(self.file_picker.message)
+    self.hide_loader()
+
+  def hide_loader(self):
+    """
+    Remove the progress bar shown during background work.
+    """
+    if self.loader in self.file_picker.children.controls:
+      self.file_picker.children.controls.remove(self.loader)
+    schedule_update(self.file_picker.children)
 
   def export_files(self):
     """
-    Export the enriched data to an Excel file.
+    Export the enriched data in the selected format (xlsx, csv or parquet) in a background worker.
     """
-    if self.file_picker.dataframe.is_empty():
+    if self.file_picker.lazyframe is None:
       self.file_picker.message.value = "Nenhum arquivo selecionado"
-      self.file_picker.message.update()
+      schedule_update(self.file_picker.message)
       return
 
     # Check if the required column exists
     required_columns = ["CNPJ", "cnpj", "CNPJ_CPF", "CNPJCPF", "NUMCGCCPECPFCLI", "NUMCGCCPF", "NUMCGCCPFCLI"]
-    existing_columns = set(self.file_picker.dataframe.columns)
+    existing_columns = set(self.file_picker.columns)
     matching_columns = [col for col in required_columns if col in existing_columns]
 
     if not matching_columns:
       self.file_picker.message.value = "Coluna de CNPJ não encontrada no arquivo"
-      self.file_picker.message.update()
+      schedule_update(self.file_picker.message)
       return
 
     # Normalize the CNPJ column name
-    self.file_picker.dataframe = self.file_picker.dataframe.rename({col: "CNPJ" for col in matching_columns})
+    self.file_picker.lazyframe = self.file_picker.lazyframe.rename({col: "CNPJ" for col in matching_columns})
  
     # Export the enriched data
-    self.joined_df.write_excel(get_downloads_path() / f"{self.file_picker.files[0].stem}_enriquecido.xlsx")
+    if self.export_token:
+      self.export_token.cancel()
+    token = self.export_token = CancellationToken()
+    target = get_downloads_path() / f"{self.file_picker.files[0].stem}_enriquecido.{self.export_format.value}"
+
+    self.export_progress.value = 0
+    self.export_progress.visible = True
+    schedule_update(self.export_progress)
+    enriched = self.template.compile(self.joined_df) if self.template else self.joined_df
+    # The executor consumes its own token= keyword, so export_frame gets the token through partial
+    executor.submit(
+      partial(
+        export_frame, enriched, target, self.export_format.value,
+        on_progress=lambda progress: self.on_export_progress(token, progress),
+        token=token,
+      ),
+      on_done=lambda path: self.on_exported(token, path),
+      on_error=lambda e: self.on_export_error(token, e),
+      token=token,
+    )
+
+  def on_export_progress(self, token: CancellationToken, progress: ExportProgress):
+    """
+    Show the rows written so far.
+    """
+    if not self.is_active(token):
+      return
+    self.export_progress.value = progress.fraction
+    self.file_picker.message.value = progress.describe()
+    schedule_update(self.export_progress, self.file_picker.message)
+
+  def on_exported(self, token: CancellationToken, path: Path):
+    """
+    Hide the export progress and open the downloads folder.
+    """
+    if not self.is_active(token):
+      return
+    self.export_progress.visible = False
+    schedule_update(self.export_progress)
     open_downloads()
-    self.file_picker.children.update()
+
+  def on_export_error(self, token: CancellationToken, e: Exception):
+    """
+    Report a failure while exporting the enriched data.
+    """
+    if not self.is_active(token):
+      return
+    self.export_progress.visible = False
+    self.file_picker.message.value = f"Erro ao exportar: {e}"
+    schedule_update(self.export_progress, self.file_picker.message)
 
   def on_template_type_change(self, e: ft.ControlEvent):
     """
     Handle changes in the selected enrichment template.
     """
-    self.table_container.controls.clear()
-    
-    columns = templates[e.data]
-    if columns:
-      _tab = dataframe_table(self.file_picker.route_props, self.file_picker.dataframe[columns].head(15))
+    self.template = templates[e.data]
+    self.show_preview()
 
-    self.table_container.controls.append(_tab.renderer())
-    self.table_container.update()
+    if self.export_row not in self.file_picker.children.controls:
+      self.file_picker.children.controls.append(self.export_row)
+    schedule_update(self.file_picker.children)
 
-    self.file_picker.children.controls.append(self.export_table_btn)
-    self.file_picker.children.update()
+  def show_preview(self):
+    """
+    Preview the enriched data through the selected template's lazy plan.
+    Nothing is shown until both a template is selected and the join has finished.
+    """
+    if self.template is None or self.joined_df.is_empty():
+      return
+    frame = self.template.compile(self.joined_df)
+    if self.preview is not None:
+      # Rebind the existing table: only the cells that differ are sent
+      self.preview.set_frame(frame)
+      return
+    self.preview = dataframe_table(self.file_picker.route_props, frame)
+    self.table_container.controls.clear()
+    self.table_container.controls.append(self.preview.renderer())
+    schedule_update(self.table_container)
 
   def pick_files(self):
     """
@@ -0,0 +1,122 @@
+import flet as ft
+import logging
+import threading
+from datetime import datetime
+from engine import BaseRouteProps, Table, LogEntry, ring_buffer
+
+"""
+  Visualizador de logs:
+    - últimos registros do ring buffer da engine (mais recentes primeiro)
+    - filtro por nível e por texto
+    - atualização ao vivo, agrupada em no máximo uma atualização por intervalo
+"""
+
+# dados ao vivo: a página é montada a cada navegação (fora do PageCache)
+cache = False
+
+levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+level_colors = {
+  "DEBUG": ft.Colors.GREY,
+  "INFO": ft.Colors.BLUE,
+  "WARNING": ft.Colors.ORANGE,
+  "ERROR": ft.Colors.RED,
+  "CRITICAL": ft.Colors.RED,
+}
+
+class LogsTable(Table):
+  """
+  Tabela dos registros do ring buffer; novos registros marcam a tabela como
+  desatualizada e ela é redesenhada a cada `interval` segundos no máximo.
+  """
+  def __init__(self, props: BaseRouteProps, limit: int = 200, interval: float = 0.5):
+    self.props = props
+    self.limit = limit
+    self.interval = interval
+    self.level = logging.INFO
+    self.text = ""
+    self._timer: threading.Timer | None = None
+    self._lock = threading.Lock()
+    super().__init__(
+      key="tabela_logs",
+      ctx=props.ctx,
+      columns=["Horário", "Nível", "Logger", "Mensagem"],
+      rows=self.build_rows(),
+      reload=self.build_rows,
+    )
+    self.unsubscribe = ring_buffer.subscribe(self.on_entry)
+
+  def entries(self) -> list[LogEntry]:
+    entries = ring_buffer.records(level=self.level)
+    if self.text:
+      text = self.text.lower()
+      entries = [entry for entry in entries if text in entry.message.lower() or text in entry.logger.lower()]
+    return entries[::-1][:self.limit]
+
+  def build_rows(self) -> list[ft.DataRow]:
+    return [
+      ft.DataRow(
+        cells=[
+          ft.DataCell(ft.Text(datetime.fromtimestamp(entry.created).strftime("%H:%M:%S"))),
+          ft.DataCell(ft.Text(entry.level, color=level_colors.get(entry.level))),
+          ft.DataCell(ft.Text(entry.logger.removeprefix("engine."))),
+          ft.DataCell(ft.Text(
+            " ".join([entry.message, *(f"{key}={value}" for key, value in entry.fields.items()), entry.error or ""]).strip(),
+            selectable=True,
+          )),
+        ]
+      )
+      for entry in self.entries()
+    ]
+
+  def on_entry(self, entry: LogEntry):
+    if entry.levelno < self.level:
+      return
+    with self._lock:
+      if self._timer is not None:
+        return
+      self._timer = threading.Timer(self.interval, self.flush)
+      self._timer.daemon = True
+      self._timer.start()
+
+  def flush(self):
+    with self._lock:
+      self._timer = None
+    # a sessão navegou para outra página: deixa de acompanhar o buffer
+    if self.table.page is None and self.props.router.url != "/logs":
+      self.unsubscribe()
+      return
+    self.refresh(self.ctx)
+
+  def set_filter(self, level: str | None = None, text: str | None = None):
+    if level is not None:
+      self.level = logging.getLevelName(level)
+    if text is not None:
+      self.text = text
+    self.refresh(self.ctx)
+
+def page(props: BaseRouteProps):
+  """
+  Logs page
+  """
+  table = LogsTable(props)
+
+  return [
+    ft.Text("Logs", size=30),
+    ft.Row([
+      ft.Dropdown(
+        label="Nível",
+        value="INFO",
+        width=160,
+        options=[ft.dropdown.Option(level) for level in levels],
+        on_change=lambda e: table.set_filter(level=e.control.value),
+      ),
+      ft.TextField(
+        label="Filtrar",
+        width=320,
+        on_change=lambda e: table.set_filter(text=e.control.value),
+      ),
+      ft.IconButton(ft.icons.DELETE_OUTLINE, tooltip="Limpar", on_click=lambda e: (ring_buffer.clear(), table.refresh(props.ctx))),
+    ]),
+    table.renderer(),
+  ]
@@ -1,9 +1,11 @@
 import flet as ft
 from src.components.scripts_table import scripts_table
+from src.components.jobs_table import jobs_table
 from engine import BaseRouteProps
 
 def page(props: BaseRouteProps):
   
   return [
-    scripts_table(props).renderer()
+    scripts_table(props).renderer(),
+    jobs_table(props).renderer(),
   ] 
\ No newline at end of file
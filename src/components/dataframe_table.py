@@ -1,17 +1,20 @@
 import flet as ft
-from engine import BaseRouteProps, Table
+from engine import BaseRouteProps, VirtualTable, Formatter
 import polars as pl
-    
-def dataframe_table(props: BaseRouteProps, dataframe: pl.DataFrame):
-  return Table(
+from src.lib.cnpj import format_document_column
+
+# colunas de documento exibidas com a pontuação usual
+document_columns = ["CNPJ", "cnpj", "CNPJ_CPF", "CNPJCPF"]
+
+def dataframe_table(props: BaseRouteProps, dataframe: pl.DataFrame | pl.LazyFrame, page_size: int = 50, formatters: dict[str, Formatter] | None = None):
+  """
+  Tabela paginada: apenas a página visível do frame vira controles Flet,
+  com as células formatadas pelo Polars (por tipo e CNPJ/CPF pontuado).
+  """
+  return VirtualTable(
     key="dataframe_table",
     ctx=props.ctx,
-    columns=[ft.DataColumn(ft.Text(col)) for col in dataframe.columns],
-    rows=[
-        ft.DataRow(
-            cells=[ft.DataCell(ft.Text(str(value))) for value in row]
-        )
-        for row in dataframe.rows()
-    ],
+    frame=dataframe,
+    page_size=page_size,
+    formatters={**{column: format_document_column for column in document_columns}, **(formatters or {})},
   )
-  
\ No newline at end of file
@@ -0,0 +1,71 @@
+import flet as ft
+from env import jobs
+from engine import BaseRouteProps, Table, Job, JobStatus
+
+status_colors = {
+  JobStatus.QUEUED: ft.Colors.GREY,
+  JobStatus.RUNNING: ft.Colors.BLUE,
+  JobStatus.DONE: ft.Colors.GREEN,
+  JobStatus.FAILED: ft.Colors.RED,
+  JobStatus.CANCELLED: ft.Colors.GREY,
+}
+
+def format_duration(job: Job) -> str:
+  if job.duration is None:
+    return "-"
+  return f"{job.duration:.1f}s"
+
+def show_output(ctx: ft.Page, job: Job):
+  """
+  Abre um diálogo com stdout, stderr e erro do job.
+  """
+  output = "\n".join(part for part in (job.stdout, job.stderr, job.error) if part) or "Sem saída."
+  ctx.open(ft.AlertDialog(
+    title=ft.Text(f"Job {job.id} - {job.name}"),
+    content=ft.Column([ft.Text(output, selectable=True, font_family="monospace")], scroll=ft.ScrollMode.AUTO),
+  ))
+
+class JobsTable(Table):
+  """
+  Tabela de jobs com atualização ao vivo: escuta o JobRunner e reconstrói
+  as linhas a cada mudança de status.
+  """
+  def __init__(self, props: BaseRouteProps):
+    self.props = props
+    super().__init__(
+      key="tabela_jobs",
+      ctx=props.ctx,
+      columns=["Job", "Script", "Status", "Duração", ""],
+      rows=self.build_rows(),
+      reload=self.build_rows,
+    )
+    jobs.subscribe(self.on_job_changed)
+
+  def build_rows(self) -> list[ft.DataRow]:
+    return [
+      ft.DataRow(
+        cells=[
+          ft.DataCell(ft.Text(str(job.id))),
+          ft.DataCell(ft.Text(job.name)),
+          ft.DataCell(ft.Text(job.status, color=status_colors.get(job.status))),
+          ft.DataCell(ft.Text(format_duration(job))),
+          ft.DataCell(
+            content=ft.Row(
+              controls=[
+                ft.IconButton(ft.icons.ARTICLE_OUTLINED, tooltip="Saída", on_click=lambda e, j=job: show_output(self.props.ctx, j)),
+                ft.IconButton(ft.icons.CANCEL_OUTLINED, tooltip="Cancelar", visible=job.status == JobStatus.QUEUED, on_click=lambda e, j=job: jobs.cancel(j.id)),
+              ],
+              alignment=ft.MainAxisAlignment.END,
+            ),
+          ),
+        ]
+      )
+      for job in jobs.list_jobs()
+    ]
+
+  def on_job_changed(self, job: Job | None = None):
+    # mudanças de status em sequência viram um único envio
+    self.refresh(self.ctx)
+
+def jobs_table(props: BaseRouteProps):
+  return JobsTable(props)
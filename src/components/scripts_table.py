@@ -1,52 +1,58 @@
 import flet as ft
-from env import scripts
-from engine import BaseRouteProps, Table
+from env import scripts, jobs
+from engine import BaseRouteProps, Table, get_logger
+
+logger = get_logger(__name__)
 
 def executar_modulo(key, page: ft.Page = None):
-  print(f"Executando módulo: {key}")
-  module = scripts[key]
-  if not module:
-    print(f"Módulo {key} não encontrado.")
-    return
-  
-  try: module.main()
-  except Exception as e:
-    print(f"Erro ao executar o módulo {key}: {e}")
+  """
+  Enfileira o script no JobRunner; a execução acontece em outro processo
+  e o andamento aparece na tabela de jobs.
+  """
+  logger.info("Executando módulo %s", key)
+  try: 
+    jobs.submit(key)
+  except KeyError:
+    logger.warning("Módulo %s não encontrado.", key)
+  except Exception:
+    logger.exception("Falha ao enfileirar o módulo %s", key)
 
 # Callback para ações rápidas (menu suspenso)
 def abrir_acoes_rapidas( key: str):
-  print(f"Ações rápidas para: {key}")
+  logger.debug("Ações rápidas para %s", key)
   # Aqui você pode abrir um popup/menu
 
     
+def script_row(props: BaseRouteProps, module: str) -> ft.DataRow:
+  return ft.DataRow(
+    cells=[
+      ft.DataCell(ft.Text(module)),
+      ft.DataCell(
+        content=ft.Row(
+          controls=[
+            ft.IconButton(ft.icons.ARROW_OUTWARD_SHARP, tooltip="ir para", on_click=lambda e, m=module, p=props: p.router.navigate("/" + m)),
+            ft.PopupMenuButton(
+              icon=ft.icons.MORE_VERT,
+              tooltip="Ações rápidas",
+              items=[
+                ft.PopupMenuItem(text="Executar", on_click=lambda e, m=module: executar_modulo(m)),
+                ft.PopupMenuItem(text="ir para", on_click=lambda e, m=module, p=props: p.router.navigate("/" + m)),
+              ]
+            )
+          ],
+          alignment=ft.MainAxisAlignment.END,
+        ),
+      ),
+    ]
+  )
+
 def scripts_table(props: BaseRouteProps):
+  # ligada ao registro de scripts: recarregar insere/remove apenas as linhas
+  # dos scripts adicionados ou removidos pelo hot reload
   return Table(
     key="tabela_scripts",
     ctx=props.ctx,
     columns=["Scripts", ""],
-    rows=[
-      ft.DataRow(
-        cells=[
-          ft.DataCell(ft.Text(module)),
-          ft.DataCell(
-            content=ft.Row(
-              controls=[
-                ft.IconButton(ft.icons.ARROW_OUTWARD_SHARP, tooltip="ir para", on_click=lambda e, m=module, p=props: p.router.navigate("/" + m)),
-                ft.PopupMenuButton(
-                  icon=ft.icons.MORE_VERT,
-                  tooltip="Ações rápidas",
-                  items=[
-                    ft.PopupMenuItem(text="Executar", on_click=lambda e, m=module: executar_modulo(m)),
-                    ft.PopupMenuItem(text="ir para", on_click=lambda e, m=module, p=props: p.router.navigate("/" + m)),
-                  ]
-                )
-              ],
-              alignment=ft.MainAxisAlignment.END,
-            ),
-          ),
-        ]
-      )
-      for module in scripts.keys()
-    ],
+    source=scripts,
+    row_builder=lambda values: script_row(props, values[0]),
   )
-  
\ No newline at end of file
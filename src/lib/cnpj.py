@@ -0,0 +1,165 @@
+"""
+Normalização de CNPJ/CPF como chave inteira.
+Documentos chegam como texto pontuado ("12.345.678/0001-95"), número ou float
+(planilhas); aqui todos viram UInt64 (os zeros à esquerda são implícitos),
+com os dígitos verificadores validados de forma vetorizada pelo Polars.
+A conversão é a de engine.dataframe (to_number/normalize_key); aqui fica só
+a validação. Documentos inválidos viram nulos e não participam do join.
+
+Também define DocumentIndex: um frame ordenado pela chave inteira, em que a
+busca de um conjunto de documentos é uma busca binária (search_sorted) em vez
+de um join entre textos de 14 caracteres.
+"""
+from functools import partial
+from pathlib import Path
+import polars as pl
+
+from engine.dataframe import normalize_key, to_number
+
+CNPJ_FIRST_WEIGHTS = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+CNPJ_SECOND_WEIGHTS = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+CPF_FIRST_WEIGHTS = [10, 9, 8, 7, 6, 5, 4, 3, 2]
+CPF_SECOND_WEIGHTS = [11, 10, 9, 8, 7, 6, 5, 4, 3, 2]
+
+
+def _digit(number: pl.Expr, position: int, width: int) -> pl.Expr:
+  """Dígito na posição (a partir da esquerda) de um número com width dígitos."""
+  return (number // 10 ** (width - 1 - position)) % 10
+
+
+def _check_digit(total: pl.Expr) -> pl.Expr:
+  rest = total % 11
+  return pl.when(rest < 2).then(0).otherwise(11 - rest)
+
+
+def _is_valid(number: pl.Expr, width: int, first_weights: list[int], second_weights: list[int]) -> pl.Expr:
+  first = _check_digit(pl.sum_horizontal([_digit(number, i, width) * w for i, w in enumerate(first_weights)]))
+  second = _check_digit(pl.sum_horizontal(
+    [_digit(number, i, width) * w for i, w in enumerate(second_weights[:-1])] + [first * second_weights[-1]]
+  ))
+  # documentos com todos os dígitos iguais (ex.: 111.111.111-11) passam no cálculo, mas não existem
+  repeated = int("1" * width)
+  return (
+    (number < 10 ** width)
+    & (number % repeated != 0)
+    & (_digit(number, width - 2, width) == first)
+    & (_digit(number, width - 1, width) == second)
+  )
+
+
+def is_valid_cnpj(number: pl.Expr) -> pl.Expr:
+  """Valida os dígitos verificadores de um CNPJ já convertido para UInt64."""
+  return _is_valid(number.cast(pl.Int64), 14, CNPJ_FIRST_WEIGHTS, CNPJ_SECOND_WEIGHTS)
+
+
+def is_valid_cpf(number: pl.Expr) -> pl.Expr:
+  """Valida os dígitos verificadores de um CPF já convertido para UInt64."""
+  return _is_valid(number.cast(pl.Int64), 11, CPF_FIRST_WEIGHTS, CPF_SECOND_WEIGHTS)
+
+
+def is_valid_document(number: pl.Expr) -> pl.Expr:
+  """
+  CNPJ ou CPF válido. Usado como validate de engine.normalize_key:
+
+      join(..., key_dtype=pl.UInt64, normalizer=partial(normalize_key, validate=is_valid_document))
+  """
+  return is_valid_cnpj(number) | is_valid_cpf(number)
+
+
+# normalizer do join para documentos: chave UInt64, nula quando inválida
+normalize_document = partial(normalize_key, validate=is_valid_document)
+
+
+def format_document(number: int) -> str:
+  """Formata um CNPJ ou CPF inteiro com a pontuação usual."""
+  if number < 10 ** 11 and pl.select(is_valid_cpf(pl.lit(number, dtype=pl.UInt64))).item():
+    text = f"{number:011d}"
+    return f"{text[:3]}.{text[3:6]}.{text[6:9]}-{text[9:]}"
+  text = f"{number:014d}"
+  return f"{text[:2]}.{text[2:5]}.{text[5:8]}/{text[8:12]}-{text[12:]}"
+
+
+def format_document_column(column: pl.Expr) -> pl.Expr:
+  """
+  Versão vetorizada de format_document para exibição em tabelas: aceita a
+  coluna como inteiro ou texto; valores que não são documentos ficam como estão.
+  """
+  text = column.cast(pl.String)
+  number = to_number(text, pl.String)
+  cpf = number.cast(pl.String).str.zfill(11)
+  cnpj = number.cast(pl.String).str.zfill(14)
+  return (
+    pl.when(number.is_null())
+    .then(text)
+    .when((number < 10 ** 11) & is_valid_cpf(number))
+    .then(pl.concat_str([cpf.str.slice(0, 3), pl.lit("."), cpf.str.slice(3, 3), pl.lit("."), cpf.str.slice(6, 3), pl.lit("-"), cpf.str.slice(9, 2)]))
+    .when(is_valid_cnpj(number))
+    .then(pl.concat_str([
+      cnpj.str.slice(0, 2), pl.lit("."), cnpj.str.slice(2, 3), pl.lit("."), cnpj.str.slice(5, 3),
+      pl.lit("/"), cnpj.str.slice(8, 4), pl.lit("-"), cnpj.str.slice(12, 2),
+    ]))
+    .otherwise(text)
+  )
+
+
+class DocumentIndex:
+  """
+  Frame ordenado por uma chave UInt64, para buscas por busca binária.
+
+  Uso básico:
+
+      index = DocumentIndex.build(contact_base.scan(), "CNPJ", path)
+      rows = index.lookup(source["CNPJ"])
+
+  Args:
+      frame: Frame já ordenado pela chave, sem chaves nulas
+      key: Coluna da chave
+  """
+  def __init__(self, frame: pl.DataFrame, key: str = "CNPJ"):
+    self.key: str = key
+    self.frame: pl.DataFrame = frame.with_columns(pl.col(key).set_sorted())
+    self.keys: pl.Series = self.frame[key]
+
+  @classmethod
+  def build(cls, frame: pl.LazyFrame, key: str, path: Path) -> "DocumentIndex":
+    """
+    Normaliza e ordena frame pela chave (engine de streaming) e grava o
+    resultado em path como Arrow IPC, retornando o índice carregado dele.
+    """
+    tmp = path.with_suffix(".tmp")
+    (
+      frame
+      .with_columns(normalize_document(frame, key))
+      .drop_nulls(key)
+      .sort(key)
+      .sink_ipc(tmp, engine="streaming")
+    )
+    tmp.replace(path)
+    return cls.load(path, key)
+
+  @classmethod
+  def load(cls, path: Path, key: str = "CNPJ") -> "DocumentIndex":
+    """Abre um índice gravado por build (o arquivo é mapeado em memória)."""
+    return cls(pl.read_ipc(path), key)
+
+  def __len__(self) -> int:
+    return self.frame.height
+
+  def __contains__(self, number: int) -> bool:
+    position = self.keys.search_sorted(number, side="left")
+    return position < len(self.keys) and self.keys[position] == number
+
+  def lookup(self, numbers: pl.Series) -> pl.DataFrame:
+    """
+    Retorna as linhas do índice cujas chaves estão em numbers (UInt64,
+    nulos ignorados), na ordem da chave.
+    """
+    numbers = numbers.drop_nulls().cast(pl.UInt64).unique().sort()
+    if numbers.is_empty():
+      return self.frame.clear()
+    bounds = pl.DataFrame({
+      "start": self.keys.search_sorted(numbers, side="left"),
+      "end": self.keys.search_sorted(numbers, side="right"),
+    }).filter(pl.col("end") > pl.col("start"))
+    rows = bounds.select(pl.int_ranges("start", "end").explode()).to_series()
+    return self.frame[rows]
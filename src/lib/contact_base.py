@@ -0,0 +1,118 @@
+"""
+Base de contatos em formato colunar.
+A planilha de origem (carteiras.xlsx) é convertida uma única vez para Arrow IPC
+e lida via memory map; a conversão é refeita apenas quando o mtime da planilha
+muda. O LazyFrame resultante é compartilhado pelo processo inteiro, permitindo
+que filtros e deduplicação sejam empurrados para a leitura.
+Sobre a mesma versão é mantido um DocumentIndex (base ordenada pelo CNPJ
+inteiro), usado para buscar os CNPJs de um arquivo por busca binária.
+"""
+from pathlib import Path
+import threading
+import os
+import polars as pl
+
+from src.lib.cnpj import DocumentIndex
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class ContactBase:
+  """
+  Cache colunar de uma planilha de contatos.
+
+  Args:
+      source: Planilha de origem (.xlsx/.xls)
+      cache_dir: Diretório onde o arquivo Arrow IPC é mantido
+  """
+  def __init__(self, source: Path, cache_dir: Path):
+    self.source: Path = source
+    self.cache_dir: Path = cache_dir
+    self._lock = threading.Lock()
+    self._frame: pl.LazyFrame | None = None
+    self._frame_mtime: int | None = None
+    self._index: DocumentIndex | None = None
+    self._index_mtime: int | None = None
+
+  def cache_path(self, mtime: int) -> Path:
+    """Arquivo IPC correspondente a uma versão (mtime) da planilha."""
+    return self.cache_dir / f"{self.source.stem}.{mtime}.arrow"
+
+  def convert(self, mtime: int) -> Path:
+    """
+    Converte a planilha para Arrow IPC (escrita atômica) e remove versões antigas.
+    """
+    target = self.cache_path(mtime)
+    self.cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".tmp")
+    # sem compressão: o scan_ipc consegue mapear o arquivo em memória
+    pl.read_excel(self.source).write_ipc(tmp, compression="uncompressed")
+    os.replace(tmp, target)
+
+    for old in self.cache_dir.glob(f"{self.source.stem}.*.arrow"):
+      if old != target:
+        try:
+          old.unlink(missing_ok=True)
+        except OSError:
+          # ainda mapeado em memória (Windows); será removido na próxima conversão
+          pass
+    return target
+
+  def scan(self) -> pl.LazyFrame:
+    """
+    Retorna o LazyFrame da base, convertendo a planilha se ela mudou.
+    Custa um stat na planilha quando o cache está válido.
+    """
+    mtime = self.source.stat().st_mtime_ns
+    if self._frame is not None and self._frame_mtime == mtime:
+      return self._frame
+
+    with self._lock:
+      if self._frame is None or self._frame_mtime != mtime:
+        target = self.cache_path(mtime)
+        if not target.exists():
+          target = self.convert(mtime)
+        self._frame = pl.scan_ipc(target)
+        self._frame_mtime = mtime
+    return self._frame
+
+  def index_path(self, mtime: int) -> Path:
+    """Arquivo do índice por CNPJ correspondente a uma versão da planilha."""
+    return self.cache_dir / f"{self.source.stem}.{mtime}.index.arrow"
+
+  def index(self, key: str = "CNPJ") -> DocumentIndex:
+    """
+    Retorna o índice da base pela coluna key (CNPJ/CPF normalizado e
+    validado), construindo-o na primeira chamada após a planilha mudar.
+    """
+    mtime = self.source.stat().st_mtime_ns
+    if self._index is not None and self._index_mtime == mtime:
+      return self._index
+
+    frame = self.scan()
+    with self._lock:
+      if self._index is None or self._index_mtime != mtime:
+        path = self.index_path(mtime)
+        self._index = DocumentIndex.load(path, key) if path.exists() else DocumentIndex.build(frame, key, path)
+        self._index_mtime = mtime
+    return self._index
+
+  def warm_up(self) -> threading.Thread:
+    """Prepara o cache em background (ex.: ao abrir a página de enriquecimento)."""
+    def prepare():
+      try:
+        self.index()
+      except Exception:
+        logger.exception("Não foi possível preparar a base de contatos")
+
+    thread = threading.Thread(target=prepare, name="contact-base-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+# Base de contatos compartilhada pelo processo
+contact_base = ContactBase(
+  Path("./src/data/carteiras.xlsx").absolute(),
+  cache_dir=Path("./src/.cache").absolute(),
+)
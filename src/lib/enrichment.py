@@ -0,0 +1,135 @@
+"""
+Templates de enriquecimento (tipos de disparo).
+Cada template declara as colunas de saída, com a expressão Polars que as
+formata e o tipo final, as colunas obrigatórias e a regra de deduplicação.
+compile() transforma o template em um único plano lazy sobre o resultado do
+join, executado pelo Polars de forma vetorizada na prévia e no export.
+
+Uso básico:
+
+    sms = EnrichmentTemplate("sms", [Column("CNPJ", document()), Column("Telefone", phone())], unique=["Telefone"])
+    plan = sms.compile(joined_df)
+"""
+import polars as pl
+
+from engine.dataframe import to_number
+from src.lib.cnpj import is_valid_cpf
+
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
+def phone(column: str = "Telefone") -> pl.Expr:
+  """
+  Telefone só com dígitos e DDI 55 (ex.: "(11) 98765-4321" -> "5511987654321").
+  Números que não têm 10/11 dígitos nacionais viram nulo.
+  """
+  digits = pl.col(column).cast(pl.String).str.replace_all(r"\D", "").str.strip_chars_start("0")
+  international = pl.when(digits.str.len_chars().is_between(10, 11)).then(pl.lit("55") + digits).otherwise(digits)
+  return pl.when(
+    international.str.starts_with("55") & international.str.len_chars().is_between(12, 13)
+  ).then(international)
+
+
+def email(column: str = "E-mail") -> pl.Expr:
+  """E-mail sem espaços e em minúsculas; endereços malformados viram nulo."""
+  value = pl.col(column).cast(pl.String).str.strip_chars().str.to_lowercase()
+  return pl.when(value.str.contains(EMAIL_PATTERN)).then(value)
+
+
+def document(column: str = "CNPJ") -> pl.Expr:
+  """
+  CNPJ/CPF inteiro como texto com os zeros à esquerda: 11 dígitos para CPFs
+  válidos, 14 para os demais (CNPJs).
+  """
+  text = pl.col(column).cast(pl.String)
+  number = to_number(text, pl.String)
+  return pl.when((number < 10 ** 11) & is_valid_cpf(number)).then(text.str.zfill(11)).otherwise(text.str.zfill(14))
+
+
+class Column:
+  """
+  Coluna de saída de um template.
+  name: nome da coluna no resultado
+  expr: expressão que calcula o valor (padrão: pl.col(name))
+  dtype: tipo final da coluna (padrão: o tipo da expressão)
+  """
+  def __init__(self, name: str, expr: pl.Expr | None = None, dtype: pl.DataType | None = None):
+    self.name: str = name
+    self.expr: pl.Expr = pl.col(name) if expr is None else expr
+    self.dtype: pl.DataType | None = dtype
+
+  def compile(self) -> pl.Expr:
+    expr = self.expr if self.dtype is None else self.expr.cast(self.dtype)
+    return expr.alias(self.name)
+
+
+class EnrichmentTemplate:
+  """
+  Template de enriquecimento.
+
+  Args:
+      name: Nome exibido na página
+      columns: Colunas de saída, na ordem do arquivo final
+      required: Colunas que não podem ser nulas (padrão: todas)
+      unique: Colunas da regra de deduplicação (mantém a primeira ocorrência)
+      description: Texto de ajuda exibido com o template
+  """
+  def __init__(
+    self,
+    name: str,
+    columns: list[Column],
+    required: list[str] | None = None,
+    unique: list[str] | None = None,
+    description: str = "",
+  ):
+    self.name: str = name
+    self.columns: list[Column] = columns
+    self.required: list[str] = [column.name for column in columns] if required is None else required
+    self.unique: list[str] | None = unique
+    self.description: str = description
+
+  @property
+  def column_names(self) -> list[str]:
+    return [column.name for column in self.columns]
+
+  def schema(self, frame: pl.DataFrame | pl.LazyFrame) -> pl.Schema:
+    """Schema de saída do template aplicado a frame (sem executar o plano)."""
+    return self.compile(frame).collect_schema()
+
+  def compile(self, frame: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Plano lazy do template: seleção e formatação das colunas, descarte de
+    linhas com colunas obrigatórias nulas e deduplicação.
+    """
+    plan = frame.lazy().select([column.compile() for column in self.columns])
+    if self.required:
+      plan = plan.drop_nulls(self.required)
+    if self.unique:
+      plan = plan.unique(subset=self.unique, keep="first", maintain_order=True)
+    return plan
+
+
+# Tipos de disparo disponíveis na página de enriquecimento
+templates: dict[str, EnrichmentTemplate] = {
+  template.name: template
+  for template in [
+    EnrichmentTemplate(
+      "hsm",
+      [Column("CNPJ", document()), Column("E-mail", email())],
+      unique=["E-mail"],
+      description="Um e-mail válido por linha, em minúsculas",
+    ),
+    EnrichmentTemplate(
+      "sms",
+      [Column("CNPJ", document()), Column("Telefone", phone())],
+      unique=["Telefone"],
+      description="Um telefone por linha, com DDI 55",
+    ),
+    EnrichmentTemplate(
+      "asc",
+      [Column("CNPJ", document()), Column("Telefone", phone())],
+      unique=["CNPJ", "Telefone"],
+      description="Telefones por CNPJ, com DDI 55",
+    ),
+  ]
+}
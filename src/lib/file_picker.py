@@ -1,29 +1,98 @@
-from engine import BaseRouteProps, Table, join, get_downloads_path
+from engine import BaseRouteProps, executor, CancellationToken, IngestProgress, scan_file, schedule_update, batch
 import flet as ft
+from functools import partial
 from pathlib import Path
-from src.components.dataframe_table import dataframe_table
-import polars as pl 
+from typing import Callable
+import polars as pl
+import shutil
+import tempfile
+import weakref
 
 
-class FilePicker: 
+class FilePicker:
+  """
+  Seleção e leitura do arquivo de entrada.
+  O arquivo é lido em segundo plano em lotes gravados em disco e exposto como
+  LazyFrame, com o progresso exibido em message/progress.
+  """
   def __init__(self, route_props: BaseRouteProps):
     self.children: ft.Column = ft.Column()
     self.files: list[Path] = []
-    self.dataframe: pl.DataFrame = pl.DataFrame()
+    self.lazyframe: pl.LazyFrame | None = None
     self.message:ft.Text = ft.Text()
+    self.progress: ft.ProgressBar = ft.ProgressBar(value=0, visible=False)
     self.route_props:BaseRouteProps = route_props
+    # leitura em andamento e diretório com os lotes do arquivo lido
+    self.token: CancellationToken | None = None
+    self.spill_dir: Path | None = None
+    # remove spill_dir quando o FilePicker é coletado (página descartada ou
+    # sessão encerrada) ou na saída do processo
+    self._cleanup: weakref.finalize | None = None
 
-  def pick_files_result(self, e: ft.FilePickerResultEvent):
+  @property
+  def columns(self) -> list[str]:
+    return self.lazyframe.collect_schema().names() if self.lazyframe is not None else []
+
+  def pick_files_result(self, e: ft.FilePickerResultEvent, on_loaded: Callable[[pl.LazyFrame], None] | None = None):
+    """
+    Inicia a leitura do arquivo escolhido; on_loaded recebe o LazyFrame
+    (na thread de trabalho) quando a leitura termina.
+    """
+    if self.token:
+      self.token.cancel()
     self.files.clear()
-    self.dataframe.clear()
+    self.lazyframe = None
     self.children.controls.clear()
     self.message.clean()
-    self.files.extend([Path(file.path).absolute() for file in e.files if file.path.endswith((".csv", ".xlsx", ".xls"))])
-    
-    self.dataframe = pl.read_csv(self.files[0], truncate_ragged_lines=True,infer_schema_length=1000) if self.files[0].name.endswith(".csv") else pl.read_excel(self.files[0])
-    
-    self.message.value = (
-      ", ".join(map(lambda f: f.stem, self.files)) if self.files else "Cancelled!"
+    self.files.extend([Path(file.path).absolute() for file in e.files or [] if file.path.endswith((".csv", ".xlsx", ".xls"))])
+
+    if not self.files:
+      self.message.value = "Cancelled!"
+      schedule_update(self.message, self.children)
+      return
+
+    if self._cleanup:
+      self._cleanup()
+    self.spill_dir = Path(tempfile.mkdtemp(prefix="ingest-"))
+    self._cleanup = weakref.finalize(self, shutil.rmtree, self.spill_dir, ignore_errors=True)
+    token = self.token = CancellationToken()
+
+    self.progress.value = 0
+    self.progress.visible = True
+    self.message.value = f"Lendo {self.files[0].name}..."
+    schedule_update(self.message, self.progress, self.children)
+
+    # token=token do submit fica com o executor: scan_file recebe o seu via partial
+    executor.submit(
+      partial(scan_file, self.files[0], self.spill_dir, on_progress=lambda progress: self.on_progress(token, progress), token=token),
+      on_done=lambda frame: self.on_loaded(token, frame, on_loaded),
+      on_error=lambda error: self.on_error(token, error),
+      token=token,
     )
-    self.message.update()
-    self.children.update()
\ No newline at end of file
+
+  def on_progress(self, token: CancellationToken, progress: IngestProgress):
+    # leitura substituída por outra: não sobrescreve a mensagem atual
+    if token.cancelled:
+      return
+    self.progress.value = progress.fraction
+    self.message.value = progress.describe()
+    schedule_update(self.progress, self.message)
+
+  def on_loaded(self, token: CancellationToken, frame: pl.LazyFrame, on_loaded: Callable[[pl.LazyFrame], None] | None):
+    if token.cancelled:
+      return
+    self.lazyframe = frame
+    # fim da leitura e reação de on_loaded seguem em um único envio
+    with batch(self.route_props.ctx):
+      self.progress.visible = False
+      self.message.value = ", ".join(map(lambda f: f.stem, self.files))
+      schedule_update(self.progress, self.message)
+      if on_loaded:
+        on_loaded(frame)
+
+  def on_error(self, token: CancellationToken, error: Exception):
+    if token.cancelled:
+      return
+    self.progress.visible = False
+    self.message.value = f"Erro ao ler {self.files[0].name}: {error}"
+    schedule_update(self.progress, self.message)